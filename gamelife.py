@@ -0,0 +1,347 @@
+"""
+Game of Life - Mode sans interface (serveurs sans affichage)
+Lance une simulation avec le pool de threads de gamelife_core, sans Tkinter,
+sans délai entre les générations et sans historique, puis écrit l'état final
+(format RLE) et les statistiques de la simulation.
+
+Utilisation:
+    python -m gamelife run --size 2000 --gens 100000 --engine numpy --seed 42 --out final.rle
+    python -m gamelife run --size 5000 --gens 1000 --density 0.05
+    python -m gamelife run --size 500 --gens 1000 --rule highlife --stats stats.json
+    python -m gamelife run --size 1000 --gens 100000 --seed 7 --stop-on-cycle
+    python -m gamelife run --size 1000 --gens 5000 --seed 7 --census census.csv
+    python -m gamelife run --size 200 --gens 3000 --seed 7 --soup-size 16 --symmetry D8
+    python -m gamelife run --size 1024 --gens 100000 --engine hashlife --jump 6 --pattern gun.rle
+    python -m gamelife search --soups 100000 --workers 4 --checkpoint census.json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_rle as rle
+import gamelife_rules as rules
+import gamelife_search as search
+import theme_manager as tm
+
+# Intervalle par défaut entre deux lignes de progression (secondes)
+REPORT_INTERVAL = 5.0
+# Nombre d'objets les plus fréquents affichés après une recherche de soupes
+TOP_OBJECTS = 20
+
+def census_writer(f):
+    """
+    Crée un abonné de core.stats_listeners qui écrit le bilan de chaque
+    génération dans un fichier CSV (une ligne par génération).
+
+    Args:
+        f: Fichier texte ouvert en écriture
+
+    Returns:
+        function: Abonné appelé avec un GenerationStats
+    """
+    f.write("generation,population,births,deaths\n")
+    def write(stats):
+        f.write(f"{stats.generation},{stats.population},{stats.births},{stats.deaths}\n")
+    return write
+
+def run(size, gens, engine=core.AUTO, seed=None, rule=None, topology="plane",
+        workers=None, density=0.25, pattern=None, report=REPORT_INTERVAL, out=sys.stdout,
+        cycles=True, stop_on_cycle=False, census=None, soup_size=None, symmetry="C1", jump=0):
+    """
+    Simule gens générations sans délai et retourne les statistiques.
+
+    Args:
+        size (int): Taille de la grille (n x n cellules)
+        gens (int): Nombre de générations à calculer (0 : aucune, retour immédiat)
+        engine (str): Moteur de calcul ("threads", "numpy", ...) ou core.AUTO
+            (le moins coûteux pour la taille, la densité et la règle)
+        seed (int, optional): Graine du tirage aléatoire (None : graine tirée au
+            hasard, rendue dans les statistiques pour rejouer la simulation)
+        rule (str, optional): Règle (notation B/S, Larger than Life ou nom connu)
+        topology (str): Condition aux bords ("plane", "torus", "klein", "cross")
+        workers (int, optional): Nombre de threads du pool
+        density (float): Proportion de cellules vivantes du tirage aléatoire
+        pattern (str, optional): Fichier RLE chargé au centre de la grille (au lieu du tirage)
+        report (float): Intervalle entre deux lignes de progression (0 = aucune)
+        out: Flux des lignes de progression
+        cycles (bool): Détecte les cycles (état déjà rencontré)
+        stop_on_cycle (bool): Arrête la simulation dès qu'un cycle est détecté
+        census (str, optional): Fichier CSV du bilan de chaque génération
+            (population, naissances, morts)
+        soup_size (int, optional): Côté de la soupe tirée au centre d'une grille
+            vide (None : toute la grille)
+        symmetry (str): Symétrie de la soupe (voir engines.SYMMETRIES)
+        jump (int): Exposant du saut du moteur hashlife (au plus 2^jump générations
+            par étape, voir core.set_jump ; la détection des cycles est alors suspendue)
+
+    Returns:
+        dict: Statistiques (générations, durée, générations par seconde, population,
+            boîte englobante finale, cycle détecté, ...)
+
+    Raises:
+        ValueError: Si la règle, le motif, la soupe (taille, symétrie) ou le saut est invalide
+        MemoryError: Si la grille dépasse le budget mémoire
+        OSError: Si le fichier du bilan ne peut pas être créé
+    """
+    # Lit la règle et le motif avant de créer la grille (erreurs immédiates)
+    cells = None
+    if pattern is not None:
+        cells, pattern_rule = rle.load(pattern)
+        rule = rule or pattern_rule
+    if rule is not None:
+        rule = rules.compile_rule(rule)
+    if symmetry not in engines.SYMMETRIES:
+        raise ValueError(f"Symétrie inconnue : {symmetry} (attendu : {', '.join(engines.SYMMETRIES)})")
+    region = None
+    if cells is None and soup_size is not None:
+        if not 1 <= soup_size <= size:
+            raise ValueError(f"Taille de soupe invalide : {soup_size} (grille de {size} x {size})")
+        # Soupe carrée au centre de la grille
+        top = (size - soup_size) // 2 + 1
+        region = (top, top, top + soup_size, top + soup_size)
+
+    # Pas d'historique, d'instantanés ni de délai : toutes les générations s'enchaînent
+    core.keep_history = False
+    core.publish_snapshots = False
+    core.set_speed(0)
+    core.detect_cycles = cycles
+    core.stop_on_cycle = stop_on_cycle
+    core.track_population = True
+    # Densité du motif ou du tirage sur toute la grille : guide le choix automatique du moteur
+    if cells is not None:
+        fill = sum(row.count(1) for row in cells) / (size * size)
+    elif region is not None:
+        fill = density * soup_size * soup_size / (size * size)
+    else:
+        fill = density
+    # Règle connue avant le choix automatique du moteur (elle restreint les
+    # moteurs possibles) ; set_rule la vérifie ensuite pour le moteur retenu
+    if rule is not None:
+        core.rule = rule
+    # Choix automatique : moteurs mesurés (une fois par machine, fichier de
+    # calibration partagé avec l'interface) avant le choix
+    if engine == core.AUTO:
+        core.load_calibration(tm.CALIBRATION_FILE)
+        core.calibrate(tm.CALIBRATION_FILE)
+    core.start_workers(size, engine=engine, workers=workers, topology=topology, density=fill, jump=jump)
+    try:
+        if rule is not None:
+            core.set_rule(rule)
+    except ValueError:
+        core.stop_workers()
+        raise
+
+    # État initial : motif RLE centré, ou soupe reproductible (graine conservée)
+    soup = None
+    if cells is not None:
+        state = core.make_grid(size)
+        top = max(0, (size - len(cells)) // 2)
+        for i, row in enumerate(cells[:size]):
+            left = max(0, (size - len(row)) // 2)
+            state[top + i + 1][left + 1:left + 1 + min(len(row), size)] = row[:size]
+        core.load_grid(state)
+    else:
+        soup = core.randomize_grid(core.T, density, seed=seed, region=region, symmetry=symmetry)
+    initial = core.population
+
+    # Bilan de chaque génération, écrit par barrier_action au fil du calcul
+    census_file = None
+    if census is not None:
+        try:
+            census_file = open(census, "w")
+        except OSError:
+            core.stop_workers()
+            raise
+        writer = census_writer(census_file)
+        core.stats_listeners.append(writer)
+
+    # Lance la simulation ; barrier_action l'arrête à la génération demandée
+    # (ou sur un cycle) et date cet arrêt : la durée ne dépend pas du réveil
+    # de cette boucle, qui n'affiche que la progression
+    elapsed = 0.0
+    if gens > 0:
+        core.stop_at = gens
+        core.halted.clear()
+        start = time.perf_counter()
+        core.running.set()
+        try:
+            while not core.halted.wait(report or 1.0):
+                if report:
+                    now = time.perf_counter()
+                    rate = core.gen_counter / (now - start)
+                    print(f"génération {core.gen_counter:>10} : {rate:,.1f} gen/s "
+                          f"(actuellement {core.get_achieved_rate():,.1f})", file=out, flush=True)
+        except KeyboardInterrupt:
+            # Interruption (Ctrl+C) : l'état atteint est tout de même écrit
+            core.running.clear()
+        end = core.halt_time if core.halted.is_set() else time.perf_counter()
+        elapsed = end - start
+
+    # Attend la fin de la génération en cours avant de lire la grille
+    core.stop_workers()
+    if census_file is not None:
+        core.stats_listeners.remove(writer)
+        census_file.close()
+    generations = core.gen_counter
+    return {
+        "size": size,
+        "engine": core.engine_name,
+        "rule": core.rule.name,
+        "topology": core.topology_name,
+        "jump": core.jump,
+        "seed": soup.seed if soup is not None else None,
+        "density": soup.density if soup is not None else None,
+        "soup_region": soup.region if soup is not None else None,
+        "symmetry": soup.symmetry if soup is not None else None,
+        "generations": generations,
+        "seconds": elapsed,
+        "gens_per_sec": generations / elapsed if elapsed > 0 else 0.0,
+        "cells_per_sec": generations * size * size / elapsed if elapsed > 0 else 0.0,
+        "initial_population": initial,
+        "population": core.population,
+        "bounds": core.bbox,
+        "cycle_period": core.cycle[0] if core.cycle else None,
+        "cycle_start": core.cycle[1] if core.cycle else None,
+    }
+
+def save_state(path, stats):
+    """
+    Écrit la grille actuelle (intérieur n x n) dans un fichier RLE.
+
+    Args:
+        path (str): Chemin du fichier
+        stats (dict): Statistiques de la simulation (écrites en commentaire)
+    """
+    cells = core.grid_to_list(core.T)
+    comments = [
+        f"Génération {stats['generations']}, moteur {stats['engine']}, graine {stats['seed']}",
+        f"Population {stats['population']}, bords {stats['topology']}",
+    ]
+    if stats["seed"] is not None:
+        comments.append(f"Soupe : densité {stats['density']}, région {stats['soup_region'] or 'grille'}, "
+                        f"symétrie {stats['symmetry']}")
+    rle.save(path, [row[1:-1] for row in cells[1:-1]], core.rule.name, core.rule.states, comments)
+
+def search_main(args):
+    """
+    Lance une recherche de soupes (sous-commande search) et affiche son recensement.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande
+
+    Returns:
+        int: Code de retour du processus
+    """
+    try:
+        progress = search.search(args.soups, first_seed=args.seed, rule=args.rule, workers=args.workers,
+                                 soup=args.soup_size, size=args.size, density=args.density,
+                                 symmetry=args.symmetry, checkpoint=args.checkpoint, report=args.report)
+    except (ValueError, OSError) as error:
+        print(f"Erreur : {error}", file=sys.stderr)
+        return 1
+
+    # Résumé, puis les objets les plus fréquents avec la graine d'une soupe qui les contient
+    census = progress["census"]
+    seconds = progress["seconds"]
+    rate = census["soups"] / seconds if seconds else 0.0
+    print(f"{census['soups']:,} soupes en {seconds:.2f} s : {rate:,.1f} soupes/s, "
+          f"{sum(census['objects'].values()):,} objets, {census['escapes']:,} débris en bordure")
+    if census["pathological"]:
+        print(f"Soupes non stabilisées : {', '.join(map(str, census['pathological']))}")
+    ranked = sorted(census["objects"].items(), key=lambda item: (-item[1], item[0]))
+    for code, count in ranked[:args.top]:
+        print(f"{count:>12,}  {code}  (graine {census['samples'][code]})")
+    return 0
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande.
+
+    Args:
+        argv (list, optional): Arguments (par défaut : sys.argv[1:])
+
+    Returns:
+        int: Code de retour du processus
+    """
+    parser = argparse.ArgumentParser(prog="python -m gamelife", description="Game of Life sans interface")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="simule sans affichage et sans délai")
+    run_parser.add_argument("--size", type=int, default=core.DEFAULT_N, help="taille de la grille (n x n)")
+    run_parser.add_argument("--gens", type=int, required=True, help="nombre de générations")
+    run_parser.add_argument("--engine", default=core.AUTO,
+                            choices=[core.AUTO, "threads"] + sorted(engines.ENGINES),
+                            help="moteur de calcul (auto : le moins coûteux, calibré au premier lancement)")
+    run_parser.add_argument("--seed", type=int, help="graine du tirage aléatoire")
+    run_parser.add_argument("--density", type=float, default=0.25, help="proportion de cellules vivantes")
+    run_parser.add_argument("--soup-size", type=int, help="côté de la soupe tirée au centre (défaut : toute la grille)")
+    run_parser.add_argument("--symmetry", default="C1", choices=list(engines.SYMMETRIES),
+                            help="symétrie de la soupe")
+    run_parser.add_argument("--rule", help="règle (B3/S23, highlife, B2/S/C3, R5,C0,M1,S34..58,B34..45,NM)")
+    run_parser.add_argument("--topology", default="plane", choices=list(engines.TOPOLOGIES),
+                            help="condition aux bords")
+    run_parser.add_argument("--workers", type=int, help="nombre de threads du pool")
+    run_parser.add_argument("--jump", type=int, default=0,
+                            help=f"moteur hashlife : au plus 2^jump générations par étape (0 à {core.MAX_JUMP})")
+    run_parser.add_argument("--pattern", help="motif RLE initial (centré) au lieu du tirage aléatoire")
+    run_parser.add_argument("--out", help="fichier RLE de l'état final")
+    run_parser.add_argument("--stats", help="fichier JSON des statistiques")
+    run_parser.add_argument("--report", type=float, default=REPORT_INTERVAL,
+                            help="secondes entre deux lignes de progression (0 = aucune)")
+    run_parser.add_argument("--no-cycles", action="store_true",
+                            help="ne cherche pas les cycles (état déjà rencontré)")
+    run_parser.add_argument("--stop-on-cycle", action="store_true",
+                            help="s'arrête dès que la grille répète un état")
+    run_parser.add_argument("--census", help="fichier CSV : population, naissances et morts par génération")
+
+    search_parser = commands.add_parser("search", help="recense les cendres de soupes numérotées")
+    search_parser.add_argument("--soups", type=int, required=True, help="nombre de soupes")
+    search_parser.add_argument("--seed", type=int, default=0, help="graine de la première soupe")
+    search_parser.add_argument("--workers", type=int, help="nombre de processus (défaut : un par cœur)")
+    search_parser.add_argument("--rule", default="B3/S23", help="règle à deux états et de rayon 1")
+    search_parser.add_argument("--soup-size", type=int, default=search.SOUP_SIZE, help="côté des soupes")
+    search_parser.add_argument("--size", type=int, default=search.GRID_SIZE, help="côté des grilles")
+    search_parser.add_argument("--density", type=float, default=search.DENSITY,
+                               help="proportion de cellules vivantes des soupes")
+    search_parser.add_argument("--symmetry", default="C1", choices=list(engines.SYMMETRIES),
+                               help="symétrie des soupes")
+    search_parser.add_argument("--checkpoint", help="fichier JSON de l'avancement (reprise après interruption)")
+    search_parser.add_argument("--report", type=float, default=REPORT_INTERVAL,
+                               help="secondes entre deux lignes de progression (0 = aucune)")
+    search_parser.add_argument("--top", type=int, default=TOP_OBJECTS, help="nombre d'objets affichés")
+    args = parser.parse_args(argv)
+
+    if args.command == "search":
+        return search_main(args)
+
+    try:
+        stats = run(args.size, args.gens, engine=args.engine, seed=args.seed, rule=args.rule,
+                    topology=args.topology, workers=args.workers, density=args.density,
+                    pattern=args.pattern, report=args.report,
+                    cycles=not args.no_cycles, stop_on_cycle=args.stop_on_cycle,
+                    census=args.census, soup_size=args.soup_size, symmetry=args.symmetry,
+                    jump=args.jump)
+    except (ValueError, MemoryError, OSError) as error:
+        print(f"Erreur : {error}", file=sys.stderr)
+        return 1
+
+    # Résumé, état final et statistiques
+    print(f"{stats['generations']} générations en {stats['seconds']:.2f} s : "
+          f"{stats['gens_per_sec']:,.1f} gen/s ({stats['cells_per_sec']:,.0f} cellules/s)")
+    print(f"Moteur {stats['engine']}, règle {stats['rule']}, graine {stats['seed']}, population "
+          f"{stats['initial_population']} -> {stats['population']}")
+    if stats["cycle_period"] is not None:
+        print(f"Cycle de période {stats['cycle_period']} depuis la génération {stats['cycle_start']}")
+    if args.out:
+        save_state(args.out, stats)
+    if args.stats:
+        with open(args.stats, "w") as f:
+            json.dump(stats, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Game of Life - Mesures de performance des moteurs
+Compare le débit (cellules calculées par seconde) des moteurs de gamelife_core,
+puis vérifie que le coût des règles Larger than Life ne dépend pas du rayon.
+
+Utilisation:
+    python gamelife_bench.py
+"""
+
+import time
+
+import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_ensemble as ensemble
+import gamelife_rules as rules
+
+def measure_engine(engine, size, duration=2.0):
+    """
+    Mesure le débit d'un moteur en faisant tourner la simulation sans délai.
+    Passe par start_workers et barrier_action, comme l'interface graphique.
+
+    Args:
+        engine (str): Nom du moteur ("threads", "numpy", ...)
+        size (int): Taille de la grille (n x n cellules)
+        duration (float): Durée de la mesure en secondes
+
+    Returns:
+        tuple: (générations par seconde, cellules calculées par seconde)
+    """
+    # Vitesse 0 : barrier_action n'applique aucun délai
+    core.set_speed(0)
+    core.start_workers(size, engine=engine)
+    core.randomize_grid(core.T)
+
+    # Lance la simulation pendant la durée demandée
+    start = time.perf_counter()
+    core.running.set()
+    time.sleep(duration)
+    core.running.clear()
+    elapsed = time.perf_counter() - start
+    gens = core.gen_counter
+
+    # Arrête les threads avant la mesure suivante
+    core.stop_workers()
+
+    gens_per_sec = gens / elapsed
+    return gens_per_sec, gens_per_sec * size * size
+
+def measure_radius(size, radius, generations=20):
+    """
+    Mesure le temps d'une génération Larger than Life de rayon radius
+    (noyau NumPy seul, table de sommes cumulées).
+
+    Args:
+        size (int): Taille de la grille (n x n cellules)
+        radius (int): Rayon du voisinage
+        generations (int): Nombre de générations mesurées
+
+    Returns:
+        float: Millisecondes par génération
+    """
+    engine = engines.NumpyEngine()
+    # Intervalles proportionnels à la taille du voisinage (le coût n'en dépend pas)
+    cells = (2 * radius + 1) ** 2
+    engine.set_rule(rules.RangeRule(radius, (cells // 4, cells // 3), (cells // 4, cells // 2), middle=True))
+    src, dst = engine.make_grid(size), engine.make_grid(size)
+    engine.randomize(src, 0.5)
+
+    start = time.perf_counter()
+    for _ in range(generations):
+        engine.step(src, dst)
+        src, dst = dst, src
+    return (time.perf_counter() - start) * 1000 / generations
+
+def measure_soups(size, soup, count, batched):
+    """
+    Mesure le débit de soupes menées jusqu'à leur stabilisation : toutes
+    ensemble dans un lot (gamelife_ensemble), ou une simulation par soupe.
+
+    Args:
+        size (int): Taille des grilles (n x n cellules)
+        soup (int): Côté de la soupe tirée au centre
+        count (int): Nombre de soupes
+        batched (bool): True pour un lot, False pour start_workers par soupe
+
+    Returns:
+        float: Soupes par seconde
+    """
+    top = (size - soup) // 2 + 1
+    region = (top, top, top + soup, top + soup)
+    start = time.perf_counter()
+    if batched:
+        batch = ensemble.BitPackedEnsemble(size, max_generations=4000)
+        batch.add_soups(range(count), 0.5, region)
+        batch.run()
+    else:
+        sim = core.Simulation()
+        sim.keep_history = False
+        sim.publish_snapshots = False
+        sim.stop_on_cycle = True
+        sim.set_speed(0)
+        for seed in range(count):
+            sim.start_workers(size, engine="bitpacked")
+            sim.randomize_grid(sim.T, 0.5, seed=seed, region=region)
+            sim.stop_at = 4000
+            sim.running.set()
+            while sim.running.is_set():
+                time.sleep(0.001)
+            sim.stop_workers()
+    return count / (time.perf_counter() - start)
+
+def main():
+    """
+    Compare le moteur "threads" (petite grille) aux moteurs vectorisés (1000 x 1000).
+    Le mode "threads" calcule en Python pur : il est mesuré sur une petite grille
+    et la comparaison se fait donc en cellules calculées par seconde.
+    """
+    _, threads_rate = measure_engine("threads", 30)
+    print(f"threads  30x30     : {threads_rate:>14,.0f} cellules/s")
+
+    gens, numpy_rate = measure_engine("numpy", 1000)
+    print(f"numpy    1000x1000 : {numpy_rate:>14,.0f} cellules/s ({gens:.1f} gen/s)")
+
+    print(f"Accélération       : x{numpy_rate / threads_rate:.0f}")
+
+    # Moteur bit-packed comparé au moteur NumPy (un octet par cellule)
+    gens, packed_rate = measure_engine("bitpacked", 1000)
+    print(f"bitpacked 1000x1000: {packed_rate:>14,.0f} cellules/s ({gens:.1f} gen/s)")
+    print(f"bitpacked / numpy  : x{packed_rate / numpy_rate:.1f}")
+
+    # Moteur multiprocessus (le gain dépend du nombre de cœurs physiques)
+    gens, processes_rate = measure_engine("processes", 3000)
+    _, numpy_large_rate = measure_engine("numpy", 3000)
+    print(f"processes 3000x3000: {processes_rate:>14,.0f} cellules/s ({gens:.1f} gen/s)")
+    print(f"processes / numpy  : x{processes_rate / numpy_large_rate:.1f}")
+
+    # Larger than Life : le coût par génération ne dépend pas du rayon
+    base = measure_radius(1000, 1)
+    for radius in (1, 2, 3, 5, 7, 10):
+        elapsed = measure_radius(1000, radius)
+        print(f"LtL R={radius:<2} 1000x1000 : {elapsed:>8.1f} ms/gen (x{elapsed / base:.2f} par rapport à R=1)")
+
+    # Soupes 16 x 16 jusqu'à stabilisation : un lot contre une simulation par soupe
+    single = measure_soups(62, 16, 20, False)
+    batched = measure_soups(62, 16, 1000, True)
+    print(f"soupes 16x16 (62x62): {batched:>8,.0f} soupes/s en lot, {single:,.1f} par simulation "
+          f"(x{batched / single:.0f})")
+
+    # Choix automatique du moteur selon les modèles de coût calibrés (core.choose_engine)
+    core.calibrate()
+    for size in (50, 500, 5000):
+        for density in (0.25, 0.01):
+            print(f"auto {size}x{size}, densité {density:<4} : {core.choose_engine(size, density)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,601 @@
+"""
+Game of Life - Univers infini en tuiles
+Remplace la grille bornée (les cellules qui sortent de la bordure meurent)
+par un plan infini découpé en tuiles de CHUNK_SIZE x CHUNK_SIZE cellules :
+- Chaque tuile est bit-packed : CHUNK_SIZE mots uint64 (bit j = colonne j)
+- Les tuiles sont rangées dans un dictionnaire indexé par (ligne, colonne) de tuile
+- Une tuile est créée quand l'activité l'atteint et supprimée quand elle se vide :
+  la mémoire reste proportionnelle à la zone vivante
+- Toutes les tuiles d'une génération sont calculées ensemble (NumPy)
+
+La fenêtre affichée (n x n cellules) est une vue sur l'univers : l'interface
+la lit avec viewport() et la déplace avec ChunkEngine.pan().
+"""
+
+import gamelife_engines as engines
+import gamelife_rules as rules
+
+np = engines.np
+
+CHUNK_SIZE = 64  # Côté d'une tuile (une ligne de tuile = un mot de 64 bits)
+CHUNK_SHIFT = 6  # log2(CHUNK_SIZE) : (i >> CHUNK_SHIFT) donne la tuile de la ligne i
+CHUNK_MASK = CHUNK_SIZE - 1  # (i & CHUNK_MASK) donne la ligne dans la tuile
+
+# Décalages (ligne, colonne) des 8 tuiles voisines
+NEIGHBOURS = {
+    "n": (-1, 0), "s": (1, 0), "w": (0, -1), "e": (0, 1),
+    "nw": (-1, -1), "ne": (-1, 1), "sw": (1, -1), "se": (1, 1),
+}
+
+class ChunkUniverse:
+    """
+    Plan infini de cellules stocké par tuiles bit-packed.
+    Les coordonnées (i, j) sont des entiers quelconques (négatifs compris).
+    """
+
+    def __init__(self, size):
+        """
+        Crée un univers vide.
+
+        Args:
+            size (int): Taille de la fenêtre affichée (n x n cellules)
+        """
+        self.size = size  # Taille de la fenêtre affichée
+        self.chunks = {}  # {(ligne de tuile, colonne de tuile): mots uint64}
+
+    def __len__(self):
+        """
+        Nombre de lignes de la fenêtre bordée (même convention que make_grid).
+
+        Returns:
+            int: size + 2
+        """
+        return self.size + 2
+
+    def copy(self):
+        """
+        Copie l'univers (utilisé par copy_grid pour l'historique).
+
+        Returns:
+            ChunkUniverse: Copie indépendante
+        """
+        clone = ChunkUniverse(self.size)
+        clone.chunks = {key: words.copy() for key, words in self.chunks.items()}
+        return clone
+
+    def get(self, i, j):
+        """
+        Retourne l'état d'une cellule.
+
+        Args:
+            i (int): Ligne de la cellule
+            j (int): Colonne de la cellule
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 sinon
+        """
+        words = self.chunks.get((i >> CHUNK_SHIFT, j >> CHUNK_SHIFT))
+        if words is None:
+            return 0
+        return int(words[i & CHUNK_MASK] >> np.uint64(j & CHUNK_MASK)) & 1
+
+    def set(self, i, j, value):
+        """
+        Modifie l'état d'une cellule (crée ou supprime la tuile si nécessaire).
+
+        Args:
+            i (int): Ligne de la cellule
+            j (int): Colonne de la cellule
+            value (int): Nouvel état (0 ou 1)
+        """
+        key = (i >> CHUNK_SHIFT, j >> CHUNK_SHIFT)
+        words = self.chunks.get(key)
+        if words is None:
+            if not value:
+                return
+            words = self.chunks[key] = np.zeros(CHUNK_SIZE, dtype=np.uint64)
+
+        # Modifie uniquement le bit de la cellule
+        word = int(words[i & CHUNK_MASK])
+        bit = 1 << (j & CHUNK_MASK)
+        words[i & CHUNK_MASK] = (word | bit) if value else (word & ~bit)
+
+        # Une tuile vide est libérée
+        if not value and not words.any():
+            del self.chunks[key]
+
+    def population(self):
+        """
+        Compte les cellules vivantes de tout l'univers.
+
+        Returns:
+            int: Nombre de cellules vivantes
+        """
+        if not self.chunks:
+            return 0
+        words = np.stack(list(self.chunks.values()))
+        return int(np.unpackbits(words.view(np.uint8)).sum())
+
+    def bounds(self):
+        """
+        Plus petit rectangle contenant toutes les cellules vivantes (pour
+        recadrer la vue) : lignes non nulles de chaque tuile et OU de ses lignes.
+
+        Returns:
+            tuple: (haut, gauche, bas, droite) en cellules, bornes exclues
+                pour bas et droite, ou None si l'univers est vide
+        """
+        if not self.chunks:
+            return None
+        keys = np.array(list(self.chunks), dtype=np.int64) << CHUNK_SHIFT
+        words = np.stack(list(self.chunks.values()))
+        # Première et dernière ligne occupée de chaque tuile
+        rows = words != 0
+        first_row = rows.argmax(axis=1)
+        last_row = CHUNK_MASK - rows[:, ::-1].argmax(axis=1)
+        # Première et dernière colonne occupée : bits du OU des lignes de la tuile
+        merged = np.bitwise_or.reduce(words, axis=1)
+        bits = np.unpackbits(merged.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+        first_col = bits.argmax(axis=1)
+        last_col = CHUNK_MASK - bits[:, ::-1].argmax(axis=1)
+        return (int((keys[:, 0] + first_row).min()), int((keys[:, 1] + first_col).min()),
+                int((keys[:, 0] + last_row).max()) + 1, int((keys[:, 1] + last_col).max()) + 1)
+
+    def viewport(self, top, left, height, width):
+        """
+        Extrait une fenêtre rectangulaire de l'univers.
+        Seules les tuiles visibles sont décompressées.
+
+        Args:
+            top (int): Première ligne de la fenêtre
+            left (int): Première colonne de la fenêtre
+            height (int): Nombre de lignes
+            width (int): Nombre de colonnes
+
+        Returns:
+            numpy.ndarray: Tableau uint8 (height x width) de 0 et de 1
+        """
+        cells = np.zeros((height, width), dtype=np.uint8)
+        for (ci, cj), (r0, r1, c0, c1) in self._overlap(top, left, height, width):
+            words = self.chunks.get((ci, cj))
+            if words is None:
+                continue
+            # Décompresse la tuile puis copie la partie visible
+            tile = engines._unpack(words[:, None], CHUNK_SIZE)
+            cells[r0 - top:r1 - top, c0 - left:c1 - left] = tile[
+                r0 - ci * CHUNK_SIZE:r1 - ci * CHUNK_SIZE,
+                c0 - cj * CHUNK_SIZE:c1 - cj * CHUNK_SIZE,
+            ]
+        return cells
+
+    def paint(self, top, left, cells):
+        """
+        Écrit un rectangle de cellules dans l'univers (les tuiles vides sont libérées).
+
+        Args:
+            top (int): Ligne du coin supérieur gauche
+            left (int): Colonne du coin supérieur gauche
+            cells (numpy.ndarray): Tableau 2D de 0 et de 1
+        """
+        height, width = cells.shape
+        for (ci, cj), (r0, r1, c0, c1) in self._overlap(top, left, height, width):
+            # Décompresse la tuile existante (ou vide), remplace la zone, recompresse
+            words = self.chunks.get((ci, cj))
+            if words is None:
+                tile = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+            else:
+                tile = engines._unpack(words[:, None], CHUNK_SIZE)
+            tile[r0 - ci * CHUNK_SIZE:r1 - ci * CHUNK_SIZE,
+                 c0 - cj * CHUNK_SIZE:c1 - cj * CHUNK_SIZE] = cells[r0 - top:r1 - top,
+                                                                    c0 - left:c1 - left]
+            words = engines._pack(tile, 1)[:, 0]
+            if words.any():
+                self.chunks[(ci, cj)] = words
+            else:
+                self.chunks.pop((ci, cj), None)
+
+    def _overlap(self, top, left, height, width):
+        """
+        Énumère les tuiles qui recouvrent un rectangle.
+
+        Args:
+            top, left (int): Coin supérieur gauche du rectangle
+            height, width (int): Dimensions du rectangle
+
+        Returns:
+            list: [((ligne de tuile, colonne de tuile), (r0, r1, c0, c1))] où
+                r0:r1 et c0:c1 sont les cellules communes (coordonnées de l'univers)
+        """
+        parts = []
+        for ci in range(top >> CHUNK_SHIFT, ((top + height - 1) >> CHUNK_SHIFT) + 1):
+            r0 = max(top, ci * CHUNK_SIZE)
+            r1 = min(top + height, (ci + 1) * CHUNK_SIZE)
+            for cj in range(left >> CHUNK_SHIFT, ((left + width - 1) >> CHUNK_SHIFT) + 1):
+                c0 = max(left, cj * CHUNK_SIZE)
+                c1 = min(left + width, (cj + 1) * CHUNK_SIZE)
+                parts.append(((ci, cj), (r0, r1, c0, c1)))
+        return parts
+
+def _candidates(chunks):
+    """
+    Tuiles à calculer : les tuiles vivantes, plus les tuiles voisines dont le
+    bord commun contient une cellule vivante (l'activité peut les atteindre).
+
+    Args:
+        chunks (dict): Tuiles de la génération actuelle
+
+    Returns:
+        list: Clés (ligne de tuile, colonne de tuile) à calculer
+    """
+    keys = set(chunks)
+    for (ci, cj), words in chunks.items():
+        first = int(words[0])
+        last = int(words[-1])
+        column0 = bool((words & np.uint64(1)).any())
+        column63 = bool((words >> np.uint64(CHUNK_SIZE - 1)).any())
+        # Bords (lignes et colonnes extrêmes) puis coins
+        edges = {
+            "n": first, "s": last, "w": column0, "e": column63,
+            "nw": first & 1, "ne": first >> (CHUNK_SIZE - 1),
+            "sw": last & 1, "se": last >> (CHUNK_SIZE - 1),
+        }
+        for direction, alive in edges.items():
+            if alive:
+                di, dj = NEIGHBOURS[direction]
+                keys.add((ci + di, cj + dj))
+    return list(keys)
+
+def step_chunks(chunks, terms=engines.CONWAY_TERMS):
+    """
+    Calcule la génération suivante de toutes les tuiles en une fois.
+    Chaque tuile est bordée par une ligne de ses voisines nord et sud et par
+    un bit de ses voisines ouest et est, puis la règle est appliquée aux
+    tuiles empilées (une colonne de mots par tuile).
+
+    Args:
+        chunks (dict): Tuiles de la génération actuelle
+        terms (tuple): Termes de la règle (voir gamelife_engines.rule_terms)
+
+    Returns:
+        dict: Tuiles non vides de la génération suivante
+    """
+    if not chunks:
+        return {}
+
+    keys = _candidates(chunks)
+    count = len(keys)
+
+    # Tuiles empilées ; la dernière entrée (indice count) est une tuile vide
+    stack = np.zeros((count + 1, CHUNK_SIZE), dtype=np.uint64)
+    index = {}
+    for k, key in enumerate(keys):
+        index[key] = k
+        words = chunks.get(key)
+        if words is not None:
+            stack[k] = words
+
+    # Indice de chaque voisine (tuile vide si elle n'existe pas)
+    around = {
+        direction: np.array([index.get((ci + di, cj + dj), count) for ci, cj in keys])
+        for direction, (di, dj) in NEIGHBOURS.items()
+    }
+
+    # Lignes de chaque tuile bordées par les voisines nord et sud : (66, tuiles)
+    rows = np.empty((CHUNK_SIZE + 2, count), dtype=np.uint64)
+    rows[0] = stack[around["n"], -1]
+    rows[1:-1] = stack[:count].T
+    rows[-1] = stack[around["s"], 0]
+
+    # Bits entrant par l'ouest (bit 63 de la voisine) et par l'est (bit 0)
+    high = np.uint64(CHUNK_SIZE - 1)
+    one = np.uint64(1)
+    left = np.empty_like(rows)
+    left[0] = stack[around["nw"], -1] >> high
+    left[1:-1] = stack[around["w"]].T >> high
+    left[-1] = stack[around["sw"], 0] >> high
+    right = np.empty_like(rows)
+    right[0] = stack[around["ne"], -1] & one
+    right[1:-1] = stack[around["e"]].T & one
+    right[-1] = stack[around["se"], 0] & one
+
+    # Voisins ouest (colonne j-1 sur le bit j) et est (colonne j+1 sur le bit j)
+    west = (rows << one) | left
+    east = (rows >> one) | (right << high)
+
+    # Règle, puis suppression des tuiles devenues vides
+    following = engines._life_words(rows, west, east, terms).T
+    alive = np.flatnonzero(following.any(axis=1))
+    return {keys[k]: following[k].copy() for k in alive}
+
+class ChunkEngine:
+    """
+    Moteur "infinite" : plan infini en tuiles bit-packed (ChunkUniverse).
+    Les accesseurs (get_cell, set_cell, to_list, ...) travaillent sur la fenêtre
+    affichée (lignes et colonnes 1 à n), placée dans l'univers par (top, left).
+    """
+
+    name = "infinite"  # Nom du moteur (utilisé par start_workers)
+    requires_numpy = True  # Le moteur nécessite NumPy
+    changed = None  # Cellules modifiées par la dernière génération (None = non suivi)
+    generations_per_step = 1  # Générations calculées par appel à step
+    jumps = False  # Nombre de générations par étape fixe (voir HashLifeEngine.set_jump)
+    tallies = False  # census compte les cellules modifiées données par diff (voir NumpyEngine.set_tally)
+    splittable = False  # Toutes les tuiles sont calculées ensemble par un seul thread
+    unbounded = True  # Les cellules peuvent sortir de la fenêtre sans mourir
+    topologies = ("plane",)  # Plan infini : aucune bordure à recoller
+    supports_b0 = False  # Avec B0, tout le plan infini naîtrait à chaque génération
+    multistate = False  # Tuiles bit-packed : deux états seulement
+    max_radius = 1  # Voisinage 3x3 uniquement (bordure d'une cellule par tuile)
+    clips = False  # Seules les tuiles occupées et leurs voisines sont calculées
+
+    def __init__(self):
+        """
+        Initialise le moteur avec la fenêtre placée à l'origine de l'univers.
+        """
+        self.size = 0  # Taille de la fenêtre affichée
+        self.top = 0  # Ligne de l'univers affichée en ligne 1
+        self.left = 0  # Colonne de l'univers affichée en colonne 1
+        self.set_rule(rules.CONWAY)
+
+    def set_rule(self, rule):
+        """
+        Change la règle appliquée aux générations suivantes.
+
+        Args:
+            rule (gamelife_rules.Rule): Règle compilée (sans naissance à 0 voisin)
+        """
+        self.rule = rule
+        self._terms = engines.rule_terms(rule)
+
+    def make_grid(self, size):
+        """
+        Crée un univers vide affiché dans une fenêtre size x size.
+
+        Args:
+            size (int): Taille de la fenêtre (n x n cellules)
+
+        Returns:
+            ChunkUniverse: Univers vide
+        """
+        self.size = size
+        return ChunkUniverse(size)
+
+    def grid_bytes(self, size):
+        """
+        Estime la mémoire d'un univers dont la fenêtre est entièrement vivante
+        (la mémoire réelle suit la zone vivante).
+
+        Args:
+            size (int): Taille de la fenêtre (n x n cellules)
+
+        Returns:
+            int: Nombre d'octets
+        """
+        chunks = (size + CHUNK_SIZE - 1) // CHUNK_SIZE
+        return chunks * chunks * CHUNK_SIZE * 8
+
+    def step(self, src, dst):
+        """
+        Calcule la génération suivante de src dans dst.
+
+        Args:
+            src (ChunkUniverse): Univers actuel (T)
+            dst (ChunkUniverse): Univers suivant (Tnext), remplacé
+        """
+        dst.chunks = step_chunks(src.chunks, self._terms)
+
+    def pan(self, rows, cols):
+        """
+        Déplace la fenêtre affichée dans l'univers.
+
+        Args:
+            rows (int): Déplacement vertical (positif = vers le bas)
+            cols (int): Déplacement horizontal (positif = vers la droite)
+        """
+        self.top += rows
+        self.left += cols
+
+    def get_cell(self, grid, i, j):
+        """
+        Retourne l'état d'une cellule de la fenêtre.
+
+        Args:
+            grid (ChunkUniverse): Univers
+            i (int): Ligne dans la fenêtre (1 à n)
+            j (int): Colonne dans la fenêtre (1 à n)
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 sinon
+        """
+        return grid.get(self.top + i - 1, self.left + j - 1)
+
+    def set_cell(self, grid, i, j, value):
+        """
+        Modifie l'état d'une cellule de la fenêtre.
+
+        Args:
+            grid (ChunkUniverse): Univers
+            i (int): Ligne dans la fenêtre (1 à n)
+            j (int): Colonne dans la fenêtre (1 à n)
+            value (int): Nouvel état (0 ou 1)
+        """
+        grid.set(self.top + i - 1, self.left + j - 1, value)
+
+    def to_array(self, grid):
+        """
+        Retourne la fenêtre sous forme de tableau uint8 (n + 2) x (n + 2)
+        (la bordure reste à 0, comme make_grid).
+
+        Args:
+            grid (ChunkUniverse): Univers
+
+        Returns:
+            numpy.ndarray: Tableau d'octets (une cellule par octet)
+        """
+        cells = np.zeros((grid.size + 2, grid.size + 2), dtype=np.uint8)
+        cells[1:-1, 1:-1] = grid.viewport(self.top, self.left, grid.size, grid.size)
+        return cells
+
+    def to_list(self, grid):
+        """
+        Convertit la fenêtre en liste de listes (format de make_grid).
+        Les cellules hors de la fenêtre ne sont pas incluses.
+
+        Args:
+            grid (ChunkUniverse): Univers
+
+        Returns:
+            list: Fenêtre 2D sous forme de listes Python
+        """
+        return self.to_array(grid).tolist()
+
+    def load(self, grid, state):
+        """
+        Remplace le contenu de l'univers par un état sauvegardé : un univers
+        (copie de l'historique) ou une fenêtre bordée (liste de listes, tableau).
+
+        Args:
+            grid (ChunkUniverse): Univers, modifié sur place
+            state: État à restaurer
+        """
+        if isinstance(state, ChunkUniverse):
+            grid.chunks = {key: words.copy() for key, words in state.chunks.items()}
+            return
+
+        # Fenêtre bordée : seule la partie commune avec la fenêtre est copiée
+        cells = engines._live_cells(state)[1:grid.size + 1, 1:grid.size + 1]
+        grid.chunks = {}
+        grid.paint(self.top, self.left, cells)
+
+    def any(self, grid):
+        """
+        Indique si l'univers contient au moins une cellule vivante
+        (les tuiles vides sont toujours supprimées).
+
+        Args:
+            grid (ChunkUniverse): Univers
+
+        Returns:
+            bool: True si une cellule est vivante
+        """
+        return bool(grid.chunks)
+
+    def bounds(self, grid, region=None):
+        """
+        Boîte englobante des cellules vivantes de tout l'univers, en
+        coordonnées de la fenêtre (elle peut déborder de la fenêtre).
+
+        Args:
+            grid (ChunkUniverse): Univers
+            region (tuple, optional): Ignorée (les cellules ne sont pas bornées)
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), bornes bas et droite exclues,
+                ou None si l'univers est vide
+        """
+        box = grid.bounds()
+        if box is None:
+            return None
+        top, left, bottom, right = box
+        return (top - self.top + 1, left - self.left + 1,
+                bottom - self.top + 1, right - self.left + 1)
+
+    def diff(self, old, new, region=None):
+        """
+        Lignes de tuiles (mots de 64 cellules) qui diffèrent entre deux univers.
+
+        Args:
+            old (ChunkUniverse): Univers précédent (None = univers vide)
+            new (ChunkUniverse): Univers actuel
+            region (tuple, optional): Ignorée (seules les tuiles existantes sont comparées)
+
+        Returns:
+            tuple: (positions, valeurs avant, valeurs après), tableaux NumPy ;
+                la position code la tuile et la ligne dans la tuile
+        """
+        previous = old.chunks if old is not None else {}
+        keys = list(previous.keys() | new.chunks.keys())
+        if not keys:
+            empty = np.zeros(0, dtype=np.uint64)
+            return empty, empty, empty
+        blank = np.zeros(CHUNK_SIZE, dtype=np.uint64)
+        before = np.concatenate([previous.get(key, blank) for key in keys])
+        after = np.concatenate([new.chunks.get(key, blank) for key in keys])
+        lines = np.flatnonzero(before != after)
+        # Position : (ligne de tuile, colonne de tuile, ligne) sur 28 + 28 + 6 bits
+        tiles = np.array(keys, dtype=np.int64)[lines >> CHUNK_SHIFT] & ((1 << 28) - 1)
+        positions = (tiles[:, 0] << 34) | (tiles[:, 1] << CHUNK_SHIFT) | (lines & CHUNK_MASK)
+        return positions, before[lines], after[lines]
+
+    def count(self, grid):
+        """
+        Compte les cellules vivantes de tout l'univers.
+
+        Args:
+            grid (ChunkUniverse): Univers
+
+        Returns:
+            int: Nombre de cellules vivantes
+        """
+        return grid.population()
+
+    def census(self, old, new, changes):
+        """
+        Naissances et morts de tout l'univers, comptées sur les lignes de tuiles modifiées.
+
+        Args:
+            old (ChunkUniverse): Univers précédent
+            new (ChunkUniverse): Univers actuel
+            changes (tuple): Résultat de diff(old, new)
+
+        Returns:
+            tuple: (naissances, morts)
+        """
+        _, before, after = changes
+        return engines._popcount(after & ~before), engines._popcount(before & ~after)
+
+    def clear(self, grid):
+        """
+        Tue toutes les cellules de l'univers.
+
+        Args:
+            grid (ChunkUniverse): Univers, modifié sur place
+        """
+        grid.chunks = {}
+
+    def randomize(self, grid, density=0.25, seed=None, region=None, symmetry="C1"):
+        """
+        Remplit une région de la fenêtre d'une soupe aléatoire (voir
+        engines.random_soup) ; le reste de l'univers est vidé.
+
+        Args:
+            grid (ChunkUniverse): Univers, modifié sur place
+            density (float): Proportion de cellules vivantes
+            seed (int, optional): Graine de la soupe
+            region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+                en coordonnées de la fenêtre bordée (None : toute la fenêtre)
+            symmetry (str): Symétrie de la soupe (voir engines.SYMMETRIES)
+        """
+        top, left, bottom, right = region or (1, 1, grid.size + 1, grid.size + 1)
+        grid.chunks = {}
+        grid.paint(self.top + top - 1, self.left + left - 1,
+                   engines.random_soup(bottom - top, right - left, density, seed, symmetry))
+
+    def wrap(self, grid, topology):
+        """
+        Sans effet : l'univers n'a pas de bordure.
+
+        Args:
+            grid (ChunkUniverse): Univers
+            topology (str): Condition aux bords ("plane")
+        """
+        pass
+
+    def close(self):
+        """
+        Libère les ressources du moteur (appelé par stop_workers).
+        """
+        pass
+
+# Rend le moteur disponible pour start_workers
+engines.register_engine(ChunkEngine)
@@ -1,46 +1,120 @@
 """
 Game of Life - Core Logic (Threads & Barriers)
 Contient la logique principale du jeu demandée par le TP :
-- Gestion des threads (un thread par cellule)
+- Gestion des threads (pool de K threads, une bande de lignes par thread)
 - Barrière de synchronisation
-- Règles d'évolution de Conway
+- Règles d'évolution "Life-like" en notation B/S (Conway par défaut, voir gamelife_rules.py)
 - Grilles et calculs
+- Sélection du moteur de calcul (threads, vectorisé ou région active, voir gamelife_engines.py)
+- Accesseurs de la grille (get_cell, set_cell, load_grid) indépendants du stockage
+- Topologie de la grille (bordure morte, tore, bouteille de Klein, plan projectif)
+- Détection des cycles et natures mortes (hachage incrémental, voir gamelife_cycles.py)
+- Publication d'instantanés figés de chaque génération (lus sans verrou par
+  l'affichage et l'historique)
+- Population, naissances et morts tenues à jour à chaque génération (get_stats)
+- Boîte englobante des cellules tenue à jour : le calcul de la génération
+  suivante se limite à cette boîte élargie du rayon de la règle
+- Itération paresseuse des générations d'une grille sans threads ni état
+  global (iterate), pour une utilisation comme bibliothèque
+- Choix automatique du moteur le moins coûteux (choose_engine) selon des
+  modèles de coût calibrés par un micro-benchmark et gardés sur disque
+
+Tout l'état d'une simulation (grilles, moteur, règle, threads, événements,
+cadence, historique) appartient à un objet Simulation : plusieurs simulations
+indépendantes coexistent dans un même processus, chacune avec son pool de
+threads. Les fonctions et les variables du module (core.T, core.running,
+core.start_workers...) sont celles de la simulation par défaut (default).
 """
 
+import json
+import os
+import sys
 import threading
-import random
 import time
+import types
+from collections import deque, namedtuple
+
+import gamelife_cycles as cycles
+import gamelife_engines as engines
+import gamelife_rules as rules
+from gamelife_scheduler import FrameScheduler
+import gamelife_hashlife  # Enregistre le moteur "hashlife" auprès de gamelife_engines
+import gamelife_parallel  # Enregistre le moteur "processes" auprès de gamelife_engines
+import gamelife_chunks  # Enregistre le moteur "infinite" auprès de gamelife_engines
+
+# Génération publiée : numéro de publication, génération, copie figée de la grille
+# (tableau NumPy en lecture seule, tuple de tuples, univers copié) et boîte
+# englobante de ses cellules (voir bbox)
+Snapshot = namedtuple("Snapshot", "sequence generation grid bounds")
+
+# Bilan d'une génération : population (cellules dans l'état 1), naissances et morts
+GenerationStats = namedtuple("GenerationStats", "generation population births deaths")
+
+# Tirage d'une soupe aléatoire (voir randomize_grid) : graine, densité, région
+# (haut, gauche, bas exclu, droite exclue) et symétrie ; les mêmes paramètres
+# redonnent exactement la même grille, quel que soit le moteur
+Soup = namedtuple("Soup", "seed density region symmetry")
+
+class _SignalEvent(threading.Event):
+    """
+    Événement qui réveille aussi les threads bloqués sur une condition commune.
+    Les threads de calcul attendent « simulation lancée OU arrêt demandé » sans
+    scruter les deux événements à intervalles réguliers.
+    """
+
+    def __init__(self, condition, scheduler):
+        """
+        Args:
+            condition (threading.Condition): Condition notifiée à chaque changement
+            scheduler (FrameScheduler): Planificateur dont l'attente est interrompue
+        """
+        super().__init__()
+        self._signal = condition
+        self._scheduler = scheduler
 
-# Variables globales du jeu
-T = []  # Grille actuelle du jeu (matrice 2D)
-Tnext = []  # Grille suivante (calculée avant l'échange)
-n = 30  # Taille de la grille (n x n cellules)
+    def set(self):
+        super().set()
+        self._notify()
+
+    def clear(self):
+        super().clear()
+        self._notify()
+
+    def _notify(self):
+        # Réveille les threads en attente (ils réévaluent leur prédicat)
+        with self._signal:
+            self._signal.notify_all()
+        # Une pause ou un arrêt interrompt aussi l'attente d'une échéance
+        self._scheduler.wake()
+
+# Variables du module propres à l'affichage
 cell_size = 20  # Taille d'une cellule en pixels (utilisée par l'affichage)
-threads = []  # Liste contenant tous les threads des cellules
-barrier = None  # Barrière de synchronisation pour les threads
-stop_event = threading.Event()  # Événement pour arrêter complètement les threads
-running = threading.Event()  # Événement indiquant si la simulation tourne
-step_event = threading.Event()  # Événement pour exécuter une seule génération (mode pas à pas)
-redraw_event = threading.Event()  # Événement pour demander un redessin de la grille
-gen_counter = 0  # Compteur de générations (commence à 0)
-speed_lock = threading.Lock()  # Verrou pour protéger l'accès à la vitesse (thread-safe)
-_speed = 5.0  # Vitesse de simulation (générations par seconde)
-swap_lock = threading.Lock()  # Verrou utilisé lors de l'échange des grilles
 
 # Paramètres par défaut et limites
 DEFAULT_N = 30  # Taille par défaut de la grille
 CELL_SIZE = 20  # Taille par défaut d'une cellule en pixels
 MIN_N = 5  # Taille minimale de la grille
-MAX_N = 80  # Taille maximale de la grille
+MAX_N = 80  # Taille maximale affichée avec un rectangle par cellule (au-delà : image)
+MEMORY_BUDGET = 2 * 1024 ** 3  # Mémoire maximale pour T, Tnext et l'historique (octets)
+MAX_HISTORY_GENERATIONS = 100  # Nombre maximum de générations conservées dans l'historique
+
+# Choix automatique du moteur (voir choose_engine)
+AUTO = "auto"  # Nom passé à start_workers pour laisser choisir le moteur le moins coûteux
+DEFAULT_DENSITY = 0.25  # Densité supposée de la grille quand elle n'est pas connue
+MAX_JUMP = 12  # Exposant maximal du saut HashLife (2^12 = 4096 générations par étape, voir set_jump)
+THREADS_COST = (3e-4, 2e-7, 4e-7)  # Modèle de coût du mode "threads" (voir NumpyEngine.cost_model)
+BACKGROUND_SKIP = ("processes",)  # Moteurs jamais mesurés en arrière-plan (calibrate) : processus lancés sous l'interface
+CALIBRATION_POINTS = ((32, 0.25), (256, 0.25), (256, 0.03))  # (taille, densité) des mesures
+CALIBRATION_TIME = 0.05  # Durée minimale d'une mesure (secondes, au moins 3 générations)
 
 def make_grid(size):
     """
     Crée une grille de taille (size + 2) x (size + 2).
     Les bordures (+2) servent de tampon pour simplifier les calculs des voisins.
-    
+
     Args:
         size (int): Taille réelle de la grille (sans bordures)
-        
+
     Returns:
         list: Grille 2D initialisée à 0 (toutes les cellules mortes)
     """
@@ -48,220 +122,1695 @@ def make_grid(size):
     # La bordure extérieure reste à 0 et ne sera jamais utilisée
     return [[0] * (size + 2) for _ in range(size + 2)]
 
-def has_living_cells():
+def copy_grid(grid):
     """
-    Vérifie s'il reste au moins une cellule vivante dans la grille.
-    
+    Retourne une copie indépendante d'une grille, dans le format du moteur.
+
+    Args:
+        grid: Grille à copier
+
     Returns:
-        bool: True si au moins une cellule est vivante, False sinon
+        Copie de la grille, du même type que l'originale
     """
-    # Parcourt toutes les cellules (hors bordures)
-    for i in range(1, n + 1):
-        for j in range(1, n + 1):
-            # Vérifie si la cellule est vivante
-            if T[i][j] == 1:
-                return True
-    # Aucune cellule vivante trouvée
-    return False
+    # Les grilles des moteurs vectorisés (tableaux NumPy) se copient en un seul appel
+    if not isinstance(grid, (list, tuple)):
+        return grid.copy()
+    # Chaque ligne est copiée indépendamment pour préserver l'état
+    return [list(row) for row in grid]
 
-def randomize_grid(grid):
+def freeze_grid(grid, previous=None, rows=None):
     """
-    Remplit la grille aléatoirement avec environ 25% de cellules vivantes.
-    
+    Retourne une copie figée d'une grille (contenu d'un instantané).
+
     Args:
-        grid (list): Grille à remplir
+        grid: Grille à copier (liste de listes ou grille du moteur)
+        previous (tuple, optional): Instantané précédent en tuples, dont les
+            lignes non modifiées sont partagées
+        rows (iterable, optional): Lignes modifiées depuis previous
+
+    Returns:
+        Tuple de tuples pour une grille en listes, sinon copie en lecture seule
     """
-    # Parcourt toutes les cellules (hors bordures)
-    for i in range(1, n + 1):
-        for j in range(1, n + 1):
-            # Génère une cellule vivante avec une probabilité de 25%
-            # random.random() retourne un nombre entre 0 et 1
-            grid[i][j] = 1 if random.random() < 0.25 else 0
+    if isinstance(grid, list):
+        # Seules les lignes modifiées sont copiées (moteur "active")
+        if previous is not None and rows is not None:
+            frozen = list(previous)
+            for i in rows:
+                frozen[i] = tuple(grid[i])
+            return tuple(frozen)
+        return tuple(map(tuple, grid))
+    if engines.NUMPY_AVAILABLE and isinstance(grid, engines.np.ndarray):
+        # Tableau ordinaire (pas de mémoire partagée pour une grille du moteur "processes")
+        frozen = engines.np.array(grid)
+        frozen.flags.writeable = False
+        return frozen
+    return grid.copy()
 
-def clear_grid(grid):
+def _union(first, second):
     """
-    Vide complètement la grille (toutes les cellules mortes).
-    
+    Plus petite boîte contenant deux boîtes.
+
     Args:
-        grid (list): Grille à vider
+        first (tuple): (haut, gauche, bas, droite)
+        second (tuple): (haut, gauche, bas, droite)
+
+    Returns:
+        tuple: Boîte englobant les deux
     """
-    # Parcourt toutes les cellules (hors bordures)
-    for i in range(1, n + 1):
-        for j in range(1, n + 1):
-            # Met chaque cellule à 0 (morte)
-            grid[i][j] = 0
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[2], second[2]), max(first[3], second[3]))
 
-def barrier_action():
+def region_around(box, rule, size, topology="plane", steps=1):
     """
-    Action exécutée automatiquement par la barrière après que tous les threads ont terminé.
-    Cette fonction est appelée par UN SEUL thread (le dernier arrivé).
+    Région où peuvent se trouver les cellules non nulles d'une grille après
+    steps générations : la boîte englobante élargie du rayon de la règle (une
+    cellule ne naît qu'à portée d'une cellule vivante) par génération calculée.
+
+    Args:
+        box (tuple): Boîte des cellules non nulles (None = grille vide)
+        rule (gamelife_rules.Rule): Règle appliquée
+        size (int): Taille de la grille (size x size cellules)
+        topology (str): Condition aux bords (voir engines.TOPOLOGIES)
+        steps (int): Générations calculées en un pas
+
+    Returns:
+        tuple: (haut, gauche, bas, droite), ou None pour toute la grille
+            (règle B0, cellules à portée d'un bord recollé)
     """
-    global T, Tnext, gen_counter
+    if 0 in rule.births:
+        return None
+    # Grille vide : aucune cellule à calculer
+    if box is None:
+        return (1, 1, 1, 1)
+    margin = rule.radius * steps
+    top, left, bottom, right = box
+    top, left, bottom, right = top - margin, left - margin, bottom + margin, right + margin
+    # Bords recollés : les cellules proches d'un bord agissent sur le bord opposé
+    if topology != "plane" and (top < 1 or left < 1 or bottom > size + 1 or right > size + 1):
+        return None
+    return max(1, top), max(1, left), min(size + 1, bottom), min(size + 1, right)
 
-    # Échange les grilles actuelle et suivante de manière atomique
-    with swap_lock:
-        # La grille calculée devient la grille actuelle
-        T, Tnext = Tnext, T
-        # Incrémente le compteur de générations
-        gen_counter += 1
+class Simulation:
+    """
+    Une simulation : grilles T et Tnext, moteur, règle, topologie, pool de
+    threads, événements, cadence, bilans et historique. Les simulations ne
+    partagent aucun état : plusieurs peuvent tourner en même temps dans un
+    processus (balayage de paramètres), chacune sur son propre pool de threads.
 
-    # Import local pour éviter les dépendances circulaires
-    from history_manager import save_state_to_history
+        sim = Simulation()
+        sim.start_workers(500, engine="numpy")
+        sim.set_rule("highlife")
+        sim.randomize_grid(sim.T)
+        sim.running.set()
+    """
 
-    # Sauvegarde l'état actuel dans l'historique
-    save_state_to_history()
+    def __init__(self):
+        self.T = []  # Grille actuelle du jeu (matrice 2D)
+        self.Tnext = []  # Grille suivante (calculée avant l'échange)
+        self.n = DEFAULT_N  # Taille de la grille (n x n cellules)
+        self.threads = []  # Liste contenant tous les threads du pool (un par bande de lignes)
+        self.barrier = None  # Barrière de synchronisation pour les threads
+        self.gen_counter = 0  # Compteur de générations (commence à 0)
+        self.speed_lock = threading.Lock()  # Verrou pour protéger l'accès à la vitesse (thread-safe)
+        self._speed = 5.0  # Vitesse de simulation (générations par seconde)
+        self.scheduler = FrameScheduler(self._speed)  # Échéances de publication des générations (voir set_speed)
+        self._wakeup = threading.Condition()  # Notifiée quand running ou stop_event change (réveil des threads)
+        self.stop_event = _SignalEvent(self._wakeup, self.scheduler)  # Événement pour arrêter complètement les threads
+        self.running = _SignalEvent(self._wakeup, self.scheduler)  # Événement indiquant si la simulation tourne
+        self.step_event = threading.Event()  # Événement pour exécuter une seule génération (mode pas à pas)
+        self.redraw_event = threading.Event()  # Événement pour demander un redessin de la grille
+        self.swap_lock = threading.Lock()  # Verrou utilisé lors de l'échange des grilles
+        self._dirty_lock = threading.Lock()  # Protège les cellules à redessiner (_dirty)
+        self.snapshot = None  # Dernier instantané publié (Snapshot), lu par une seule lecture de référence
+        self.publish_snapshots = True  # Publie un instantané à chaque génération (False en mode sans interface)
+        self._sequence = 0  # Numéro du dernier instantané publié
+        self.engine_name = "threads"  # Moteur de calcul actif ("threads" ou un moteur de gamelife_engines)
+        self.auto_engine = False  # Moteur choisi par choose_engine à chaque start_workers (engine=AUTO)
+        self._engine = None  # Instance du moteur (None en mode "threads")
+        self.topology_name = "plane"  # Condition aux bords ("plane", "torus", "klein", "cross")
+        self.rule = rules.CONWAY  # Règle appliquée (table compilée, voir set_rule)
+        self.jump = 0  # Exposant du saut des moteurs qui le règlent (au plus 2^jump générations par étape, voir set_jump)
+        self.keep_history = True  # Enregistre chaque génération dans history (False en mode sans interface)
+        self.history = {}  # Générations enregistrées : {numéro de génération: grille figée}
+        self.history_limit = MAX_HISTORY_GENERATIONS  # Taille maximale de l'historique (réduite pour les grandes grilles)
+        self.soup = None  # Soupe (Soup) d'où part la grille actuelle, None si elle a été dessinée ou chargée
+        self.stop_at = None  # Génération à laquelle la simulation s'arrête d'elle-même (None = jamais)
+        self.halted = threading.Event()  # Mis quand la simulation s'arrête d'elle-même (stop_at, cycle, voir _halt)
+        self.halt_time = None  # Instant de cet arrêt (time.perf_counter), pour mesurer une durée sans scruter running
+        self.last_changes = None  # Cellules modifiées par la dernière génération (None = inconnu)
+        self.detect_cycles = True  # Cherche un état déjà rencontré après chaque génération
+        self.stop_on_cycle = False  # Met la simulation en pause dès qu'un cycle est détecté
+        self.cycle = None  # Cycle détecté : (période, génération de début), None = aucun
+        self._cycles = cycles.CycleDetector()  # Hachages des dernières générations
+        self._cycles_lock = threading.Lock()  # Sérialise la mise à jour du hachage et son oubli
+        self.track_population = True  # Tient à jour population, naissances et morts à chaque génération
+        self.population = 0  # Cellules vivantes (état 1) de la grille actuelle
+        self.births = 0  # Cellules nées à la dernière génération
+        self.deaths = 0  # Cellules mortes à la dernière génération
+        self.stats_history = deque(maxlen=10000)  # Derniers bilans (GenerationStats), pour les courbes
+        self.stats_listeners = []  # Fonctions appelées avec le GenerationStats de chaque génération
+        self.bbox = None  # Boîte des cellules non nulles de T : (haut, gauche, bas, droite), bornes bas et droite exclues (None = grille vide)
+        self._next_bbox = None  # Boîte des cellules non nulles de Tnext (génération précédente), effacées hors de la région
+        self.region = None  # Région calculée à la prochaine génération (None = toute la grille)
+        self._dirty = None  # Cellules à redessiner depuis le dernier affichage (None = toute la grille)
 
-    # Demande un redessin de la grille à l'interface graphique
-    redraw_event.set()
+    def grid_bytes(self, size, engine=None):
+        """
+        Estime la mémoire occupée par une grille dans le format d'un moteur.
 
-    # Si on était en mode "une seule étape" (pas à pas)
-    if step_event.is_set():
-        # Arrête immédiatement la simulation après cette génération
-        running.clear()
-        # Réinitialise le flag d'étape unique
-        step_event.clear()
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+            engine (str, optional): Nom du moteur (None = moteur actuel)
 
-    # Applique une pause selon la vitesse choisie
-    with speed_lock:
-        # Copie locale de la vitesse pour éviter de garder le verrou
-        local_speed = _speed
+        Returns:
+            int: Nombre d'octets d'une grille
+        """
+        name = engine or self.engine_name
+        instance = engines.get_engine(name) if name != "threads" else None
+        if instance is None:
+            # Mode "threads" (ou moteur indisponible) : liste de listes
+            return engines.list_grid_bytes(size)
+        return instance.grid_bytes(size)
 
-    # Si la vitesse est positive, applique un délai
-    if local_speed > 0:
-        # Délai = 1 / vitesse (en secondes)
-        # Ex: vitesse=5 → délai=0.2s → 5 générations/seconde
-        time.sleep(max(0.0, 1.0 / local_speed))
+    def estimate_memory(self, size, engine=None, history=0):
+        """
+        Estime la mémoire nécessaire à une simulation : T, Tnext et les états
+        conservés par l'historique (copies complètes dans le pire cas).
 
-def cell_thread(i, j):
-    """
-    Thread associé à une cellule (i, j).
-    Ce thread tourne en boucle infinie jusqu'à ce que stop_event soit activé.
-    
-    Args:
-        i (int): Ligne de la cellule (1 à n)
-        j (int): Colonne de la cellule (1 à n)
-    """
-    try:
-        # Boucle principale du thread
-        while not stop_event.is_set():
-            # Attend que la simulation soit lancée ou que l'arrêt soit demandé
-            while not (running.is_set() or stop_event.is_set()):
-                # Petite pause pour ne pas consommer de CPU inutilement
-                time.sleep(0.01)
-
-            # Vérifie si l'arrêt a été demandé
-            if stop_event.is_set():
-                break  # Sort de la boucle principale
-
-            # Calcule le nombre de voisins vivants (8 cellules autour)
-            neighbors = (
-                T[i-1][j-1] + T[i-1][j] + T[i-1][j+1] +  # Ligne du dessus
-                T[i][j-1] + T[i][j+1] +  # Ligne du milieu (gauche et droite)
-                T[i+1][j-1] + T[i+1][j] + T[i+1][j+1]  # Ligne du dessous
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+            engine (str, optional): Nom du moteur (None = moteur actuel)
+            history (int): Nombre d'états conservés dans l'historique
+
+        Returns:
+            int: Nombre d'octets
+        """
+        return self.grid_bytes(size, engine) * (2 + history)
+
+    def plan_grid(self, size, engine=None, history=0):
+        """
+        Choisit un moteur et une profondeur d'historique qui tiennent dans MEMORY_BUDGET.
+        Essaie le moteur demandé, puis le moteur "bitpacked" (le plus compact) ;
+        l'historique est raccourci si nécessaire (au moins un état est conservé).
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+            engine (str, optional): Moteur souhaité (None = moteur actuel)
+            history (int): Nombre d'états souhaités dans l'historique
+
+        Returns:
+            tuple: (moteur, nombre d'états d'historique), ou None si la grille ne tient pas
+        """
+        name = engine or self.engine_name
+        candidates = [name]
+        if name != "bitpacked" and engines.get_engine("bitpacked") is not None:
+            candidates.append("bitpacked")
+
+        for candidate in candidates:
+            # États d'historique possibles une fois T et Tnext alloués
+            states = MEMORY_BUDGET // self.grid_bytes(size, candidate) - 2
+            if states >= min(history, 1):
+                return candidate, min(history, states)
+
+        # Même le moteur le plus compact dépasse le budget
+        return None
+
+    def choose_engine(self, size, density=DEFAULT_DENSITY, rule=None, topology=None):
+        """
+        Choisit le moteur le moins coûteux pour une grille : parmi les moteurs
+        qui appliquent la règle sur la topologie et tiennent dans MEMORY_BUDGET,
+        celui dont le modèle de coût (voir engine_costs) prévoit la génération
+        la plus rapide. Ne mesure rien : les moteurs non calibrés (calibrate,
+        load_calibration) sont comparés sur leurs modèles déclarés.
+
+        Args:
+            size (int): Taille de la grille (n x n cellules)
+            density (float): Proportion attendue de cellules vivantes
+            rule (gamelife_rules.Rule, optional): Règle (par défaut : règle actuelle)
+            topology (str, optional): Condition aux bords (par défaut : topologie actuelle)
+
+        Returns:
+            str: Nom du moteur ("threads" si aucun moteur ne convient)
+        """
+        rule = rule or self.rule
+        topology = topology or self.topology_name
+        costs = engine_costs()
+
+        best, best_cost = "threads", None
+        for name in engine_candidates():
+            engine_class = engines.ENGINES.get(name)
+            supported = engine_class.topologies if engine_class is not None else engines.TOPOLOGIES
+            # Capacités : topologie, règle et mémoire
+            if topology not in supported or not engine_supports(rule, name, topology):
+                continue
+            if self.estimate_memory(size, name) > MEMORY_BUDGET:
+                continue
+            cost = estimate_cost(costs[name], size, density)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = name, cost
+        return best
+
+    def get_cell(self, i, j, grid=None):
+        """
+        Retourne l'état d'une cellule de la grille actuelle (ou d'un instantané).
+        Le stockage de la grille (liste, tableau, bits) dépend du moteur.
+
+        Args:
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+            grid (optional): Grille lue (par défaut : T), par exemple snapshot.grid
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 sinon
+        """
+        if grid is None:
+            grid = self.T
+        # Autre moteur : l'accès passe par le moteur
+        if self._engine is not None:
+            return self._engine.get_cell(grid, i, j)
+        return grid[i][j]
+
+    def set_cell(self, i, j, value):
+        """
+        Modifie l'état d'une cellule de la grille actuelle.
+
+        Args:
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+            value (int): Nouvel état (1 = vivante, 0 = morte)
+        """
+        # Population : la cellule entre dans l'état 1 ou en sort
+        if self.track_population:
+            self.population += (1 if value else 0) - (self.get_cell(i, j) == 1)
+
+        # Autre moteur : l'accès passe par le moteur
+        if self._engine is not None:
+            self._engine.set_cell(self.T, i, j, value)
+        else:
+            self.T[i][j] = 1 if value else 0
+        # Une cellule du bord modifie aussi la bordure recollée
+        if self.topology_name != "plane":
+            self.refresh_halo(self.T)
+
+        # La boîte englobante s'agrandit pour contenir la nouvelle cellule
+        # (une cellule effacée la laisse trop grande jusqu'à la génération suivante)
+        if value:
+            cell = (i, j, i + 1, j + 1)
+            self.bbox = cell if self.bbox is None else _union(self.bbox, cell)
+            self._clip()
+
+        # La grille ne découle plus seulement de la dernière génération
+        # (ni de la soupe tirée)
+        self.last_changes = None
+        self.forget_cycle()
+        self.soup = None
+        # Seule cette cellule doit être redessinée
+        self.mark_dirty({(i, j)})
+        self.publish()
+
+    def publish(self, changes=None, since=None):
+        """
+        Publie un instantané figé de la grille actuelle. Les lecteurs (affichage,
+        historique) lisent snapshot sans verrou : un instantané n'est jamais
+        modifié, il est remplacé par le suivant.
+
+        Args:
+            changes (set, optional): Cellules modifiées depuis la génération since
+            since (int, optional): Génération de l'instantané dont changes part
+        """
+        if not self.publish_snapshots:
+            return
+        with self.swap_lock:
+            previous = self.snapshot
+            rows = None
+            if changes is not None and previous is not None and previous.generation == since:
+                rows = {i for i, _ in changes}
+            grid = freeze_grid(self.T, previous.grid if rows is not None else None, rows)
+            self._sequence += 1
+            # Une seule affectation : les lecteurs voient l'ancien ou le nouvel instantané
+            self.snapshot = Snapshot(self._sequence, self.gen_counter, grid, self.bbox)
+
+    def grid_to_list(self, grid):
+        """
+        Convertit une grille en liste de listes (size + 2) x (size + 2),
+        le format de make_grid utilisé pour l'affichage et le fichier d'historique.
+
+        Args:
+            grid: Grille à convertir (liste de listes ou grille du moteur)
+
+        Returns:
+            list: Grille 2D sous forme de listes Python
+        """
+        # Les moteurs vectorisés décompressent leur propre format
+        if not isinstance(grid, (list, tuple)):
+            return self._engine.to_list(grid)
+        return [list(row) for row in grid]
+
+    def grid_to_array(self, grid):
+        """
+        Convertit une grille en tableau NumPy uint8 (size + 2) x (size + 2),
+        utilisé par l'affichage des grandes grilles (sans boucle par cellule).
+
+        Args:
+            grid: Grille à convertir (liste de listes ou grille du moteur)
+
+        Returns:
+            numpy.ndarray: Tableau d'octets, ou None si NumPy est indisponible
+        """
+        if not engines.NUMPY_AVAILABLE:
+            return None
+        # Les moteurs vectorisés décompressent leur propre format
+        if not isinstance(grid, (list, tuple)):
+            return self._engine.to_array(grid)
+        return engines.np.array(grid, dtype=engines.np.uint8)
+
+    def load_grid(self, state):
+        """
+        Copie un état sauvegardé dans la grille actuelle.
+        Si les tailles diffèrent, seule la partie commune est copiée.
+
+        Args:
+            state: État à restaurer (liste de listes ou copie faite par copy_grid)
+        """
+        T = self.T
+
+        # Toute la grille a pu changer
+        self.last_changes = None
+        self.forget_cycle()
+        self.mark_dirty(None)
+
+        # Autre moteur : le moteur convertit l'état dans son format
+        if self._engine is not None:
+            self._engine.load(T, state)
+        else:
+            # Parcourt toutes les lignes de l'état sauvegardé
+            for i in range(len(state)):
+                # Parcourt toutes les colonnes de chaque ligne
+                for j in range(len(state[i])):
+                    # Vérifie que la position existe dans la grille actuelle
+                    # Évite les erreurs si les dimensions ont changé
+                    if i < len(T) and j < len(T[i]):
+                        # Restaure l'état de la cellule (deux états : une cellule
+                        # mourante d'une règle Generations est morte)
+                        T[i][j] = 1 if state[i][j] == 1 else 0
+
+        # États absents de la règle actuelle (état sauvegardé sous une autre règle)
+        if self._engine is not None and self._engine.multistate:
+            self._engine.clip_states(T, self.rule.states)
+
+        # La bordure sauvegardée peut venir d'une autre topologie
+        self.refresh_halo(T)
+        self.soup = None
+        self.recount()
+        self.rebound()
+        self.publish()
+
+    def has_living_cells(self):
+        """
+        Vérifie s'il reste au moins une cellule vivante dans la grille.
+
+        Returns:
+            bool: True si au moins une cellule est vivante, False sinon
+        """
+        # Population tenue à jour : simple lecture
+        if self.track_population:
+            return self.population > 0
+
+        # Autre moteur : le moteur parcourt son propre stockage
+        if self._engine is not None:
+            return self._engine.any(self.T)
+
+        # Parcourt toutes les cellules (hors bordures)
+        for i in range(1, self.n + 1):
+            for j in range(1, self.n + 1):
+                # Vérifie si la cellule est vivante
+                if self.T[i][j] == 1:
+                    return True
+        # Aucune cellule vivante trouvée
+        return False
+
+    def randomize_grid(self, grid, density=0.25, seed=None, region=None, symmetry="C1"):
+        """
+        Remplit la grille d'une soupe aléatoire (environ 25% de cellules vivantes
+        par défaut), tirée en une seule opération par le moteur. Sans graine, une
+        graine est tirée au hasard : dans les deux cas, le tirage de la grille
+        actuelle est conservé dans soup (et dans le fichier d'historique), ce
+        qui permet de rejouer exactement la simulation.
+
+        Args:
+            grid (list): Grille à remplir
+            density (float): Proportion de cellules vivantes
+            seed (int, optional): Graine du tirage (None : graine aléatoire)
+            region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+                en coordonnées de la grille ; le reste de la grille est vidé
+                (None : toute la grille)
+            symmetry (str): Symétrie de la soupe (voir engines.SYMMETRIES)
+
+        Returns:
+            Soup: Paramètres du tirage
+
+        Raises:
+            ValueError: Si la région sort de la grille ou est vide, ou si la
+                symétrie est inconnue ou exige une région carrée
+        """
+        n = self.n
+
+        # Vérifie les paramètres avant de toucher à la grille
+        if region is not None:
+            region = tuple(region)
+            top, left, bottom, right = region
+            if not 1 <= top < bottom <= n + 1 or not 1 <= left < right <= n + 1:
+                raise ValueError(f"Région hors de la grille ou vide : {region} (grille de {n} x {n})")
+        height, width = (bottom - top, right - left) if region is not None else (n, n)
+        if symmetry not in engines.SYMMETRIES:
+            raise ValueError(f"Symétrie inconnue : {symmetry} (attendu : {', '.join(engines.SYMMETRIES)})")
+        if symmetry in ("C4", "D8") and height != width:
+            raise ValueError(f"La symétrie {symmetry} exige une région carrée ({height} x {width})")
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+
+        # Toute la grille change
+        self.last_changes = None
+        self.forget_cycle()
+        self.mark_dirty(None)
+
+        # Tirage dans le format du moteur (en une opération si vectorisé)
+        if self._engine is not None:
+            self._engine.randomize(grid, density, seed, region, symmetry)
+        else:
+            engines.randomize_lists(grid, density, seed, region, symmetry)
+
+        # Recolle la bordure sur les nouvelles cellules
+        self.refresh_halo(grid)
+        soup = Soup(seed, density, region, symmetry)
+        if grid is self.T:
+            self.soup = soup
+            self.recount()
+            self.rebound()
+            self.publish()
+        return soup
+
+    def clear_grid(self, grid):
+        """
+        Vide complètement la grille (toutes les cellules mortes).
+
+        Args:
+            grid (list): Grille à vider
+        """
+        n = self.n
+
+        # Toute la grille change
+        self.last_changes = None
+        self.forget_cycle()
+        self.mark_dirty(None)
+
+        # Autre moteur : remise à zéro dans le format du moteur
+        if self._engine is not None:
+            self._engine.clear(grid)
+        else:
+            # Remet chaque ligne à 0 d'un coup (hors bordures)
+            dead = [0] * n
+            for i in range(1, n + 1):
+                grid[i][1:n + 1] = dead
+
+        # Bordure recollée : elle aussi est vide
+        self.refresh_halo(grid)
+        if grid is self.T:
+            self.soup = None
+            self.recount()
+            self.rebound()
+            self.publish()
+
+    def refresh_halo(self, grid):
+        """
+        Remplit la bordure de la grille selon la topologie (voir engines.TOPOLOGIES).
+        Appelée une fois par génération et après chaque modification de la grille :
+        les calculs lisent ensuite la bordure comme des cellules voisines ordinaires.
+
+        Args:
+            grid: Grille dont la bordure est mise à jour (liste de listes ou grille du moteur)
+        """
+        if self._engine is not None:
+            self._engine.wrap(grid, self.topology_name)
+        else:
+            engines.wrap_list(grid, self.topology_name)
+
+    def forget_cycle(self):
+        """
+        Oublie les générations mémorisées par la détection des cycles : la grille
+        a été modifiée hors calcul (dessin, chargement, tirage) ou la règle a changé.
+        """
+        with self._cycles_lock:
+            self.cycle = None
+            self._cycles.reset()
+
+    def _track_cycle(self, changes, steps=1):
+        """
+        Met à jour le hachage de la grille avec les unités modifiées par la
+        génération et mémorise le cycle si l'état a déjà été rencontré.
+
+        Args:
+            changes (tuple): Résultat de diff(Tnext, T) après l'échange
+            steps (int): Générations calculées par l'étape (voir generations_per_step)
+        """
+        with self._cycles_lock:
+            # Premier hachage après un oubli : l'état de départ (Tnext après
+            # l'échange) est enregistré d'abord, il peut appartenir au cycle
+            if self._cycles.hash is None:
+                self._cycles.record(self.gen_counter - steps, self._diff(None, self.Tnext))
+            found = self._cycles.record(self.gen_counter, changes)
+            if found is None:
+                return
+            self.cycle = found
+        # Pause automatique (la génération répétée reste affichée)
+        if self.stop_on_cycle:
+            self._halt()
+
+    def _halt(self):
+        """
+        Arrête la simulation depuis barrier_action (génération stop_at atteinte,
+        cycle détecté) : date l'arrêt puis réveille ceux qui attendent halted.
+        """
+        self.halt_time = time.perf_counter()
+        self.running.clear()
+        self.halted.set()
+
+    def _diff(self, old, new, region=None):
+        """
+        Unités de stockage modifiées entre deux grilles (méthode diff du moteur).
+
+        Args:
+            old: Grille précédente (None = grille vide)
+            new: Grille actuelle
+            region (tuple, optional): Région calculée par la génération qui mène
+                de old à new : les grilles ne diffèrent qu'à l'intérieur (None :
+                toute la grille)
+
+        Returns:
+            tuple: (positions, valeurs avant, valeurs après)
+        """
+        if self._engine is not None:
+            return self._engine.diff(old, new, region)
+        if region is None or old is None:
+            return engines.diff_lists(old, new)
+        return engines.diff_lists(old, new, range(region[0], region[2]))
+
+    def count_living(self, grid=None):
+        """
+        Compte les cellules vivantes (état 1) d'une grille en la parcourant.
+
+        Args:
+            grid (optional): Grille comptée (par défaut : T)
+
+        Returns:
+            int: Nombre de cellules vivantes
+        """
+        if grid is None:
+            grid = self.T
+        if self._engine is not None:
+            return self._engine.count(grid)
+        return engines.count_lists(grid)
+
+    def recount(self):
+        """
+        Recompte la population après une modification de toute la grille
+        (chargement, tirage, effacement) ; naissances et morts repartent de 0.
+        """
+        if self.track_population:
+            self.population, self.births, self.deaths = self.count_living(), 0, 0
+
+    def _update_stats(self, changes):
+        """
+        Met à jour population, naissances et morts avec les cellules modifiées par
+        la génération, puis transmet le bilan aux abonnés (stats_listeners).
+
+        Args:
+            changes (tuple): Résultat de diff(Tnext, T) après l'échange (None si
+                le moteur a compté naissances et morts pendant le calcul)
+        """
+        if self._engine is not None:
+            self.births, self.deaths = self._engine.census(self.Tnext, self.T, changes)
+        else:
+            self.births, self.deaths = engines.census_lists(self.Tnext, self.T, changes)
+        self.population += self.births - self.deaths
+        stats = GenerationStats(self.gen_counter, self.population, self.births, self.deaths)
+        self.stats_history.append(stats)
+        for listener in self.stats_listeners:
+            listener(stats)
+
+    def get_stats(self):
+        """
+        Retourne le bilan de la génération actuelle (lecture en O(1)).
+
+        Returns:
+            GenerationStats: Génération, population, naissances et morts
+        """
+        return GenerationStats(self.gen_counter, self.population, self.births, self.deaths)
+
+    def find_bounds(self, grid=None, within=None):
+        """
+        Cherche la boîte englobante des cellules non nulles d'une grille
+        (réductions sur les lignes et les colonnes, voir la méthode bounds des moteurs).
+
+        Args:
+            grid (optional): Grille parcourue (par défaut : T)
+            within (tuple, optional): Région contenant toutes les cellules non nulles
+                (par défaut : toute la grille)
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), bornes bas et droite exclues,
+                ou None si la grille est vide
+        """
+        if grid is None:
+            grid = self.T
+        if self._engine is not None:
+            return self._engine.bounds(grid, within)
+        return engines.bounds_lists(grid, within)
+
+    def rebound(self):
+        """
+        Recalcule la boîte englobante après une modification de toute la grille
+        (chargement, tirage, effacement), puis la région de la prochaine génération.
+        """
+        self.bbox = self.find_bounds()
+        self._clip()
+
+    def _next_region(self):
+        """
+        Région de la prochaine génération (voir region_around).
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), ou None pour toute la grille
+                (règle B0, univers infini, cellules à portée d'un bord recollé)
+        """
+        engine = self._engine
+        if engine is not None and engine.unbounded:
+            return None
+        # Un moteur à saut avance d'au plus 2^jump générations à l'étape suivante
+        steps = 1 << self.jump if engine is not None and engine.jumps else 1
+        return region_around(self.bbox, self.rule, self.n, self.topology_name, steps)
+
+    def _clip(self):
+        """
+        Calcule la région de la prochaine génération et la transmet au moteur.
+        """
+        self.region = self._next_region()
+        if self._engine is not None and self._engine.clips:
+            self._engine.set_region(self.region, self._next_bbox)
+
+    def mark_dirty(self, cells):
+        """
+        Ajoute des cellules à redessiner par l'interface.
+
+        Args:
+            cells (set or None): Cellules (i, j) modifiées, ou None pour toute la grille
+        """
+        with self._dirty_lock:
+            # Toute la grille est déjà à redessiner
+            if self._dirty is None:
+                return
+            # Toute la grille doit être redessinée
+            if cells is None:
+                self._dirty = None
+                return
+            self._dirty |= cells
+            # Au-delà d'un quart de la grille, un redessin complet est plus simple
+            if len(self._dirty) > self.n * self.n // 4:
+                self._dirty = None
+
+    def take_dirty_cells(self):
+        """
+        Retourne les cellules à redessiner depuis le dernier appel et vide la liste.
+
+        Returns:
+            set or None: Cellules (i, j) modifiées, ou None si toute la grille doit être redessinée
+        """
+        with self._dirty_lock:
+            cells = self._dirty
+            self._dirty = set()
+        return cells
+
+    def record_history(self):
+        """
+        Enregistre la génération actuelle dans l'historique.
+        Limite la taille de l'historique à history_limit.
+        """
+        # Vérifie que la grille existe
+        if len(self.T) == 0:
+            return
+
+        # Instantané figé publié par le moteur : conservé tel quel, sans copie
+        # (les instantanés ne sont jamais modifiés ; pour le moteur "active", les
+        # lignes non modifiées sont partagées avec l'instantané précédent)
+        snapshot = self.snapshot
+        if self.publish_snapshots and snapshot is not None:
+            state = snapshot.grid
+        else:
+            # Publication désactivée : copie figée de la grille actuelle
+            state = freeze_grid(self.T)
+
+        # Sauvegarde l'état avec le numéro de génération comme clé
+        self.history[self.gen_counter] = state
+
+        # Limite la taille de l'historique si nécessaire
+        while len(self.history) > self.history_limit:
+            # Supprime la génération la plus ancienne pour libérer de la mémoire
+            del self.history[min(self.history)]
+
+    def restore_history(self, direction):
+        """
+        Charge la génération précédente ou suivante depuis l'historique.
+
+        Args:
+            direction (str): Direction de navigation ("undo" ou "redo")
+
+        Returns:
+            bool: True si l'opération a réussi, False sinon
+        """
+        # Générations antérieures (undo) ou ultérieures (redo) à la génération actuelle
+        if direction == "undo":
+            candidates = [g for g in self.history if g < self.gen_counter]
+            target_gen = max(candidates) if candidates else None
+        elif direction == "redo":
+            candidates = [g for g in self.history if g > self.gen_counter]
+            target_gen = min(candidates) if candidates else None
+        else:
+            # Direction inconnue, opération impossible
+            return False
+        if target_gen is None:
+            return False
+
+        # Met à jour le compteur de génération pour refléter le nouvel état
+        # (avant le chargement : l'instantané publié porte ce numéro)
+        self.gen_counter = target_gen
+
+        # Copie les cellules dans la grille actuelle (quel que soit le moteur) ;
+        # la génération restaurée découle toujours de la même soupe
+        soup = self.soup
+        self.load_grid(self.history[target_gen])
+        self.soup = soup
+
+        # Force le rafraîchissement de l'affichage pour montrer le nouvel état
+        self.redraw_event.set()
+        return True
+
+    def can_undo(self):
+        """
+        Vérifie s'il est possible de revenir à une génération précédente.
+
+        Returns:
+            bool: True si un undo est possible, False sinon
+        """
+        return bool(self.history) and self.gen_counter > min(self.history)
+
+    def can_redo(self):
+        """
+        Vérifie s'il est possible d'aller à une génération suivante.
+
+        Returns:
+            bool: True si un redo est possible, False sinon
+        """
+        return bool(self.history) and self.gen_counter < max(self.history)
+
+    def barrier_action(self):
+        """
+        Action exécutée automatiquement par la barrière après que tous les threads ont terminé.
+        Cette fonction est appelée par UN SEUL thread (le dernier arrivé).
+        """
+        engine = self._engine
+
+        # Tnext est déjà calculée : attend son échéance de publication (le calcul a
+        # pris de l'avance sur l'affichage). Le pas à pas publie sans attendre ;
+        # une pause ou un arrêt pendant l'attente abandonne la génération calculée
+        steps = engine.generations_per_step if engine is not None else 1
+        # Région de la génération calculée : T et Tnext ne diffèrent qu'à l'intérieur
+        # (sauf la bordure recollée, recopiée après le calcul)
+        computed = self.region if self.topology_name == "plane" else None
+        if not self.step_event.is_set():
+            published = self.scheduler.wait_for_tick(
+                cancelled=lambda: self.stop_event.is_set() or not self.running.is_set(),
+                generations=steps,
             )
+            if not published:
+                return
 
-            # Applique les règles de Conway
-            if T[i][j] == 1:
-                # Cellule vivante : survit avec 2 ou 3 voisins, sinon meurt
-                Tnext[i][j] = 1 if neighbors in (2, 3) else 0
-            else:
-                # Cellule morte : naît avec exactement 3 voisins
-                Tnext[i][j] = 1 if neighbors == 3 else 0
+        # Échange les grilles actuelle et suivante de manière atomique
+        with self.swap_lock:
+            # La grille calculée devient la grille actuelle
+            self.T, self.Tnext = self.Tnext, self.T
+            # Incrémente le compteur de générations
+            # (un moteur HashLife peut avancer de plusieurs générations par étape)
+            self.gen_counter += steps
+            # Copie du halo pour la génération suivante (les bords opposés sont recollés)
+            if self.topology_name != "plane":
+                self.refresh_halo(self.T)
+            # Boîte englobante cherchée dans la région calculée (avec l'ancienne
+            # boîte) ; l'ancienne grille devient Tnext, avec son ancienne boîte
+            self._next_bbox, self.bbox = self.bbox, self.find_bounds(self.T, self._next_region())
+            # Région de la génération suivante
+            self._clip()
 
-            # Attend que toutes les cellules aient fini leur calcul
-            # Le dernier thread arrivé exécutera barrier_action()
-            barrier.wait()
+        # Cellules modifiées par cette génération (si le moteur les suit)
+        self.last_changes = engine.changed if engine is not None else None
+        # Transmet les cellules modifiées à l'affichage
+        self.mark_dirty(self.last_changes)
 
-    except Exception as e:
-        # Affiche une erreur si un thread plante (pour le débogage)
-        print(f"Erreur thread {i},{j}: {e}")
+        # Cellules modifiées (T après l'échange, Tnext contient encore la génération
+        # précédente) : population, naissances et morts, puis recherche d'un état
+        # déjà rencontré (inutile une fois le cycle trouvé) ; les grilles ne sont
+        # pas comparées si seul le bilan est demandé et que le noyau l'a compté.
+        # Pendant un saut, seule une génération sur 2^jump est vue : une répétition
+        # donnerait un multiple de la période, la détection est suspendue
+        jumping = engine is not None and engine.jumps and self.jump > 0
+        tracking = self.detect_cycles and self.cycle is None and not jumping
+        tallied = engine is not None and engine.tallies and engine.tally
+        changes = None
+        if tracking or (self.track_population and not tallied):
+            changes = self._diff(self.Tnext, self.T, computed)
+        if self.track_population:
+            self._update_stats(changes)
+        if tracking:
+            self._track_cycle(changes, steps)
 
-def start_workers(grid_size):
-    """
-    Crée et démarre un thread pour chaque cellule de la grille.
-    
-    Args:
-        grid_size (int): Taille de la grille (nombre de cellules par côté)
-    """
-    global threads, barrier, T, Tnext, n, stop_event, running, gen_counter
+        # Publie la nouvelle génération (l'instantané sert aussi à l'historique)
+        self.publish(self.last_changes, self.gen_counter - steps)
+
+        # Sauvegarde l'état actuel dans l'historique
+        if self.keep_history:
+            self.record_history()
+
+        # Demande un redessin de la grille à l'interface graphique
+        self.redraw_event.set()
+
+        # Nombre de générations demandé atteint (mode sans interface)
+        if self.stop_at is not None and self.gen_counter >= self.stop_at:
+            self._halt()
+
+        # Si on était en mode "une seule étape" (pas à pas)
+        if self.step_event.is_set():
+            # Arrête immédiatement la simulation après cette génération
+            self.running.clear()
+            # Réinitialise le flag d'étape unique
+            self.step_event.clear()
+
+    def compute_rows(self, r0, r1):
+        """
+        Calcule les lignes r0 à r1 - 1 de Tnext à partir de T (mode "threads",
+        Python pur, voir engines.step_lists), limitées à la région de la génération.
+
+        Args:
+            r0 (int): Première ligne calculée (1 à n)
+            r1 (int): Ligne de fin exclue (2 à n + 1)
+        """
+        engines.step_lists(self.T, self.Tnext, self.rule.table, r0, r1, self.region, self._next_bbox)
+
+    def band_thread(self, r0, r1):
+        """
+        Thread associé à une bande horizontale de la grille (lignes r0 à r1 - 1).
+        Ce thread tourne en boucle infinie jusqu'à ce que stop_event soit activé.
+        Si la bande couvre toute la grille, le moteur calcule la génération en un appel.
+
+        Args:
+            r0 (int): Première ligne de la bande (1 à n)
+            r1 (int): Ligne de fin exclue (2 à n + 1)
+        """
+        stop_event, running = self.stop_event, self.running
+        try:
+            # Boucle principale du thread
+            while not stop_event.is_set():
+                # Attend que la simulation soit lancée ou que l'arrêt soit demandé
+                # (bloqué sur la condition, réveillé par running.set() ou stop_event.set())
+                with self._wakeup:
+                    self._wakeup.wait_for(lambda: running.is_set() or stop_event.is_set())
+
+                # Vérifie si l'arrêt a été demandé
+                if stop_event.is_set():
+                    break  # Sort de la boucle principale
 
-    # Arrête les anciens threads s'ils existent
-    stop_workers()
+                # Calcule la bande de la grille suivante
+                engine = self._engine
+                if engine is None:
+                    self.compute_rows(r0, r1)
+                elif r0 == 1 and r1 == self.n + 1:
+                    if engine.jumps:
+                        engine.set_jump(self._step_jump())
+                    engine.step(self.T, self.Tnext)
+                else:
+                    engine.step_rows(self.T, self.Tnext, r0, r1)
 
-    # Met à jour la taille de la grille
-    n = grid_size
+                # Attend que toutes les bandes aient fini leur calcul
+                # Le dernier thread arrivé exécutera barrier_action()
+                self.barrier.wait()
 
-    # Initialise les grilles (actuelle et suivante)
-    T = make_grid(n)
-    Tnext = make_grid(n)
+        except threading.BrokenBarrierError:
+            # Barrière interrompue par stop_workers() : fin normale du thread
+            pass
+        except Exception as e:
+            # Affiche une erreur si un thread plante (pour le débogage)
+            print(f"Erreur thread {r0}-{r1 - 1}: {e}")
 
-    # Réinitialise le compteur de générations à 0
-    gen_counter = 0
+    def start_workers(self, grid_size, engine=None, workers=None, topology=None, density=None, jump=None):
+        """
+        Crée et démarre le pool de threads de calcul de la grille.
+        Chaque thread possède une bande horizontale de lignes ; les threads se
+        synchronisent sur une barrière à K parties entre chaque génération.
+        Les moteurs qui ne se découpent pas en bandes (ex: "active", "hashlife")
+        utilisent un seul thread.
 
-    # Nombre total de threads (un par cellule)
-    parties = n * n
+        Args:
+            grid_size (int): Taille de la grille (nombre de cellules par côté)
+            engine (str, optional): Nom du moteur ("threads", "numpy", "bitpacked", "active",
+                "hashlife") ou AUTO (choisi par choose_engine, ici et aux appels
+                suivants sans moteur). None conserve le moteur ou le choix automatique
+            workers (int, optional): Nombre de threads K (par défaut : nombre de cœurs)
+            topology (str, optional): Condition aux bords ("plane", "torus", "klein",
+                "cross"). None conserve la topologie actuelle ; un moteur qui ne la gère
+                pas revient à "plane"
+            density (float, optional): Proportion attendue de cellules vivantes,
+                pour le choix automatique du moteur (par défaut : DEFAULT_DENSITY)
+            jump (int, optional): Exposant du saut d'un moteur HashLife (voir
+                set_jump). None conserve le saut actuel
 
-    # Crée la barrière avec l'action associée
-    # parties threads doivent appeler wait() avant que barrier_action() soit exécutée
-    barrier = threading.Barrier(parties, action=barrier_action)
+        Raises:
+            MemoryError: Si T et Tnext dépassent MEMORY_BUDGET (voir plan_grid)
+            ValueError: Si le saut est hors de 0..MAX_JUMP
+        """
+        if jump is not None:
+            self.set_jump(jump)
 
-    # Initialise la liste des threads
-    threads = []
-    # Réinitialise les événements
-    stop_event.clear()
-    running.clear()
+        # Choix automatique : moteur le moins coûteux pour cette taille et cette règle
+        if engine is not None:
+            self.auto_engine = engine == AUTO
+        if self.auto_engine:
+            engine = self.choose_engine(grid_size, density or DEFAULT_DENSITY, topology=topology)
 
-    # Crée et démarre les threads des cellules
-    for i in range(1, n + 1):
-        for j in range(1, n + 1):
-            # Crée un thread pour la cellule (i, j)
+        # Refuse une grille dont T et Tnext dépassent le budget mémoire
+        # (avant d'arrêter la simulation en cours, qui reste alors intacte)
+        if self.estimate_memory(grid_size, engine) > MEMORY_BUDGET:
+            raise MemoryError(
+                f"Grille {grid_size}x{grid_size} trop grande pour le moteur "
+                f"{engine or self.engine_name} (budget : {MEMORY_BUDGET // 1024 ** 2} Mio)"
+            )
+
+        # Arrête les anciens threads s'ils existent
+        self.stop_workers()
+
+        # Met à jour la taille de la grille
+        n = self.n = grid_size
+
+        # Sélectionne le moteur (retour au mode "threads" si indisponible)
+        if engine is not None:
+            self.engine_name = engine
+        self._engine = engines.get_engine(self.engine_name) if self.engine_name != "threads" else None
+        if self._engine is None:
+            self.engine_name = "threads"
+
+        # Sélectionne la topologie (bordure morte si le moteur ne la gère pas)
+        if topology is not None:
+            self.topology_name = topology
+        supported = self._engine.topologies if self._engine is not None else engines.TOPOLOGIES
+        if self.topology_name not in supported:
+            self.topology_name = "plane"
+
+        # Applique la règle au moteur (Conway si le moteur ne peut pas l'appliquer)
+        if not self.supports_rule(self.rule):
+            self.rule = rules.CONWAY
+        if self._engine is not None:
+            self._engine.set_rule(self.rule)
+            if self._engine.jumps:
+                self._engine.set_jump(self.jump)
+            # Naissances et morts comptées par le noyau pendant le calcul
+            if self._engine.tallies:
+                self._engine.set_tally(self.track_population)
+
+        # Réinitialise le compteur de générations à 0 (sans arrêt programmé)
+        self.gen_counter = 0
+        self.stop_at = None
+        self.scheduler.reset()
+        self.forget_cycle()
+        # Nouvelle grille : aucun suivi d'activité, redessin complet, aucune soupe
+        self.last_changes = None
+        self._dirty = None
+        self.soup = None
+        # Initialise la liste des threads
+        self.threads = []
+        # Réinitialise les événements
+        self.stop_event.clear()
+        self.running.clear()
+
+        # Initialise les grilles (actuelle et suivante) dans le format du moteur
+        self.T = self._engine.make_grid(n) if self._engine is not None else make_grid(n)
+        self.Tnext = self._engine.make_grid(n) if self._engine is not None else make_grid(n)
+        # Grille vide : aucun bilan, aucune cellule à calculer, premier instantané
+        self.population = self.births = self.deaths = 0
+        self.stats_history.clear()
+        self.bbox = self._next_bbox = None
+        self._clip()
+        self.publish()
+
+        # Nombre de threads : un par cœur, sans dépasser le nombre de lignes
+        if self._engine is not None and not self._engine.splittable:
+            workers = 1
+        elif workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, n))
+
+        # Crée la barrière avec l'action associée
+        # workers threads doivent appeler wait() avant que barrier_action() soit exécutée
+        self.barrier = threading.Barrier(workers, action=self.barrier_action)
+
+        # Crée et démarre un thread par bande de lignes (bandes de tailles égales à 1 près)
+        for k in range(workers):
+            r0 = 1 + k * n // workers
+            r1 = 1 + (k + 1) * n // workers
             t = threading.Thread(
-                target=cell_thread,  # Fonction à exécuter
-                args=(i, j),  # Arguments de la fonction
+                target=self.band_thread,  # Fonction à exécuter
+                args=(r0, r1),  # Lignes de la bande
                 daemon=True  # Thread daemon (se ferme avec le programme)
             )
             # Ajoute le thread à la liste
-            threads.append(t)
+            self.threads.append(t)
             # Démarre le thread
             t.start()
 
-def stop_workers():
+    def stop_workers(self):
+        """
+        Arrête proprement tous les threads en cours et attend leur fin.
+        """
+        # Vérifie s'il y a des threads à arrêter
+        if self.threads:
+            # Signale l'arrêt à tous les threads (et interrompt l'attente d'une échéance)
+            self.stop_event.set()
+            # Libère les threads bloqués dans barrier.wait() (BrokenBarrierError)
+            self.barrier.abort()
+            # Attend la fin de chaque thread
+            for t in self.threads:
+                t.join()
+            # Vide la liste des threads
+            self.threads = []
+            # Réinitialise l'événement d'arrêt pour une prochaine utilisation
+            self.stop_event.clear()
+
+        # Libère les ressources du moteur (processus, mémoire partagée...)
+        if self._engine is not None:
+            self._engine.close()
+
+    def supports_rule(self, candidate, engine=None, topology=None):
+        """
+        Indique si un moteur peut appliquer une règle.
+
+        Args:
+            candidate (gamelife_rules.Rule): Règle compilée
+            engine (str, optional): Nom du moteur (None = moteur actif)
+            topology (str, optional): Condition aux bords (None = topologie active)
+
+        Returns:
+            bool: False pour une règle B0 sur un moteur creux (active, hashlife,
+                infinite), une règle Generations sur un moteur à deux états ou une
+                règle Larger than Life (rayon > 1) hors du moteur NumPy ou sur une
+                grille dont les bords sont recollés
+        """
+        return engine_supports(candidate, engine or self.engine_name,
+                               topology or self.topology_name)
+
+    def set_rule(self, new_rule):
+        """
+        Change la règle d'évolution (prise en compte dès la génération suivante).
+
+        Args:
+            new_rule: Règle compilée (gamelife_rules.Rule ou RangeRule) ou texte
+                ("B36/S23", "highlife", "B2/S/C3", "R5,C0,M1,S34..58,B34..45,NM", ...)
+
+        Raises:
+            ValueError: Si la règle est mal formée ou si le moteur actif ne peut pas
+                l'appliquer (voir supports_rule)
+        """
+        if isinstance(new_rule, str):
+            new_rule = rules.compile_rule(new_rule)
+        if not self.supports_rule(new_rule):
+            raise ValueError(f"La règle {new_rule.name} n'est pas gérée par le moteur "
+                             f"{self.engine_name} (bords : {self.topology_name})")
+
+        engine = self._engine
+        with self.swap_lock:
+            # Moins d'états qu'avant : les cellules dans un état disparu meurent
+            if engine is not None and engine.multistate and new_rule.states < self.rule.states:
+                engine.clip_states(self.T, new_rule.states)
+            self.rule = new_rule
+            if engine is not None:
+                engine.set_rule(new_rule)
+            # Le rayon de la règle et les naissances sans voisin changent la région
+            self._clip()
+        # Les générations passées ne se répètent plus avec la nouvelle règle
+        self.forget_cycle()
+        # Des cellules ont pu mourir (états disparus)
+        self.publish()
+
+    def set_jump(self, jump):
+        """
+        Règle le saut des moteurs qui le permettent (HashLife : au plus 2^jump
+        générations par étape), pris en compte dès l'étape suivante. La grille
+        reste bornée : le moteur réduit le saut tant qu'une cellule pourrait
+        atteindre le bord pendant l'étape. Seules les générations atteintes en
+        fin d'étape sont publiées, et la détection des cycles est suspendue
+        pendant les sauts.
+
+        Args:
+            jump (int): Exposant du saut (0 = une génération par étape)
+
+        Raises:
+            ValueError: Si le saut est hors de 0..MAX_JUMP
+        """
+        if not 0 <= jump <= MAX_JUMP:
+            raise ValueError(f"Saut invalide : {jump} (de 0 à {MAX_JUMP})")
+        with self.swap_lock:
+            self.jump = int(jump)
+            # La région de l'étape suivante couvre 2^jump générations
+            self._clip()
+        # Les générations hachées avant le changement ne sont plus comparables
+        self.forget_cycle()
+
+    def _step_jump(self):
+        """
+        Saut de la prochaine étape : celui de set_jump, réduit pour ne pas
+        dépasser la génération d'arrêt (stop_at).
+
+        Returns:
+            int: Exposant du saut
+        """
+        jump, stop_at = self.jump, self.stop_at
+        if stop_at is not None:
+            while jump and self.gen_counter + (1 << jump) > stop_at:
+                jump -= 1
+        return jump
+
+    def set_speed(self, new_speed):
+        """
+        Modifie la vitesse de simulation de manière thread-safe.
+
+        Args:
+            new_speed (float): Nouvelle vitesse (générations par seconde, 0 = aussi vite que possible)
+        """
+        # Utilise le verrou pour garantir la cohérence
+        with self.speed_lock:
+            # Convertit en float pour s'assurer du type
+            self._speed = float(new_speed)
+        # Nouvelles échéances de publication (0 = aussi vite que possible)
+        self.scheduler.set_rate(self._speed)
+
+    def get_achieved_rate(self):
+        """
+        Retourne le débit réellement obtenu (mesuré par le planificateur).
+
+        Returns:
+            float: Générations publiées par seconde sur les dernières secondes
+        """
+        return self.scheduler.achieved_rate()
+
+    def get_speed(self):
+        """
+        Retourne la vitesse actuelle de la simulation.
+
+        Returns:
+            float: Vitesse actuelle (générations par seconde)
+        """
+        # Utilise le verrou pour garantir une lecture cohérente
+        with self.speed_lock:
+            return self._speed
+
+def engine_supports(candidate, engine, topology="plane"):
+    """
+    Indique si un moteur peut appliquer une règle sur une topologie
+    (capacités déclarées par les attributs de classe des moteurs).
+
+    Args:
+        candidate (gamelife_rules.Rule): Règle compilée
+        engine (str): Nom du moteur ("threads" ou un moteur de gamelife_engines)
+        topology (str): Condition aux bords
+
+    Returns:
+        bool: voir Simulation.supports_rule
+    """
+    # Le halo de la grille n'a qu'une cellule : les grands voisinages voient
+    # des cellules mortes au-delà des bords
+    if candidate.radius > 1 and topology != "plane":
+        return False
+    # Les capacités sont des attributs de classe des moteurs
+    engine_class = engines.ENGINES.get(engine)
+    # Mode "threads" : listes de 0 et de 1, règles à deux états et voisinage 3x3
+    if engine_class is None:
+        return candidate.states == 2 and candidate.radius == 1
+    if 0 in candidate.births and not engine_class.supports_b0:
+        return False
+    if candidate.radius > engine_class.max_radius:
+        return False
+    return candidate.states == 2 or engine_class.multistate
+
+def engine_candidates():
+    """
+    Moteurs parmi lesquels choose_engine choisit : le mode "threads" et les
+    moteurs enregistrés (engines.register_engine) utilisables ici, sauf les
+    univers infinis (leur résultat diffère de celui d'une grille bornée).
+
+    Returns:
+        list: Noms des moteurs
+    """
+    names = ["threads"]
+    for name, engine_class in sorted(engines.ENGINES.items()):
+        if engine_class.unbounded:
+            continue
+        if engine_class.requires_numpy and not engines.NUMPY_AVAILABLE:
+            continue
+        names.append(name)
+    return names
+
+def estimate_cost(model, size, density):
+    """
+    Durée prévue d'une génération selon un modèle de coût.
+
+    Args:
+        model (tuple): (fixe, par cellule, par cellule vivante), en secondes
+        size (int): Taille de la grille (n x n cellules)
+        density (float): Proportion de cellules vivantes
+
+    Returns:
+        float: Secondes par génération
+    """
+    fixed, per_cell, per_live = model
+    return fixed + size * size * (per_cell + per_live * density)
+
+_costs = {}  # Modèles de coût mesurés {moteur: modèle} (voir calibrate et load_calibration)
+_costs_lock = threading.Lock()  # Protège _costs et _calibration (simulations concurrentes)
+_calibration = None  # Thread de calibration en arrière-plan (None si aucun)
+
+def engine_costs():
+    """
+    Modèles de coût des moteurs candidats, sans rien mesurer : modèle mesuré
+    (calibrate, load_calibration) s'il existe, sinon modèle déclaré par le
+    moteur (voir declared_cost).
+
+    Returns:
+        dict: {moteur: (fixe, par cellule, par cellule vivante)}
+    """
+    with _costs_lock:
+        costs = dict(_costs)
+    for name in engine_candidates():
+        costs.setdefault(name, declared_cost(name))
+    return costs
+
+def load_calibration(path):
+    """
+    Reprend les modèles mesurés enregistrés par une calibration précédente
+    (sans mesurer ; ignorés s'ils viennent d'une machine avec un autre nombre
+    de cœurs, ou si le fichier est illisible).
+
+    Args:
+        path (str): Fichier de calibration (JSON)
+    """
+    stored = _load_calibration(path)
+    with _costs_lock:
+        for name, model in stored.items():
+            _costs.setdefault(name, model)
+
+def calibrate(path=None, background=False):
+    """
+    Mesure les moteurs candidats qui n'ont pas encore de modèle mesuré
+    (micro-benchmark, voir calibrate_engine), sur demande explicite : rien
+    n'est mesuré au démarrage ni par choose_engine. En arrière-plan (pendant
+    que l'interface tourne), les moteurs de BACKGROUND_SKIP ne sont pas mesurés
+    et une seule calibration tourne à la fois.
+
+    Args:
+        path (str, optional): Fichier de calibration (JSON) réécrit à la fin de
+            la mesure (None : modèles gardés en mémoire seulement)
+        background (bool): Mesure dans un thread et retourne sans attendre
+
+    Returns:
+        threading.Thread: Thread de la mesure en arrière-plan, None si la mesure
+            est terminée (ou s'il n'y a rien à mesurer)
+    """
+    global _calibration
+    with _costs_lock:
+        names = [name for name in engine_candidates() if name not in _costs
+                 and not (background and name in BACKGROUND_SKIP)]
+        if background and names and _calibration is None:
+            _calibration = threading.Thread(target=_calibrate, args=(path, names, True), daemon=True)
+            _calibration.start()
+        pending = _calibration if background else None
+    if names and not background:
+        _calibrate(path, names)
+    return pending
+
+def _calibrate(path, names, background=False):
+    """
+    Mesure des moteurs (voir calibrate), puis écriture du fichier de calibration.
+
+    Args:
+        path (str): Fichier de calibration (JSON), ou None
+        names (list): Moteurs à mesurer
+        background (bool): Thread d'arrière-plan (_calibration oublié à la fin)
     """
-    Arrête proprement tous les threads en cours.
+    global _calibration
+    try:
+        for name in names:
+            model = calibrate_engine(name)
+            with _costs_lock:
+                _costs[name] = model
+        with _costs_lock:
+            costs = dict(_costs)
+        if path is not None:
+            _save_calibration(path, costs)
+    finally:
+        if background:
+            with _costs_lock:
+                _calibration = None
+
+def declared_cost(name):
     """
-    global threads, stop_event
+    Modèle de coût déclaré par un moteur (attribut cost_model), utilisé tant
+    qu'il n'est pas mesuré.
 
-    # Vérifie s'il y a des threads à arrêter
-    if threads:
-        # Signale l'arrêt à tous les threads
-        stop_event.set()
-        # Laisse un peu de temps aux threads pour terminer proprement
-        time.sleep(0.1)
-        # Vide la liste des threads
-        threads = []
-        # Réinitialise l'événement d'arrêt pour une prochaine utilisation
-        stop_event.clear()
+    Args:
+        name (str): Nom du moteur ("threads" pour le mode sans moteur)
 
-def set_speed(new_speed):
+    Returns:
+        tuple: (fixe, par cellule, par cellule vivante), en secondes
+    """
+    engine_class = engines.ENGINES.get(name)
+    return engine_class.cost_model if engine_class is not None else THREADS_COST
+
+def calibrate_engine(name):
     """
-    Modifie la vitesse de simulation de manière thread-safe.
-    
+    Mesure le modèle de coût d'un moteur sur trois tirages aléatoires
+    (CALIBRATION_POINTS) : deux tailles à la même densité donnent le coût par
+    cellule, deux densités à la même taille le coût par cellule vivante.
+    Si la mesure échoue, le modèle déclaré par le moteur est conservé.
+
     Args:
-        new_speed (float): Nouvelle vitesse (générations par seconde)
+        name (str): Nom du moteur
+
+    Returns:
+        tuple: (fixe, par cellule, par cellule vivante), en secondes
     """
-    global _speed
-    # Utilise le verrou pour garantir la cohérence
-    with speed_lock:
-        # Convertit en float pour s'assurer du type
-        _speed = float(new_speed)
+    try:
+        (small, dense), (large, _), (_, sparse) = CALIBRATION_POINTS
+        t1, t2, t3 = (_measure(name, size, density) for size, density in CALIBRATION_POINTS)
+    except Exception:
+        return declared_cost(name)
+    per_live = max(0.0, (t2 - t3) / (large * large * (dense - sparse)))
+    per_cell = max(0.0, (t2 - t1) / (large * large - small * small) - per_live * dense)
+    fixed = max(0.0, t1 - small * small * (per_cell + per_live * dense))
+    return fixed, per_cell, per_live
 
-def get_speed():
+def _measure(name, size, density):
     """
-    Retourne la vitesse actuelle de la simulation.
-    
+    Durée d'une génération d'un moteur, mesurée sur une simulation privée
+    (threads, barrière et bilans compris : le coût réel d'une génération).
+
+    Args:
+        name (str): Nom du moteur
+        size (int): Taille de la grille
+        density (float): Proportion de cellules vivantes du tirage
+
     Returns:
-        float: Vitesse actuelle (générations par seconde)
+        float: Secondes par génération
+    """
+    sim = Simulation()
+    sim.keep_history = False
+    sim.publish_snapshots = False
+    sim.set_speed(0)
+    sim.start_workers(size, engine=name)
+    try:
+        sim.randomize_grid(sim.T, density)
+        sim.running.set()
+        first = sim.gen_counter
+        start = time.perf_counter()
+        # Au moins 3 générations et CALIBRATION_TIME secondes
+        while True:
+            time.sleep(CALIBRATION_TIME / 10)
+            generations = sim.gen_counter - first
+            elapsed = time.perf_counter() - start
+            if generations >= 3 and elapsed >= CALIBRATION_TIME:
+                return elapsed / generations
+    finally:
+        sim.running.clear()
+        sim.stop_workers()
+
+def _load_calibration(path):
     """
-    # Utilise le verrou pour garantir une lecture cohérente
-    with speed_lock:
-        return _speed
\ No newline at end of file
+    Lit les modèles de coût mesurés (ignorés s'ils viennent d'une machine
+    avec un autre nombre de cœurs, ou si le fichier est illisible).
+
+    Args:
+        path (str): Fichier de calibration
+
+    Returns:
+        dict: {moteur: modèle}
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("cpus") != os.cpu_count():
+            return {}
+        return {name: tuple(model) for name, model in data.get("engines", {}).items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+def _save_calibration(path, costs):
+    """
+    Écrit les modèles de coût mesurés (erreurs d'écriture ignorées : la
+    calibration sera refaite au prochain lancement).
+
+    Args:
+        path (str): Fichier de calibration
+        costs (dict): {moteur: modèle}
+    """
+    try:
+        with open(path, "w") as f:
+            json.dump({"cpus": os.cpu_count(), "engines": costs}, f, indent=2)
+    except OSError:
+        pass
+
+def iterate(initial, rule=None, engine=None, topology="plane", stride=1, generations=None):
+    """
+    Itère paresseusement sur les générations d'une grille, sans threads,
+    événements ni état global : le générateur possède son propre moteur et ses
+    deux grilles (la simulation de start_workers n'est pas touchée).
+
+        for gen, cells in core.iterate(state, rule="highlife", stride=10):
+            ...
+
+    Le calcul se limite à la boîte englobante élargie du rayon de la règle,
+    comme dans la simulation (voir region_around). Les arguments sont vérifiés
+    dès l'appel, avant la première génération.
+
+    Args:
+        initial: État initial (size + 2) x (size + 2), bordure comprise
+            (liste de listes comme make_grid, tableau NumPy ou copie de copy_grid)
+        rule (optional): Règle (gamelife_rules.Rule ou notation B/S, Larger than
+            Life, nom connu) ; Conway par défaut
+        engine (str, optional): Moteur ("threads" = Python pur sur listes, sans
+            thread ici) ; par défaut "numpy" si disponible, sinon "threads"
+        topology (str): Condition aux bords ("plane", "torus", "klein", "cross")
+        stride (int): Nombre de pas entre deux grilles produites
+        generations (int, optional): Dernière génération produite (None = sans fin)
+
+    Yields:
+        tuple: (génération, cellules), en commençant par la génération 0. Les
+            cellules sont l'intérieur size x size de la grille, en lecture seule :
+            tableau NumPy (vue sans copie de la grille d'un moteur à un octet par
+            cellule), ou tuple de tuples sans NumPy. Une vue n'est valable que
+            jusqu'à l'itération suivante (les deux grilles sont réutilisées) :
+            la copier pour la conserver.
+
+    Raises:
+        ValueError: Si la règle, le moteur, la topologie ou le pas est invalide,
+            ou si la règle n'est pas applicable par ce moteur
+    """
+    if stride < 1:
+        raise ValueError(f"Pas invalide : {stride} (au moins 1)")
+    if rule is None:
+        rule = rules.CONWAY
+    elif isinstance(rule, str):
+        rule = rules.compile_rule(rule)
+    if engine is None:
+        engine = "numpy" if engines.NUMPY_AVAILABLE else "threads"
+
+    # Moteur propre au générateur (None en mode "threads")
+    kernel = None
+    if engine != "threads":
+        kernel = engines.get_engine(engine)
+        if kernel is None:
+            raise ValueError(f"Moteur inconnu ou indisponible : {engine}")
+    supported = kernel.topologies if kernel is not None else engines.TOPOLOGIES
+    if topology not in supported:
+        if kernel is not None:
+            kernel.close()
+        raise ValueError(f"Topologie {topology} non gérée par le moteur {engine}")
+    if not engine_supports(rule, engine, topology):
+        if kernel is not None:
+            kernel.close()
+        raise ValueError(f"Règle {rule.name} non applicable par le moteur {engine} ({topology})")
+    if kernel is not None:
+        kernel.set_rule(rule)
+    return _generations(initial, kernel, rule, topology, stride, generations)
+
+def _generations(initial, kernel, rule, topology, stride, generations):
+    """
+    Générateur de iterate (arguments déjà vérifiés).
+
+    Args:
+        initial: État initial (size + 2) x (size + 2)
+        kernel: Moteur du générateur (None = Python pur sur listes)
+        rule (gamelife_rules.Rule): Règle compilée
+        topology (str): Condition aux bords
+        stride (int): Nombre de pas entre deux grilles produites
+        generations (int, optional): Dernière génération produite
+
+    Yields:
+        tuple: (génération, cellules), voir iterate
+    """
+    size = len(initial) - 2
+    try:
+        # Deux grilles dans le format du moteur, l'état initial dans la première
+        if kernel is not None:
+            src, dst = kernel.make_grid(size), kernel.make_grid(size)
+            kernel.load(src, initial)
+            if kernel.multistate:
+                kernel.clip_states(src, rule.states)
+            kernel.wrap(src, topology)
+        else:
+            src, dst = make_grid(size), make_grid(size)
+            for i in range(min(len(initial), size + 2)):
+                # Deux états : une cellule mourante (règle Generations) est morte
+                cells = [1 if value == 1 else 0 for value in initial[i]][:size + 2]
+                src[i][:len(cells)] = cells
+            engines.wrap_list(src, topology)
+
+        # Régions limitées : moteurs vectorisés (clips) et Python pur
+        clips = kernel.clips if kernel is not None else True
+        steps = kernel.generations_per_step if kernel is not None else 1
+        find = kernel.bounds if kernel is not None else engines.bounds_lists
+        box = stale = None
+        if clips:
+            box = find(src)
+
+        gen = 0
+        yield gen, _interior(src, kernel)
+        while generations is None or gen + stride * steps <= generations:
+            for _ in range(stride):
+                region = region_around(box, rule, size, topology, steps) if clips else None
+                if kernel is None:
+                    engines.step_lists(src, dst, rule.table, 1, size + 1, region, stale)
+                else:
+                    if clips:
+                        kernel.set_region(region, stale)
+                    kernel.step(src, dst)
+                # La grille calculée devient la grille actuelle ; l'ancienne
+                # garde sa boîte, effacée au prochain pas hors de la région
+                src, dst = dst, src
+                gen += steps
+                if topology != "plane":
+                    if kernel is not None:
+                        kernel.wrap(src, topology)
+                    else:
+                        engines.wrap_list(src, topology)
+                if clips:
+                    stale, box = box, find(src, region)
+            yield gen, _interior(src, kernel)
+    finally:
+        # Libère les ressources du moteur (processus, mémoire partagée...)
+        if kernel is not None:
+            kernel.close()
+
+def _interior(grid, kernel):
+    """
+    Intérieur size x size d'une grille, en lecture seule.
+
+    Args:
+        grid: Grille (liste de listes ou grille du moteur)
+        kernel: Moteur de la grille (None = liste de listes)
+
+    Returns:
+        numpy.ndarray ou tuple: Vue sans copie pour une grille d'octets, copie
+            sinon (tuple de tuples sans NumPy)
+    """
+    if not engines.NUMPY_AVAILABLE:
+        # Grille du moteur convertie en listes (moteurs en Python pur)
+        if not isinstance(grid, list):
+            grid = kernel.to_list(grid)
+        return tuple(tuple(row[1:-1]) for row in grid[1:-1])
+    if isinstance(grid, list):
+        cells = engines.np.array(grid, dtype=engines.np.uint8)
+    else:
+        cells = kernel.to_array(grid)
+    view = cells[1:-1, 1:-1]
+    view.flags.writeable = False
+    return view
+
+# Simulation par défaut : celle de l'interface graphique et du mode sans interface
+default = Simulation()
+
+# Fonctions du module : méthodes de la simulation par défaut
+grid_bytes = default.grid_bytes
+estimate_memory = default.estimate_memory
+plan_grid = default.plan_grid
+get_cell = default.get_cell
+set_cell = default.set_cell
+publish = default.publish
+grid_to_list = default.grid_to_list
+grid_to_array = default.grid_to_array
+load_grid = default.load_grid
+has_living_cells = default.has_living_cells
+randomize_grid = default.randomize_grid
+clear_grid = default.clear_grid
+refresh_halo = default.refresh_halo
+forget_cycle = default.forget_cycle
+count_living = default.count_living
+recount = default.recount
+get_stats = default.get_stats
+find_bounds = default.find_bounds
+rebound = default.rebound
+mark_dirty = default.mark_dirty
+take_dirty_cells = default.take_dirty_cells
+record_history = default.record_history
+restore_history = default.restore_history
+can_undo = default.can_undo
+can_redo = default.can_redo
+barrier_action = default.barrier_action
+compute_rows = default.compute_rows
+band_thread = default.band_thread
+start_workers = default.start_workers
+stop_workers = default.stop_workers
+supports_rule = default.supports_rule
+choose_engine = default.choose_engine
+set_rule = default.set_rule
+set_jump = default.set_jump
+set_speed = default.set_speed
+get_achieved_rate = default.get_achieved_rate
+get_speed = default.get_speed
+
+class _Facade(types.ModuleType):
+    """
+    Type du module gamelife_core : ses variables d'état (T, n, gen_counter,
+    running, rule...) sont les attributs de la simulation par défaut, en
+    lecture comme en écriture (core.n = 50 modifie default.n).
+    """
+
+def _forward(name):
+    """
+    Propriété du module qui redirige une variable vers la simulation par défaut.
+
+    Args:
+        name (str): Nom de l'attribut de Simulation
+
+    Returns:
+        property: Accès en lecture et en écriture
+    """
+    return property(lambda module: getattr(default, name),
+                    lambda module, value: setattr(default, name, value))
+
+# Une propriété par attribut créé dans Simulation.__init__
+for _name in vars(default):
+    setattr(_Facade, _name, _forward(_name))
+sys.modules[__name__].__class__ = _Facade
@@ -0,0 +1,154 @@
+"""
+Game of Life - Détection des cycles
+Une soupe aléatoire finit presque toujours en « cendres » : natures mortes et
+oscillateurs de petite période. Ce module reconnaît un état déjà rencontré :
+- Hachage de Zobrist sur 64 bits : OU exclusif d'une clé par unité de stockage
+  non nulle (ligne d'une grille en listes, mot de 8 ou 64 cellules d'une
+  grille vectorisée), la clé dépendant de la position et de la valeur de l'unité
+- Mise à jour incrémentale : seules les unités modifiées par la génération
+  changent le hachage (clé de l'ancienne valeur et clé de la nouvelle)
+- Table bornée (HISTORY_SIZE générations) : un état répété donne la période
+  et la génération de début du cycle (période 1 = nature morte)
+
+Les unités modifiées sont fournies par la méthode diff des moteurs ; le
+hachage d'une grille dépend donc du moteur et n'est comparé qu'au sein d'une
+même simulation.
+"""
+
+from collections import OrderedDict
+
+import gamelife_engines as engines
+
+np = engines.np
+
+# Nombre de générations mémorisées (période maximale détectée)
+HISTORY_SIZE = 4096
+
+# Constantes du mélangeur (clés de Zobrist calculées, sans table par position)
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+def unit_key(position, value):
+    """
+    Clé de Zobrist d'une unité de stockage (Python pur).
+
+    Args:
+        position (int): Position de l'unité dans la grille
+        value (int): Valeur de l'unité (mot de cellules ou empreinte d'une ligne)
+
+    Returns:
+        int: Clé sur 64 bits (0 pour une unité nulle)
+    """
+    if not value:
+        return 0
+    z = ((position * _GOLDEN) ^ value) & _MASK64
+    z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+    z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+    return z ^ (z >> 31)
+
+def _unit_keys(positions, values):
+    """
+    Clés de Zobrist d'un ensemble d'unités (vectorisé, mêmes valeurs que unit_key).
+
+    Args:
+        positions (numpy.ndarray): Positions des unités
+        values (numpy.ndarray): Valeurs des unités
+
+    Returns:
+        numpy.ndarray: Clés uint64 (0 pour une unité nulle)
+    """
+    u64 = np.uint64
+    values = values.astype(u64, copy=False)
+    z = (positions.astype(u64) * u64(_GOLDEN)) ^ values
+    z ^= z >> u64(30)
+    z *= u64(_MIX1)
+    z ^= z >> u64(27)
+    z *= u64(_MIX2)
+    z ^= z >> u64(31)
+    # Une unité nulle n'a pas de clé (grille vide : hachage 0)
+    z[values == 0] = 0
+    return z
+
+def zobrist_delta(positions, before, after):
+    """
+    Modification du hachage due à un ensemble d'unités modifiées.
+
+    Args:
+        positions: Positions des unités (liste ou tableau NumPy)
+        before: Valeurs avant la modification
+        after: Valeurs après la modification
+
+    Returns:
+        int: Valeur à combiner au hachage par OU exclusif
+    """
+    if np is not None and isinstance(positions, np.ndarray):
+        if not len(positions):
+            return 0
+        keys = _unit_keys(positions, before)
+        keys ^= _unit_keys(positions, after)
+        return int(np.bitwise_xor.reduce(keys))
+    delta = 0
+    for position, old, new in zip(positions, before, after):
+        delta ^= unit_key(position, old) ^ unit_key(position, new)
+    return delta
+
+def batch_hashes(units):
+    """
+    Hachages de Zobrist de toutes les grilles d'un lot (voir gamelife_ensemble),
+    calculés en une fois : mêmes clés que unit_key, la position d'une unité
+    étant son rang dans sa grille.
+
+    Args:
+        units (numpy.ndarray): Unités de stockage, forme (grilles, unités par grille)
+
+    Returns:
+        numpy.ndarray: Hachage uint64 de chaque grille
+    """
+    positions = np.broadcast_to(np.arange(units.shape[1], dtype=np.uint64), units.shape)
+    return np.bitwise_xor.reduce(_unit_keys(positions, units), axis=1)
+
+class CycleDetector:
+    """
+    Hachage incrémental des générations et table des états déjà rencontrés.
+    """
+
+    def __init__(self, capacity=HISTORY_SIZE):
+        """
+        Args:
+            capacity (int): Nombre de générations mémorisées
+        """
+        self.capacity = capacity
+        self.hash = None  # Hachage de la génération actuelle (None = à recalculer)
+        self._seen = OrderedDict()  # {hachage: génération}, de la plus ancienne à la plus récente
+
+    def reset(self):
+        """
+        Oublie les générations mémorisées (grille modifiée hors calcul, nouvelle règle).
+        """
+        self.hash = None
+        self._seen.clear()
+
+    def record(self, generation, changes):
+        """
+        Met à jour le hachage avec les unités modifiées et cherche un état répété.
+
+        Args:
+            generation (int): Numéro de la génération actuelle
+            changes (tuple): (positions, valeurs avant, valeurs après) des unités
+                modifiées depuis la génération précédente, ou depuis une grille
+                vide après reset()
+
+        Returns:
+            tuple: (période, génération de début du cycle), ou None
+        """
+        self.hash = (self.hash or 0) ^ zobrist_delta(*changes)
+        first = self._seen.get(self.hash)
+        if first is not None:
+            return generation - first, first
+        self._seen[self.hash] = generation
+        # Table bornée : la génération la plus ancienne est oubliée
+        if len(self._seen) > self.capacity:
+            self._seen.popitem(last=False)
+        return None
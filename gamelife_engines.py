@@ -0,0 +1,1967 @@
+"""
+Game of Life - Moteurs de calcul vectorisés
+Contient les moteurs alternatifs au modèle "un thread par cellule" :
+- Moteur NumPy : calcul d'une génération complète par sommes de tableaux décalés
+- Moteur bit-packed : 64 cellules par mot, additionneurs bit à bit
+- Moteur à région active : seules les cellules modifiées et leurs voisines sont recalculées
+
+Tous les moteurs appliquent une règle compilée de gamelife_rules (set_rule) :
+les moteurs vectorisés la traduisent en une expression booléenne sur le nombre
+de voisins (rule_terms), les moteurs en Python pur lisent directement la table.
+L'expression est lue dans la forme réduite de la table (Rule.outcomes, un état
+par nombre de voisins) : elle n'est exacte que pour une table totalistique
+extérieure, ce que rule_terms vérifie.
+Les règles Generations (plusieurs états par cellule) sont réservées aux moteurs
+dont la grille contient un octet par cellule (NumPy, attribut multistate).
+Les règles Larger than Life (rayon R > 1, attribut max_radius) sont calculées par
+le moteur NumPy avec une table de sommes cumulées : le coût par cellule ne
+dépend pas de R.
+
+Chaque moteur fournit aussi les accesseurs de sa grille (get_cell, set_cell,
+to_list, load, ...) : le stockage et la bordure restent des détails internes.
+La méthode bounds donne la boîte englobante des cellules non nulles ; les
+moteurs vectorisés (attribut clips) limitent leur calcul à la région fournie
+par set_region (boîte de la génération actuelle élargie du rayon de la règle).
+L'attribut cost_model (coût fixe, par cellule et par cellule vivante d'une
+génération) sert au choix automatique du moteur ; gamelife_core le recalibre
+sur la machine.
+
+Dépendance optionnelle:
+- NumPy: nécessaire pour les moteurs vectorisés (pas pour le moteur à région active)
+  Installation: pip install numpy
+"""
+
+import operator
+import random
+
+import gamelife_rules as rules
+
+# Import optionnel de NumPy (le jeu fonctionne sans, avec le moteur "threads")
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Indique si les moteurs vectorisés sont utilisables
+NUMPY_AVAILABLE = np is not None
+
+# Conditions aux bords (voir wrap) :
+# - "plane" : bordure morte (les cellules qui sortent meurent)
+# - "torus" : les bords opposés sont recollés
+# - "klein" : bouteille de Klein, haut et bas recollés en miroir
+# - "cross" : plan projectif (cross-surface), les deux paires de bords en miroir
+TOPOLOGIES = ("plane", "torus", "klein", "cross")
+
+# Symétries d'une soupe aléatoire (voir random_soup) :
+# - "C1" : aucune
+# - "C2" : invariante par demi-tour
+# - "C4" : invariante par quart de tour (région carrée)
+# - "D8" : invariante par quart de tour et par réflexion (région carrée)
+SYMMETRIES = ("C1", "C2", "C4", "D8")
+
+# Nombre de lignes calculées d'un bloc par le moteur bit-packed
+# (les tableaux intermédiaires d'une bande tiennent dans le cache)
+BAND_ROWS = 256
+
+def rule_terms(rule):
+    """
+    Traduit la table d'une règle en termes d'une expression booléenne :
+    la cellule est vivante à la génération suivante si l'un des termes est vrai.
+    Les termes sont lus dans rule.outcomes : la table ne doit dépendre que de
+    l'état de la cellule et du nombre de ses voisins (règle totalistique
+    extérieure, comme toutes les règles B/S compilées).
+
+    Args:
+        rule (gamelife_rules.Rule): Règle compilée
+
+    Returns:
+        tuple: Couples (voisins, état) ; état vaut 0 (naissance seule),
+            1 (survie seule) ou None (quel que soit l'état de la cellule)
+
+    Raises:
+        ValueError: Si la table distingue deux voisinages de même état et de
+            même nombre de voisins (seule la table peut alors être lue)
+    """
+    for mask in range(512):
+        alive = (mask >> rules.CENTER_BIT) & 1
+        neighbors = bin(mask).count("1") - alive
+        if rule.table[mask] != rule.outcomes[alive * 9 + neighbors]:
+            raise ValueError(f"Règle non totalistique : {rule.name}")
+
+    terms = []
+    for neighbors in range(9):
+        birth = rule.outcomes[neighbors]
+        survival = rule.outcomes[9 + neighbors]
+        # Avec plus de deux états, une cellule mourante ne naît ni ne survit :
+        # naissance et survie restent deux termes distincts
+        if birth and survival and rule.states == 2:
+            terms.append((neighbors, None))
+        else:
+            if birth:
+                terms.append((neighbors, 0))
+            if survival:
+                terms.append((neighbors, 1))
+    return tuple(terms)
+
+# Termes de la règle de Conway (règle par défaut de tous les moteurs)
+CONWAY_TERMS = rule_terms(rules.CONWAY)
+
+class NumpyEngine:
+    """
+    Moteur vectorisé basé sur NumPy.
+    La grille est un tableau uint8 de taille (n + 2) x (n + 2) avec la même
+    convention de bordure que make_grid : la couronne extérieure reste à 0.
+    """
+
+    name = "numpy"  # Nom du moteur (utilisé par start_workers)
+    requires_numpy = True  # Le moteur nécessite NumPy
+    changed = None  # Cellules modifiées par la dernière génération (None = non suivi)
+    generations_per_step = 1  # Générations calculées par appel à step
+    jumps = False  # Nombre de générations par étape fixe (voir HashLifeEngine.set_jump)
+    splittable = True  # Le calcul peut être réparti en bandes de lignes (step_rows)
+    unbounded = False  # La grille est bornée (les cellules hors bordure meurent)
+    topologies = TOPOLOGIES  # Conditions aux bords gérées par wrap
+    supports_b0 = True  # Les règles B0 (naissance sans voisin) sont gérées
+    multistate = True  # Les règles Generations (jusqu'à 256 états) sont gérées
+    max_radius = rules.MAX_RADIUS  # Rayon maximal des règles Larger than Life
+    clips = True  # Le calcul se limite à une région de la grille (voir set_region)
+    tallies = True  # Naissances et morts peuvent être comptées pendant le calcul (voir set_tally)
+    # Modèle de coût d'une génération (secondes) : fixe, par cellule, par cellule
+    # vivante ; estimation par défaut, remplacée par la calibration de gamelife_core
+    cost_model = (1e-4, 1e-9, 1e-8)
+    rule = rules.CONWAY  # Règle appliquée (voir set_rule)
+    region = None  # Région calculée (haut, gauche, bas, droite), None = toute la grille
+    stale = None  # Boîte des cellules non nulles de la grille suivante (None = aucune)
+    tally = False  # Naissances et morts comptées pendant le calcul (voir set_tally)
+    _tally = None  # Naissances et morts de chaque bande de lignes (première ligne -> couple)
+    _terms = CONWAY_TERMS  # Règle traduite en expression booléenne (None : Larger than Life)
+
+    def set_rule(self, rule):
+        """
+        Change la règle appliquée aux générations suivantes.
+
+        Args:
+            rule (gamelife_rules.Rule ou RangeRule): Règle compilée
+        """
+        self.rule = rule
+        self._terms = rule_terms(rule) if rule.table is not None else None
+
+    def set_region(self, region, stale=None):
+        """
+        Limite les générations suivantes à une région : hors de cette région,
+        toutes les cellules de la génération suivante sont mortes.
+
+        Args:
+            region (tuple): (haut, gauche, bas, droite), bornes bas et droite
+                exclues, ou None pour toute la grille
+            stale (tuple, optional): Boîte des cellules non nulles de la grille
+                suivante (génération précédente), remises à 0 hors de la région
+        """
+        self.region = region
+        self.stale = stale
+
+    def set_tally(self, enabled):
+        """
+        Active le comptage des naissances et des morts pendant le calcul :
+        chaque bande compte les cellules qu'elle calcule, census additionne
+        les bandes sans comparer les deux grilles.
+
+        Args:
+            enabled (bool): True pour compter à chaque génération
+        """
+        self.tally = enabled
+        self._tally = {}
+
+    def _count_block(self, band, alive, born):
+        """
+        Compte les naissances et les morts d'un bloc calculé.
+
+        Args:
+            band (int): Première ligne de la bande (clé du bilan)
+            alive (numpy.ndarray): Cellules vivantes (état 1) de la génération actuelle
+            born (numpy.ndarray): Cellules vivantes de la génération suivante
+        """
+        # Cellules modifiées et variation de la population du bloc
+        flips = int(np.count_nonzero(born ^ alive))
+        delta = int(np.count_nonzero(born)) - int(np.count_nonzero(alive))
+        self._tally[band] = ((flips + delta) // 2, (flips - delta) // 2)
+
+    def _restrict(self, dst, r0, r1):
+        """
+        Efface la génération précédente sur les lignes r0 à r1 - 1 de dst, puis
+        restreint ces lignes à la région calculée.
+
+        Args:
+            dst (numpy.ndarray): Grille suivante (Tnext), modifiée sur place
+            r0 (int): Première ligne de la bande
+            r1 (int): Ligne de fin exclue
+
+        Returns:
+            tuple: (r0, r1, c0, c1) lignes et colonnes à calculer (vides si
+                la région ne croise pas la bande)
+        """
+        top, left, bottom, right = self.region
+        if self.stale is not None:
+            s_top, s_left, s_bottom, s_right = self.stale
+            if max(r0, s_top) < min(r1, s_bottom):
+                self._erase(dst, max(r0, s_top), min(r1, s_bottom), s_left, s_right)
+        return max(r0, top), min(r1, bottom), left, right
+
+    def _erase(self, grid, r0, r1, c0, c1):
+        """
+        Remet à 0 un rectangle de cellules.
+
+        Args:
+            grid (numpy.ndarray): Grille modifiée sur place
+            r0, r1 (int): Lignes r0 à r1 - 1
+            c0, c1 (int): Colonnes c0 à c1 - 1
+        """
+        grid[r0:r1, c0:c1] = 0
+
+    def make_grid(self, size):
+        """
+        Crée une grille NumPy de taille (size + 2) x (size + 2).
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            numpy.ndarray: Grille 2D uint8 initialisée à 0
+        """
+        return np.zeros((size + 2, size + 2), dtype=np.uint8)
+
+    def grid_bytes(self, size):
+        """
+        Estime la mémoire occupée par une grille (utilisé avant de la créer).
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            int: Nombre d'octets (une cellule par octet)
+        """
+        return (size + 2) * (size + 2)
+
+    def step(self, src, dst):
+        """
+        Calcule la génération suivante de src et l'écrit dans dst.
+        Le nombre de voisins de toutes les cellules est obtenu en une fois
+        en additionnant les 8 vues décalées de la grille.
+
+        Args:
+            src (numpy.ndarray): Grille actuelle (T)
+            dst (numpy.ndarray): Grille suivante (Tnext), modifiée sur place
+        """
+        self.step_rows(src, dst, 1, src.shape[0] - 1)
+
+    def step_rows(self, src, dst, r0, r1):
+        """
+        Calcule les lignes r0 à r1 - 1 de la génération suivante
+        (bande d'un thread du pool de gamelife_core).
+
+        Args:
+            src (numpy.ndarray): Grille actuelle (T)
+            dst (numpy.ndarray): Grille suivante (Tnext), modifiée sur place
+            r0 (int): Première ligne calculée (>= 1)
+            r1 (int): Ligne de fin exclue (<= n + 1)
+        """
+        # Région limitée : seules ses cellules peuvent être non nulles
+        band, c0, c1 = r0, 1, src.shape[1] - 1
+        if self.region is not None:
+            r0, r1, c0, c1 = self._restrict(dst, r0, r1)
+            if r0 >= r1 or c0 >= c1:
+                if self.tally:
+                    self._tally[band] = (0, 0)
+                return
+
+        # Règle Larger than Life : voisinage de rayon R
+        if self._terms is None:
+            self._step_range(src, dst, r0, r1, c0, c1, band)
+            return
+
+        # Lignes r0 - 1 à r1 et colonnes c0 - 1 à c1 : le bloc et ses voisines
+        rows = src[r0 - 1:r1 + 1, c0 - 1:c1 + 1]
+        states = self.rule.states
+        # Règle Generations : seules les cellules vivantes (état 1) sont des voisines
+        live = rows if states == 2 else (rows == 1).view(np.uint8)
+
+        # Somme des 8 voisins pour toutes les cellules de la bande
+        # Chaque vue est la grille décalée d'une case dans une direction
+        neighbors = (
+            live[:-2, :-2] + live[:-2, 1:-1] + live[:-2, 2:] +  # Ligne du dessus
+            live[1:-1, :-2] + live[1:-1, 2:] +  # Ligne du milieu (gauche et droite)
+            live[2:, :-2] + live[2:, 1:-1] + live[2:, 2:]  # Ligne du dessous
+        )
+
+        # Règle en une seule expression booléenne (pour Conway :
+        # 3 voisins, ou 2 voisins pour une cellule vivante)
+        cells = rows[1:-1, 1:-1]
+        born = _apply_terms(self._terms, neighbors, cells)
+        dst[r0:r1, c0:c1] = born if states == 2 else _age(cells, born, states)
+        if self.tally:
+            self._count_block(band, cells.view(bool) if states == 2 else cells == 1, born)
+
+    def _step_range(self, src, dst, r0, r1, c0=1, c1=None, band=None):
+        """
+        Calcule le bloc des lignes r0 à r1 - 1 et des colonnes c0 à c1 - 1
+        avec une règle Larger than Life.
+        Le nombre de voisins de chaque cellule est lu dans une table de sommes
+        cumulées (summed-area table) : quatre lectures par cellule quel que
+        soit le rayon, au lieu de (2R + 1)^2 additions. Les cellules hors de
+        la grille sont mortes.
+
+        Args:
+            src (numpy.ndarray): Grille actuelle (T)
+            dst (numpy.ndarray): Grille suivante (Tnext), modifiée sur place
+            r0 (int): Première ligne calculée (>= 1)
+            r1 (int): Ligne de fin exclue (<= n + 1)
+            c0 (int): Première colonne calculée (>= 1)
+            c1 (int, optional): Colonne de fin exclue (par défaut : n + 1)
+            band (int, optional): Première ligne de la bande (clé du bilan,
+                par défaut : r0)
+        """
+        rule = self.rule
+        radius = rule.radius
+        side = 2 * radius + 1
+        last = src.shape[0] - 1  # Ligne de bordure du bas
+        if c1 is None:
+            c1 = src.shape[1] - 1
+
+        # Cellules vivantes des lignes r0 - R à r1 + R - 1 et des colonnes
+        # c0 - R à c1 + R - 1 (les cellules hors de la grille sont mortes)
+        low, high = max(1, r0 - radius), min(last, r1 + radius)
+        left, right = max(1, c0 - radius), min(src.shape[1] - 1, c1 + radius)
+        padded = np.zeros((r1 - r0 + 2 * radius, c1 - c0 + 2 * radius), dtype=np.int32)
+        padded[low - (r0 - radius):high - (r0 - radius),
+               left - (c0 - radius):right - (c0 - radius)] = src[low:high, left:right] == 1
+
+        # Table des sommes cumulées : sums[i, j] = cellules vivantes du rectangle [0, i) x [0, j)
+        sums = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.int32)
+        np.cumsum(padded, axis=0, out=padded)
+        np.cumsum(padded, axis=1, out=sums[1:, 1:])
+
+        # Voisins de chaque cellule : somme du carré de côté 2R + 1 centré sur elle
+        neighbors = sums[side:, side:] - sums[:-side, side:] - sums[side:, :-side] + sums[:-side, :-side]
+        cells = src[r0:r1, c0:c1]
+        if not rule.middle:
+            neighbors -= cells == 1
+
+        # Survie d'une cellule vivante, naissance d'une cellule morte (intervalles)
+        b0, b1 = rule.birth_range
+        s0, s1 = rule.survival_range
+        born = np.where(
+            cells == 1,
+            (neighbors >= s0) & (neighbors <= s1),
+            (cells == 0) & (neighbors >= b0) & (neighbors <= b1),
+        )
+        dst[r0:r1, c0:c1] = born if rule.states == 2 else _age(cells, born, rule.states)
+        if self.tally:
+            self._count_block(r0 if band is None else band, cells == 1, born)
+
+    def clip_states(self, grid, states):
+        """
+        Tue les cellules dont l'état n'existe pas dans une règle à states états
+        (après un changement de règle ou le chargement d'un état).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, modifiée sur place
+            states (int): Nombre d'états de la règle
+        """
+        grid[grid >= states] = 0
+
+    def get_cell(self, grid, i, j):
+        """
+        Retourne l'état de la cellule (i, j).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 si elle est morte,
+                2 et plus pour une cellule mourante (règles Generations)
+        """
+        return int(grid[i, j])
+
+    def set_cell(self, grid, i, j, value):
+        """
+        Modifie l'état de la cellule (i, j).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+            value (int): Nouvel état (1 = vivante, 0 = morte)
+        """
+        grid[i, j] = 1 if value else 0
+
+    def to_array(self, grid):
+        """
+        Retourne la grille sous forme de tableau uint8 (n + 2) x (n + 2).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+
+        Returns:
+            numpy.ndarray: Tableau d'octets (une cellule par octet)
+        """
+        return grid
+
+    def to_list(self, grid):
+        """
+        Convertit la grille en liste de listes (format de make_grid).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+
+        Returns:
+            list: Grille 2D sous forme de listes Python
+        """
+        return self.to_array(grid).tolist()
+
+    def load(self, grid, state):
+        """
+        Copie un état (liste de listes ou grille du moteur) dans la grille.
+        Si les tailles diffèrent, seule la partie commune est copiée.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, modifiée sur place
+            state: État à restaurer
+        """
+        # Convertit l'état en tableau d'octets de cellules
+        cells = _as_cells(state)
+        # Copie uniquement la zone commune aux deux grilles
+        rows = min(cells.shape[0], grid.shape[0])
+        cols = min(cells.shape[1], grid.shape[1])
+        grid[:rows, :cols] = cells[:rows, :cols]
+
+    def any(self, grid):
+        """
+        Indique si au moins une cellule est vivante.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+
+        Returns:
+            bool: True si une cellule est vivante
+        """
+        return bool(grid.any())
+
+    def bounds(self, grid, region=None):
+        """
+        Boîte englobante des cellules non nulles (vivantes ou mourantes) de
+        l'intérieur de la grille : maximum de chaque ligne, puis de chaque
+        colonne des lignes occupées.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+            region (tuple, optional): Région contenant toutes les cellules non
+                nulles (par défaut : toute la grille)
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), bornes bas et droite exclues,
+                ou None si la grille est vide
+        """
+        top, left, bottom, right = region or (1, 1, grid.shape[0] - 1, grid.shape[1] - 1)
+        if top >= bottom or left >= right:
+            return None
+        cells = grid[top:bottom, left:right]
+        rows = np.flatnonzero(cells.max(axis=1))
+        if not len(rows):
+            return None
+        cols = np.flatnonzero(cells[rows[0]:rows[-1] + 1].max(axis=0))
+        return (top + int(rows[0]), left + int(cols[0]),
+                top + int(rows[-1]) + 1, left + int(cols[-1]) + 1)
+
+    def diff(self, old, new, region=None):
+        """
+        Mots de 8 cellules (uint64) qui diffèrent entre deux grilles, bordure
+        comprise : unités du hachage de gamelife_cycles.
+
+        Args:
+            old (numpy.ndarray): Grille précédente (None = grille vide)
+            new (numpy.ndarray): Grille actuelle
+            region (tuple, optional): Région calculée par la génération (voir
+                set_region) : hors de ses lignes, les deux grilles sont
+                identiques et ne sont pas comparées (None : toute la grille)
+
+        Returns:
+            tuple: (positions, valeurs avant, valeurs après), tableaux NumPy
+        """
+        new_words, new_tail = _as_words(new)
+        if old is None:
+            old_words = old_tail = None
+        else:
+            old_words, old_tail = _as_words(old)
+
+        # Mots qui recouvrent les lignes de la région (les mots chevauchent deux lignes)
+        first, last = 0, len(new_words)
+        if region is not None and old is not None:
+            width = new.shape[1]
+            first = min(last, region[0] * width // 8)
+            last = min(last, -(-region[2] * width // 8))
+            old_words = old_words[first:last]
+        changes = _diff_words(old_words, new_words[first:last])
+        if first:
+            changes = (changes[0] + first,) + changes[1:]
+        if last < len(new_words):
+            return changes
+
+        # Mot final (octets restants) : position suivant le dernier mot complet
+        tail = _diff_words(old_tail, new_tail)
+        if not len(tail[0]):
+            return changes
+        return tuple(np.concatenate((part, extra)) for part, extra in zip(changes, (tail[0] + len(new_words),) + tail[1:]))
+
+    def count(self, grid):
+        """
+        Compte les cellules vivantes (état 1) de l'intérieur de la grille.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+
+        Returns:
+            int: Nombre de cellules vivantes
+        """
+        return int(np.count_nonzero(grid[1:-1, 1:-1] == 1))
+
+    def census(self, old, new, changes):
+        """
+        Naissances et morts entre deux grilles : bilan des bandes si elles ont
+        été comptées pendant le calcul (voir set_tally), sinon comptage sur les
+        seuls mots modifiés (voir diff) ; la bordure (halo) est exclue.
+
+        Args:
+            old (numpy.ndarray): Grille précédente
+            new (numpy.ndarray): Grille actuelle
+            changes (tuple): Résultat de diff(old, new) (inutile, et peut
+                valoir None, si les bandes ont été comptées)
+
+        Returns:
+            tuple: (naissances, morts) : cellules entrées dans l'état 1 ou sorties de l'état 1
+        """
+        if self.tally:
+            return self._tallied()
+        _, before, after = changes
+        if self.rule.states == 2:
+            # Octets à 0 ou 1 : un bit à 1 par cellule vivante, comptage sur les mots
+            births, deaths = _popcount(after & ~before), _popcount(before & ~after)
+        else:
+            was = before.view(np.uint8) == 1
+            now = after.view(np.uint8) == 1
+            births, deaths = int(np.count_nonzero(now & ~was)), int(np.count_nonzero(was & ~now))
+        # Les mots comprennent la bordure (halo) : ses cellules sont retirées
+        ring_old = np.concatenate((old[0], old[-1], old[1:-1, 0], old[1:-1, -1])) == 1
+        ring_new = np.concatenate((new[0], new[-1], new[1:-1, 0], new[1:-1, -1])) == 1
+        return (births - int(np.count_nonzero(ring_new & ~ring_old)),
+                deaths - int(np.count_nonzero(ring_old & ~ring_new)))
+
+    def _tallied(self):
+        """
+        Additionne les bilans des bandes de la dernière génération.
+
+        Returns:
+            tuple: (naissances, morts)
+        """
+        counts = list(self._tally.values())
+        return sum(births for births, _ in counts), sum(deaths for _, deaths in counts)
+
+    def clear(self, grid):
+        """
+        Tue toutes les cellules de la grille.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, modifiée sur place
+        """
+        grid[...] = 0
+
+    def randomize(self, grid, density=0.25, seed=None, region=None, symmetry="C1"):
+        """
+        Remplit une région de la grille d'une soupe aléatoire (voir random_soup),
+        écrite en une seule affectation ; le reste de la grille est vidé.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, modifiée sur place
+            density (float): Proportion de cellules vivantes
+            seed (int, optional): Graine de la soupe
+            region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+                en coordonnées de la grille (None : tout l'intérieur)
+            symmetry (str): Symétrie de la soupe (voir SYMMETRIES)
+        """
+        top, left, bottom, right = region or (1, 1, grid.shape[0] - 1, grid.shape[1] - 1)
+        cells = random_soup(bottom - top, right - left, density, seed, symmetry)
+        if region is not None:
+            grid[...] = 0
+        grid[top:bottom, left:right] = cells
+
+    def wrap(self, grid, topology):
+        """
+        Remplit la bordure (halo) de la grille selon la topologie, une fois par
+        génération : les noyaux lisent ensuite leurs voisins sans modulo.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, bordure modifiée sur place
+            topology (str): Condition aux bords (voir TOPOLOGIES)
+        """
+        if topology == "plane":
+            # Bordure morte
+            grid[0] = grid[-1] = 0
+            grid[:, 0] = grid[:, -1] = 0
+            return
+
+        # Colonnes de bordure (lignes intérieures), retournées pour le plan projectif
+        if topology == "cross":
+            grid[1:-1, 0] = grid[-2:0:-1, -2]
+            grid[1:-1, -1] = grid[-2:0:-1, 1]
+        else:
+            grid[1:-1, 0] = grid[1:-1, -2]
+            grid[1:-1, -1] = grid[1:-1, 1]
+
+        # Lignes de bordure (coins compris), en miroir pour Klein et le plan projectif
+        if topology in ("klein", "cross"):
+            grid[0] = grid[-2, ::-1]
+            grid[-1] = grid[1, ::-1]
+        else:
+            grid[0] = grid[-2]
+            grid[-1] = grid[1]
+
+    def close(self):
+        """
+        Libère les ressources du moteur (appelé par stop_workers).
+        """
+        pass
+
+class BitPackedEngine(NumpyEngine):
+    """
+    Moteur bit-packed : chaque ligne de la grille est stockée en mots uint64,
+    la colonne j correspondant au bit (j % 64) du mot (j // 64).
+    La génération suivante est calculée avec des additionneurs bit à bit
+    (carry-save) sur les trois lignes voisines : 64 cellules par opération.
+    Mémoire : 1 bit par cellule au lieu d'un octet pour le moteur NumPy.
+    """
+
+    name = "bitpacked"  # Nom du moteur (utilisé par start_workers)
+    multistate = False  # Un bit par cellule : deux états seulement
+    max_radius = 1  # Voisinage 3x3 uniquement (additionneurs bit à bit)
+    cost_model = (2e-4, 5e-10, 4e-9)  # 64 cellules par opération
+
+    def make_grid(self, size):
+        """
+        Crée une grille bit-packed de (size + 2) lignes de mots uint64.
+        Les colonnes 0 et size + 1 (bordure) restent toujours à 0.
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            numpy.ndarray: Tableau uint64 de forme (size + 2, nombre de mots)
+        """
+        # Nombre de colonnes stockées (bordure comprise) et de mots par ligne
+        self.width = size + 2
+        words = (self.width + 63) // 64
+
+        # Masque des colonnes intérieures (1 à size) : les bits de bordure sont forcés à 0
+        mask = np.zeros((1, self.width), dtype=np.uint8)
+        mask[0, 1:size + 1] = 1
+        self._mask = _pack(mask, words)[0]
+
+        return np.zeros((size + 2, words), dtype=np.uint64)
+
+    def step_rows(self, src, dst, r0, r1):
+        """
+        Calcule les lignes r0 à r1 - 1 de la génération suivante.
+        Le calcul est découpé en blocs de BAND_ROWS lignes pour que les
+        tableaux intermédiaires restent dans le cache du processeur.
+
+        Args:
+            src (numpy.ndarray): Grille actuelle (T)
+            dst (numpy.ndarray): Grille suivante (Tnext), modifiée sur place
+            r0 (int): Première ligne calculée (>= 1)
+            r1 (int): Ligne de fin exclue (<= n + 1)
+        """
+        # Région limitée : seuls les mots qui la recouvrent sont calculés
+        band, w0, w1 = r0, 0, src.shape[1]
+        if self.region is not None:
+            r0, r1, c0, c1 = self._restrict(dst, r0, r1)
+            if r0 >= r1 or c0 >= c1:
+                if self.tally:
+                    self._tally[band] = (0, 0)
+                return
+            w0, w1 = c0 >> 6, ((c1 - 1) >> 6) + 1
+        births = deaths = 0
+        for start in range(r0, r1, BAND_ROWS):
+            counts = self._step_block(src, dst, start, min(start + BAND_ROWS, r1), w0, w1)
+            if counts is not None:
+                births, deaths = births + counts[0], deaths + counts[1]
+        if self.tally:
+            self._tally[band] = (births, deaths)
+
+    def _step_block(self, src, dst, r0, r1, w0=0, w1=None):
+        """
+        Calcule un bloc de lignes r0 à r1 - 1 (mots w0 à w1 - 1) avec les
+        additionneurs bit à bit.
+
+        Args:
+            src (numpy.ndarray): Grille actuelle (T)
+            dst (numpy.ndarray): Grille suivante (Tnext), modifiée sur place
+            r0 (int): Première ligne calculée (>= 1)
+            r1 (int): Ligne de fin exclue (<= n + 1)
+            w0 (int): Premier mot calculé de chaque ligne
+            w1 (int, optional): Mot de fin exclu (par défaut : toute la ligne)
+
+        Returns:
+            tuple: (naissances, morts) du bloc si le comptage est actif
+                (voir set_tally), sinon None
+        """
+        if w1 is None:
+            w1 = src.shape[1]
+        # Lignes r0 - 1 à r1 : la bande et ses deux lignes voisines, avec
+        # les mots voisins des mots calculés (bits apportés par les décalages)
+        lo, hi = max(0, w0 - 1), min(src.shape[1], w1 + 1)
+        rows = src[r0 - 1:r1 + 1, lo:hi]
+
+        # Voisins ouest : la colonne j-1 est amenée sur le bit j
+        # (le bit 63 du mot précédent devient le bit 0 du mot courant)
+        west = rows << 1
+        west[:, 1:] |= rows[:, :-1] >> 63
+        # Voisins est : la colonne j+1 est amenée sur le bit j
+        east = rows >> 1
+        east[:, :-1] |= rows[:, 1:] << 63
+
+        # Règle sur les lignes intérieures du bloc
+        result = _life_words(rows, west, east, self._terms)
+        dst[r0:r1, w0:w1] = result[:, w0 - lo:w1 - lo] & self._mask[w0:w1]
+        if not self.tally:
+            return None
+        # Bits passés à 1 ou à 0 (la bordure, masquée, est exclue)
+        before = rows[1:-1, w0 - lo:w1 - lo] & self._mask[w0:w1]
+        after = dst[r0:r1, w0:w1]
+        return _popcount(after & ~before), _popcount(before & ~after)
+
+    def _erase(self, grid, r0, r1, c0, c1):
+        """
+        Remet à 0 les mots qui recouvrent un rectangle de cellules (les cellules
+        hors du rectangle de ces mots sont hors de la région, donc mortes).
+
+        Args:
+            grid (numpy.ndarray): Grille modifiée sur place
+            r0, r1 (int): Lignes r0 à r1 - 1
+            c0, c1 (int): Colonnes c0 à c1 - 1
+        """
+        grid[r0:r1, c0 >> 6:((c1 - 1) >> 6) + 1] = 0
+
+    def grid_bytes(self, size):
+        """
+        Estime la mémoire occupée par une grille (utilisé avant de la créer).
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            int: Nombre d'octets (un bit par cellule, lignes arrondies au mot)
+        """
+        return (size + 2) * ((size + 2 + 63) // 64) * 8
+
+    def get_cell(self, grid, i, j):
+        """
+        Retourne l'état de la cellule (i, j).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 sinon
+        """
+        return (int(grid[i, j >> 6]) >> (j & 63)) & 1
+
+    def set_cell(self, grid, i, j, value):
+        """
+        Modifie l'état de la cellule (i, j).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+            value (int): Nouvel état (1 = vivante, 0 = morte)
+        """
+        # Lit le mot contenant la cellule puis modifie uniquement son bit
+        word = int(grid[i, j >> 6])
+        bit = 1 << (j & 63)
+        grid[i, j >> 6] = (word | bit) if value else (word & ~bit)
+
+    def to_array(self, grid):
+        """
+        Décompresse la grille en tableau uint8 (n + 2) x (n + 2).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+
+        Returns:
+            numpy.ndarray: Tableau d'octets (une cellule par octet)
+        """
+        return _unpack(grid, grid.shape[0])
+
+    def bounds(self, grid, region=None):
+        """
+        Boîte englobante des cellules vivantes : OU des mots de chaque ligne,
+        puis OU des lignes occupées (bits de poids faible et fort).
+
+        Args:
+            grid (numpy.ndarray): Grille bit-packed
+            region (tuple, optional): Région contenant toutes les cellules
+                vivantes (par défaut : toute la grille)
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), bornes bas et droite exclues,
+                ou None si la grille est vide
+        """
+        top, left, bottom, right = region or (1, 1, grid.shape[0] - 1, self.width - 1)
+        if top >= bottom or left >= right:
+            return None
+        # Mots qui recouvrent la région, sans les bits de la bordure
+        w0, w1 = left >> 6, ((right - 1) >> 6) + 1
+        words = grid[top:bottom, w0:w1] & self._mask[w0:w1]
+        rows = np.flatnonzero(words.any(axis=1))
+        if not len(rows):
+            return None
+        merged = np.bitwise_or.reduce(words[rows[0]:rows[-1] + 1], axis=0)
+        used = np.flatnonzero(merged)
+        first, last = int(merged[used[0]]), int(merged[used[-1]])
+        return (top + int(rows[0]), (w0 + int(used[0])) * 64 + (first & -first).bit_length() - 1,
+                top + int(rows[-1]) + 1, (w0 + int(used[-1])) * 64 + last.bit_length())
+
+    def diff(self, old, new, region=None):
+        """
+        Mots de 64 cellules qui diffèrent entre deux grilles (voir NumpyEngine.diff).
+
+        Args:
+            old (numpy.ndarray): Grille précédente (None = grille vide)
+            new (numpy.ndarray): Grille actuelle
+            region (tuple, optional): Région calculée par la génération : seuls
+                les mots de ses lignes sont comparés (None : toute la grille)
+
+        Returns:
+            tuple: (positions, valeurs avant, valeurs après), tableaux NumPy
+        """
+        if region is None or old is None:
+            return _diff_words(old.reshape(-1) if old is not None else None, new.reshape(-1))
+
+        # Lignes de la région (mots contigus) ; position = rang du mot dans la grille
+        top, bottom = region[0], region[2]
+        positions, before, after = _diff_words(old[top:bottom].reshape(-1), new[top:bottom].reshape(-1))
+        return positions + top * new.shape[1], before, after
+
+    def _inside(self, words):
+        """
+        Masque des colonnes intérieures (1 à n) d'une ligne de mots.
+
+        Args:
+            words (int): Nombre de mots par ligne
+
+        Returns:
+            numpy.ndarray: Mots uint64 dont les bits des colonnes intérieures sont à 1
+        """
+        columns = np.ones((1, self.width), dtype=np.uint8)
+        columns[0, 0] = columns[0, -1] = 0
+        return _pack(columns, words)[0]
+
+    def count(self, grid):
+        """
+        Compte les cellules vivantes de l'intérieur de la grille.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+
+        Returns:
+            int: Nombre de cellules vivantes
+        """
+        return _popcount(grid[1:-1] & self._inside(grid.shape[1]))
+
+    def census(self, old, new, changes):
+        """
+        Naissances et morts entre deux grilles : bilan des bandes (voir
+        set_tally), sinon comptage sur les seuls mots modifiés.
+
+        Args:
+            old (numpy.ndarray): Grille précédente
+            new (numpy.ndarray): Grille actuelle
+            changes (tuple): Résultat de diff(old, new) (None si les bandes
+                ont été comptées)
+
+        Returns:
+            tuple: (naissances, morts)
+        """
+        if self.tally:
+            return self._tallied()
+        _, before, after = changes
+        births, deaths = _popcount(after & ~before), _popcount(before & ~after)
+        # Les mots comprennent la bordure (halo) : ses cellules sont retirées
+        # (lignes 0 et n + 1, colonnes 0 et n + 1 des lignes intérieures)
+        last = self.width - 1
+        edge = np.zeros(new.shape[1], dtype=np.uint64)
+        edge[0] |= np.uint64(1)
+        edge[last >> 6] |= np.uint64(1 << (last & 63))
+        ring_old = np.concatenate((old[0], old[-1], (old[1:-1] & edge).ravel()))
+        ring_new = np.concatenate((new[0], new[-1], (new[1:-1] & edge).ravel()))
+        return (births - _popcount(ring_new & ~ring_old),
+                deaths - _popcount(ring_old & ~ring_new))
+
+    def load(self, grid, state):
+        """
+        Copie un état (liste de listes ou grille du moteur) dans la grille.
+        Si les tailles diffèrent, seule la partie commune est copiée.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, modifiée sur place
+            state: État à restaurer
+        """
+        # Copie directe d'une grille bit-packed de même forme (historique)
+        if isinstance(state, np.ndarray) and state.dtype == np.uint64 and state.shape == grid.shape:
+            grid[...] = state
+            return
+
+        # Sinon : décompresse, copie la zone commune puis recompresse
+        cells = self.to_array(grid)
+        NumpyEngine.load(self, cells, _live_cells(state))
+        grid[...] = _pack(cells, grid.shape[1]) & self._mask
+
+    def wrap(self, grid, topology):
+        """
+        Remplit la bordure (halo) de la grille selon la topologie.
+        Les colonnes de bordure sont des bits isolés : elles sont copiées bit à
+        bit sur toutes les lignes ; seules les deux lignes en miroir sont
+        décompressées.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, bordure modifiée sur place
+            topology (str): Condition aux bords (voir TOPOLOGIES)
+        """
+        last = self.width - 2  # Dernière colonne intérieure
+        inner = slice(1, -1)
+
+        if topology == "plane":
+            # Bordure morte
+            grid[0] = grid[-1] = 0
+            self._set_column(grid, 0, np.zeros(grid.shape[0], dtype=np.uint64))
+            self._set_column(grid, last + 1, np.zeros(grid.shape[0], dtype=np.uint64))
+            return
+
+        # Colonnes de bordure (lignes intérieures), retournées pour le plan projectif
+        rows = slice(-2, 0, -1) if topology == "cross" else inner
+        self._set_column(grid, 0, self._column(grid, last)[rows], inner)
+        self._set_column(grid, last + 1, self._column(grid, 1)[rows], inner)
+
+        # Lignes de bordure (coins compris), en miroir pour Klein et le plan projectif
+        if topology in ("klein", "cross"):
+            edges = _unpack(grid[[-2, 1]], self.width)[:, ::-1]
+            grid[[0, -1]] = _pack(np.ascontiguousarray(edges), grid.shape[1])
+        else:
+            grid[0] = grid[-2]
+            grid[-1] = grid[1]
+
+    def _column(self, grid, j):
+        """
+        Extrait la colonne j (un bit par ligne).
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur
+            j (int): Colonne
+
+        Returns:
+            numpy.ndarray: Bits de la colonne (uint64, 0 ou 1)
+        """
+        return (grid[:, j >> 6] >> np.uint64(j & 63)) & np.uint64(1)
+
+    def _set_column(self, grid, j, bits, rows=slice(None)):
+        """
+        Écrit la colonne j sur les lignes choisies.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, modifiée sur place
+            j (int): Colonne
+            bits (numpy.ndarray): Bits à écrire (0 ou 1)
+            rows (slice): Lignes concernées
+        """
+        shift = np.uint64(j & 63)
+        words = grid[rows, j >> 6]
+        grid[rows, j >> 6] = (words & ~(np.uint64(1) << shift)) | (bits << shift)
+
+    def randomize(self, grid, density=0.25, seed=None, region=None, symmetry="C1"):
+        """
+        Remplit une région de la grille d'une soupe aléatoire (voir random_soup) ;
+        le reste de la grille est vidé.
+
+        Args:
+            grid (numpy.ndarray): Grille du moteur, modifiée sur place
+            density (float): Proportion de cellules vivantes
+            seed (int, optional): Graine de la soupe
+            region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+                en coordonnées de la grille (None : tout l'intérieur)
+            symmetry (str): Symétrie de la soupe (voir SYMMETRIES)
+        """
+        top, left, bottom, right = region or (1, 1, grid.shape[0] - 1, self.width - 1)
+        cells = random_soup(bottom - top, right - left, density, seed, symmetry)
+        # Place la soupe à sa colonne dans des lignes complètes, puis compresse
+        rows = np.zeros((bottom - top, right), dtype=np.uint8)
+        rows[:, left:] = cells
+        grid[...] = 0
+        grid[top:bottom] = _pack(rows, grid.shape[1])
+
+def _apply_terms(terms, neighbors, alive):
+    """
+    Évalue l'expression booléenne d'une règle sur un tableau de voisins.
+
+    Args:
+        terms (tuple): Termes de la règle (voir rule_terms)
+        neighbors (numpy.ndarray): Nombre de voisins de chaque cellule
+        alive (numpy.ndarray): État actuel des cellules (0 ou 1)
+
+    Returns:
+        numpy.ndarray: Tableau booléen de la génération suivante
+    """
+    result = np.zeros(neighbors.shape, dtype=bool)
+    for count, state in terms:
+        hit = neighbors == count
+        # Terme réservé aux cellules mortes (naissance) ou vivantes (survie)
+        if state is not None:
+            hit &= alive == state
+        result |= hit
+    return result
+
+def _age(cells, born, states):
+    """
+    Règles Generations : les cellules non mortes qui ne naissent ni ne survivent
+    vieillissent d'un état (vivante -> 2 -> ... -> states - 1 -> morte).
+
+    Args:
+        cells (numpy.ndarray): État actuel des cellules
+        born (numpy.ndarray): Cellules vivantes à la génération suivante
+        states (int): Nombre d'états de la règle
+
+    Returns:
+        numpy.ndarray: État suivant des cellules
+    """
+    aged = cells + (cells > 0)
+    aged[aged >= states] = 0
+    aged[born] = 1
+    return aged
+
+def _life_words(rows, west, east, terms=CONWAY_TERMS):
+    """
+    Applique une règle à des lignes de mots bit-packed.
+    Les lignes sont sur l'axe 0 : le résultat concerne rows[1:-1], les
+    première et dernière lignes ne servent que de voisines.
+
+    Args:
+        rows (numpy.ndarray): Lignes de mots uint64 (bit j = colonne j)
+        west (numpy.ndarray): Mêmes lignes décalées (colonne j-1 sur le bit j)
+        east (numpy.ndarray): Mêmes lignes décalées (colonne j+1 sur le bit j)
+        terms (tuple): Termes de la règle (voir rule_terms)
+
+    Returns:
+        numpy.ndarray: Mots de la génération suivante pour rows[1:-1]
+    """
+    # Ligne du dessus : additionneur complet des 3 voisins (somme sur 2 bits)
+    top0, top1 = _full_adder(west[:-2], rows[:-2], east[:-2])
+    # Ligne du milieu : demi-additionneur (gauche et droite)
+    mid0 = west[1:-1] ^ east[1:-1]
+    mid1 = west[1:-1] & east[1:-1]
+    # Ligne du dessous : additionneur complet des 3 voisins
+    bot0, bot1 = _full_adder(west[2:], rows[2:], east[2:])
+
+    # Bit des unités du total et retenue vers les deux
+    ones, carry = _full_adder(top0, mid0, bot0)
+    # Nombre de "deux" : top1 + mid1 + bot1 + carry (de 0 à 4)
+    pairs, fours_a = _full_adder(top1, mid1, bot1)
+    twos = pairs ^ carry
+    fours_b = pairs & carry
+    # Bits des quatre et des huit (les deux retenues ne valent 1 ensemble que pour 8 voisins)
+    fours = fours_a ^ fours_b
+    eights = fours_a & fours_b
+
+    # Chaque terme compare le total (sur 4 bits) à un nombre de voisins
+    planes = (ones, twos, fours, eights)
+    inverted = [None] * 4  # Complément de chaque bit, calculé à la demande
+    center = rows[1:-1]
+    result = np.zeros_like(center)
+    for count, state in terms:
+        hit = None
+        for k in range(4):
+            if (count >> k) & 1:
+                bit = planes[k]
+            else:
+                if inverted[k] is None:
+                    inverted[k] = ~planes[k]
+                bit = inverted[k]
+            hit = bit if hit is None else hit & bit
+        # Naissance (cellule morte) ou survie (cellule vivante) uniquement
+        if state == 1:
+            hit = hit & center
+        elif state == 0:
+            hit = hit & ~center
+        result |= hit
+    return result
+
+def _full_adder(a, b, c):
+    """
+    Additionneur complet bit à bit sur trois mots.
+
+    Args:
+        a, b, c (numpy.ndarray): Mots à additionner (64 cellules chacun)
+
+    Returns:
+        tuple: (bit de somme, bit de retenue)
+    """
+    partial = a ^ b
+    return partial ^ c, (a & b) | (c & partial)
+
+def _pack(cells, words):
+    """
+    Compresse un tableau de cellules (un octet par cellule) en mots uint64.
+
+    Args:
+        cells (numpy.ndarray): Tableau 2D de 0/1
+        words (int): Nombre de mots par ligne
+
+    Returns:
+        numpy.ndarray: Tableau uint64 de forme (lignes, words)
+    """
+    # Regroupe 8 cellules par octet (bit de poids faible = première colonne)
+    packed = np.packbits(cells, axis=1, bitorder="little")
+    # Complète chaque ligne pour obtenir un nombre entier de mots de 8 octets
+    padded = np.zeros((cells.shape[0], words * 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    # Réinterprète les octets en mots 64 bits little-endian
+    return padded.view("<u8").astype(np.uint64)
+
+def _unpack(grid, width):
+    """
+    Décompresse des mots uint64 en tableau de cellules (un octet par cellule).
+
+    Args:
+        grid (numpy.ndarray): Tableau uint64 de forme (lignes, mots)
+        width (int): Nombre de colonnes à conserver
+
+    Returns:
+        numpy.ndarray: Tableau uint8 de forme (lignes, width)
+    """
+    # Octets little-endian de chaque mot, puis bits (poids faible en premier)
+    raw = np.ascontiguousarray(grid, dtype="<u8").view(np.uint8)
+    return np.unpackbits(raw, axis=1, bitorder="little")[:, :width]
+
+def _as_words(grid):
+    """
+    Vue d'une grille d'octets en mots uint64 (8 cellules par mot).
+
+    Args:
+        grid (numpy.ndarray): Grille uint8
+
+    Returns:
+        tuple: (mots, reste) : vue uint64 sans copie (le mot k contient les
+            octets 8k à 8k + 7) et, si la taille n'est pas un multiple de 8,
+            un mot final complété par des 0 (tableau de 0 ou 1 mot)
+    """
+    flat = grid.reshape(-1)
+    words = flat.size // 8
+    tail = np.zeros(8 if words * 8 < flat.size else 0, dtype=np.uint8)
+    tail[:flat.size - words * 8] = flat[words * 8:]
+    return flat[:words * 8].view(np.uint64), tail.view(np.uint64)
+
+def _popcount(words):
+    """
+    Nombre total de bits à 1 d'un tableau de mots uint64.
+
+    Args:
+        words (numpy.ndarray): Mots uint64
+
+    Returns:
+        int: Nombre de bits à 1
+    """
+    # NumPy 2 : comptage natif ; sinon décompression des octets
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(np.ascontiguousarray(words).view(np.uint8)).sum())
+
+def _diff_words(old, new):
+    """
+    Mots qui diffèrent entre deux tableaux de mots de même forme.
+
+    Args:
+        old (numpy.ndarray): Mots précédents (None = tous nuls)
+        new (numpy.ndarray): Mots actuels
+
+    Returns:
+        tuple: (positions, valeurs avant, valeurs après), tableaux NumPy
+    """
+    if old is None:
+        positions = np.flatnonzero(new)
+        return positions, np.zeros(len(positions), dtype=np.uint64), new[positions]
+    positions = np.flatnonzero(old != new)
+    return positions, old[positions], new[positions]
+
+def _as_cells(state):
+    """
+    Convertit un état (liste de listes ou grille d'un moteur) en tableau d'octets.
+
+    Args:
+        state: État à convertir
+
+    Returns:
+        numpy.ndarray: Tableau uint8 de cellules
+    """
+    # Grille native d'un moteur bit-packed (carrée : autant de colonnes que de lignes)
+    if isinstance(state, np.ndarray) and state.dtype == np.uint64:
+        return _unpack(state, state.shape[0])
+    return np.asarray(state, dtype=np.uint8)
+
+def _live_cells(state):
+    """
+    Convertit un état en tableau de cellules vivantes (0 ou 1) pour les moteurs
+    à deux états : les cellules mourantes d'une règle Generations sont mortes.
+
+    Args:
+        state: État à convertir
+
+    Returns:
+        numpy.ndarray: Tableau uint8 de 0 et de 1
+    """
+    return (_as_cells(state) == 1).view(np.uint8)
+
+def list_grid_bytes(size):
+    """
+    Estime la mémoire d'une grille liste de listes (size + 2) x (size + 2) :
+    un pointeur de 8 octets par cellule plus l'en-tête de chaque liste.
+
+    Args:
+        size (int): Taille réelle de la grille (sans bordures)
+
+    Returns:
+        int: Nombre d'octets
+    """
+    return (size + 3) * 56 + (size + 2) * (size + 2) * 8
+
+# Conversion des chiffres binaires ("0"/"1") en cellules (0/1)
+_BIT_CELLS = bytes.maketrans(b"01", b"\x00\x01")
+
+def random_row(width, density=0.25, rng=random):
+    """
+    Tire une ligne de cellules aléatoires sans boucle Python par cellule.
+    Chaque cellule est un bit d'un grand entier : la densité est approchée à
+    1/256 près en combinant 8 tirages par ET/OU (exacte pour 0.25, 0.5, ...).
+
+    Args:
+        width (int): Nombre de cellules
+        density (float): Proportion de cellules vivantes
+        rng (random.Random, optional): Générateur (module random par défaut)
+
+    Returns:
+        list: Cellules (0 ou 1)
+    """
+    # Densité sur 8 bits : on lit ses chiffres binaires du moins au plus significatif
+    level = max(0, min(256, round(density * 256)))
+    if width == 0 or level == 256:
+        return [1] * width
+    bits = 0
+    for k in range(8):
+        # Chiffre à 1 : OU (la probabilité monte), chiffre à 0 : ET (elle baisse)
+        draw = rng.getrandbits(width)
+        bits = (bits | draw) if (level >> k) & 1 else (bits & draw)
+    # Convertit l'entier en octets 0/1 (opérations en C)
+    return list(format(bits, f"0{width}b").encode().translate(_BIT_CELLS))
+
+# Images d'une cellule (i, j) d'une région height x width par les éléments
+# (hors identité) de chaque groupe de symétrie ; les formules s'appliquent aussi
+# bien à des entiers qu'à des tableaux d'indices NumPy
+_SYMMETRY_MAPS = {
+    "C1": (),
+    "C2": (lambda i, j, h, w: (h - 1 - i, w - 1 - j),),
+    "C4": (lambda i, j, h, w: (j, w - 1 - i),
+           lambda i, j, h, w: (h - 1 - i, w - 1 - j),
+           lambda i, j, h, w: (h - 1 - j, i)),
+}
+_SYMMETRY_MAPS["D8"] = _SYMMETRY_MAPS["C4"] + (
+    lambda i, j, h, w: (j, i),
+    lambda i, j, h, w: (i, w - 1 - j),
+    lambda i, j, h, w: (h - 1 - i, j),
+    lambda i, j, h, w: (h - 1 - j, w - 1 - i),
+)
+
+def random_soup(height, width, density=0.25, seed=None, symmetry="C1"):
+    """
+    Tire une soupe aléatoire reproductible : la même graine donne les mêmes
+    cellules quel que soit le moteur. Avec NumPy, un octet aléatoire par
+    cellule (générateur PCG64) est comparé au seuil de densité en une seule
+    opération (10^8 cellules en quelques dixièmes de seconde) ; sans NumPy,
+    chaque ligne est tirée par random_row avec un random.Random de la graine.
+    Une soupe symétrique recopie sur chaque cellule le tirage de la plus petite
+    cellule (ordre de lecture) de son orbite : la densité est conservée.
+
+    Args:
+        height (int): Nombre de lignes
+        width (int): Nombre de colonnes
+        density (float): Proportion de cellules vivantes
+        seed (int, optional): Graine (None : tirage non reproductible)
+        symmetry (str): Symétrie de la soupe (voir SYMMETRIES)
+
+    Returns:
+        numpy.ndarray: Tableau uint8 de 0 et de 1 (liste de listes sans NumPy)
+
+    Raises:
+        ValueError: Si la symétrie est inconnue, ou exige une région carrée
+    """
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Symétrie inconnue : {symmetry} (attendu : {', '.join(SYMMETRIES)})")
+    if symmetry in ("C4", "D8") and height != width:
+        raise ValueError(f"La symétrie {symmetry} exige une région carrée ({height} x {width})")
+    maps = _SYMMETRY_MAPS[symmetry]
+
+    if np is None:
+        # Tirage ligne par ligne, puis repli des orbites cellule par cellule
+        rng = random.Random(seed)
+        cells = [random_row(width, density, rng) for _ in range(height)]
+        if not maps:
+            return cells
+        flat = [cell for row in cells for cell in row]
+        return [[flat[min([i * width + j] + [a * width + b for a, b in
+                                             (f(i, j, height, width) for f in maps)])]
+                 for j in range(width)] for i in range(height)]
+
+    # Un octet par cellule comparé au seuil (densité à 1/256 près)
+    level = max(0, min(256, round(density * 256)))
+    rng = np.random.default_rng(seed)
+    cells = (rng.integers(0, 256, size=(height, width), dtype=np.uint8) < level).view(np.uint8)
+    if not maps:
+        return cells
+    # Indice de la plus petite cellule de l'orbite de chaque cellule
+    i, j = np.ogrid[:height, :width]
+    source = np.broadcast_to(i * width + j, (height, width))
+    for f in maps:
+        a, b = f(i, j, height, width)
+        source = np.minimum(source, a * width + b)
+    return cells.ravel()[source]
+
+def randomize_lists(grid, density=0.25, seed=None, region=None, symmetry="C1"):
+    """
+    Remplit une région d'une grille liste de listes d'une soupe aléatoire
+    (voir random_soup) ; le reste de la grille est vidé.
+
+    Args:
+        grid (list): Grille bordée, modifiée sur place
+        density (float): Proportion de cellules vivantes
+        seed (int, optional): Graine de la soupe
+        region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+            en coordonnées de la grille (None : tout l'intérieur)
+        symmetry (str): Symétrie de la soupe (voir SYMMETRIES)
+    """
+    top, left, bottom, right = region or (1, 1, len(grid) - 1, len(grid[0]) - 1)
+    cells = random_soup(bottom - top, right - left, density, seed, symmetry)
+    if np is not None:
+        cells = cells.tolist()
+    if region is not None:
+        for row in grid:
+            row[:] = [0] * len(row)
+    # Une ligne entière est copiée à la fois (pas de boucle par cellule)
+    for row, soup in zip(grid[top:bottom], cells):
+        row[left:right] = soup
+
+def wrap_list(grid, topology):
+    """
+    Remplit la bordure (halo) d'une grille liste de listes selon la topologie.
+    Les lignes sont copiées par tranches et les colonnes ligne par ligne :
+    aucun calcul de modulo par cellule.
+
+    Args:
+        grid (list): Grille (size + 2) x (size + 2), bordure modifiée sur place
+        topology (str): Condition aux bords (voir TOPOLOGIES)
+    """
+    size = len(grid) - 2
+
+    if topology == "plane":
+        # Bordure morte
+        grid[0][:] = [0] * (size + 2)
+        grid[-1][:] = [0] * (size + 2)
+        for row in grid:
+            row[0] = row[-1] = 0
+        return
+
+    # Colonnes de bordure (lignes intérieures), retournées pour le plan projectif
+    for i in range(1, size + 1):
+        source = grid[size + 1 - i] if topology == "cross" else grid[i]
+        grid[i][0] = source[size]
+        grid[i][size + 1] = source[1]
+
+    # Lignes de bordure (coins compris), en miroir pour Klein et le plan projectif
+    if topology in ("klein", "cross"):
+        grid[0][:] = grid[size][::-1]
+        grid[-1][:] = grid[1][::-1]
+    else:
+        grid[0][:] = grid[size]
+        grid[-1][:] = grid[1]
+
+def step_lists(src, dst, table, r0, r1, region=None, stale=None):
+    """
+    Calcule les lignes r0 à r1 - 1 d'une grille en listes de listes (Python pur).
+    Le voisinage 3x3 de chaque cellule est un masque de 9 bits lu dans la table
+    de la règle ; il glisse d'une colonne à l'autre par décalage de 3 bits.
+
+    Args:
+        src (list): Grille actuelle (bordure remplie)
+        dst (list): Grille suivante, modifiée sur place
+        table: Table de la règle (gamelife_rules.Rule.table)
+        r0 (int): Première ligne calculée (1 à size)
+        r1 (int): Ligne de fin exclue (2 à size + 1)
+        region (tuple, optional): Seule région calculée (haut, gauche, bas, droite),
+            None = toute la grille
+        stale (tuple, optional): Boîte des cellules non nulles de dst (génération
+            précédente), effacée sur les lignes r0 à r1 - 1 quand region est donnée
+    """
+    c0, c1 = 1, len(src) - 1
+    # Région limitée : efface la génération précédente sur les lignes de la
+    # bande, puis ne calcule que la partie de la bande dans la région
+    if region is not None:
+        top, left, bottom, right = region
+        if stale is not None:
+            s_top, s_left, s_bottom, s_right = stale
+            dead = [0] * (s_right - s_left)
+            for i in range(max(r0, s_top), min(r1, s_bottom)):
+                dst[i][s_left:s_right] = dead
+        r0, r1, c0, c1 = max(r0, top), min(r1, bottom), left, right
+
+    for i in range(r0, r1):
+        # Lignes voisines de la ligne i
+        above, row, below = src[i - 1], src[i], src[i + 1]
+        out = dst[i]
+        # Colonnes c0 - 1 et c0 placées comme si la colonne c0 - 2 précédait
+        # (bit 3 * colonne + ligne, voir gamelife_rules)
+        mask = (
+            above[c0 - 1] << 3 | row[c0 - 1] << 4 | below[c0 - 1] << 5 |
+            above[c0] << 6 | row[c0] << 7 | below[c0] << 8
+        )
+        for j in range(c0, c1):
+            # Ajoute la colonne j + 1 et oublie la colonne j - 2
+            mask = mask >> 3 | above[j + 1] << 6 | row[j + 1] << 7 | below[j + 1] << 8
+            # Applique la règle (naissance ou survie selon la table)
+            out[j] = table[mask]
+
+def _row_digest(row):
+    """
+    Valeur d'une ligne de grille pour le hachage de gamelife_cycles.
+
+    Args:
+        row (list): Ligne de cellules
+
+    Returns:
+        int: Empreinte sur 64 bits (0 pour une ligne vide)
+    """
+    return hash(tuple(row)) & 0xFFFFFFFFFFFFFFFF if any(row) else 0
+
+def diff_lists(old, new, rows=None):
+    """
+    Lignes qui diffèrent entre deux grilles en listes de listes (bordure
+    comprise). Une ligne identique est écartée par une seule comparaison de
+    listes ; une ligne modifiée est représentée par son empreinte.
+
+    Args:
+        old (list): Grille précédente (None = grille vide)
+        new (list): Grille actuelle
+        rows (iterable, optional): Seules lignes susceptibles d'avoir changé
+
+    Returns:
+        tuple: (positions, empreintes avant, empreintes après), listes Python
+    """
+    positions, before, after = [], [], []
+    for i in range(len(new)) if rows is None else rows:
+        row = new[i]
+        if old is None:
+            previous = 0
+        elif old[i] != row:
+            previous = _row_digest(old[i])
+        else:
+            continue
+        positions.append(i)
+        before.append(previous)
+        after.append(_row_digest(row))
+    return positions, before, after
+
+def count_lists(grid):
+    """
+    Compte les cellules vivantes de l'intérieur d'une grille en listes de listes.
+
+    Args:
+        grid (list): Grille (liste de listes ou tuple de tuples)
+
+    Returns:
+        int: Nombre de cellules vivantes
+    """
+    return sum(row[1:-1].count(1) for row in grid[1:-1])
+
+def bounds_lists(grid, region=None):
+    """
+    Boîte englobante des cellules vivantes d'une grille à deux états en listes
+    de listes (recherches sur les tranches de lignes, sans boucle par cellule).
+
+    Args:
+        grid (list): Grille (liste de listes ou tuple de tuples)
+        region (tuple, optional): Région contenant toutes les cellules vivantes
+            (par défaut : toute la grille)
+
+    Returns:
+        tuple: (haut, gauche, bas, droite), bornes bas et droite exclues,
+            ou None si la grille est vide
+    """
+    size = len(grid) - 2
+    top, left, bottom, right = region or (1, 1, size + 1, size + 1)
+    rows = [i for i in range(top, bottom) if 1 in grid[i][left:right]]
+    if not rows:
+        return None
+    first, last = right, left
+    for i in rows:
+        cells = grid[i][left:right]
+        first = min(first, left + cells.index(1))
+        last = max(last, right - cells[::-1].index(1))
+    return rows[0], first, rows[-1] + 1, last
+
+def census_lists(old, new, changes):
+    """
+    Naissances et morts entre deux grilles à deux états en listes de listes,
+    comptées sur les seules lignes modifiées (voir diff_lists).
+
+    Args:
+        old (list): Grille précédente
+        new (list): Grille actuelle
+        changes (tuple): Résultat de diff_lists(old, new)
+
+    Returns:
+        tuple: (naissances, morts)
+    """
+    births = deaths = 0
+    size = len(new) - 2
+    for i in changes[0]:
+        if not 1 <= i <= size:
+            continue
+        previous, row = old[i][1:-1], new[i][1:-1]
+        # Cellules modifiées et variation de la population de la ligne
+        flips = sum(map(operator.ne, previous, row))
+        delta = row.count(1) - previous.count(1)
+        births += (flips + delta) // 2
+        deaths += (flips - delta) // 2
+    return births, deaths
+
+class ListGridEngine:
+    """
+    Base des moteurs dont la grille est une liste de listes (size + 2) x (size + 2),
+    comme make_grid. Fournit les accesseurs ; les sous-classes implémentent step
+    et peuvent réagir aux modifications via _on_edit et _on_reset.
+    """
+
+    requires_numpy = False  # Fonctionne en Python pur
+    changed = None  # Cellules modifiées par la dernière génération (None = non suivi)
+    generations_per_step = 1  # Générations calculées par appel à step
+    jumps = False  # Nombre de générations par étape fixe (voir HashLifeEngine.set_jump)
+    tallies = False  # census compte les cellules modifiées données par diff (voir NumpyEngine.set_tally)
+    splittable = False  # Toute la génération est calculée par un seul thread
+    unbounded = False  # La grille est bornée (les cellules hors bordure meurent)
+    topologies = ("plane",)  # Seule la bordure morte est gérée
+    supports_b0 = False  # Les règles B0 font naître des cellules loin de toute activité
+    multistate = False  # Cellules vivantes ou mortes uniquement
+    max_radius = 1  # Voisinage 3x3 uniquement
+    clips = False  # Le calcul ne se limite pas à une région (voir NumpyEngine.set_region)
+    cost_model = (3e-4, 2e-7, 4e-7)  # Coût d'une génération (voir NumpyEngine.cost_model)
+    rule = rules.CONWAY  # Règle appliquée (voir set_rule)
+
+    def set_rule(self, rule):
+        """
+        Change la règle appliquée aux générations suivantes.
+
+        Args:
+            rule (gamelife_rules.Rule): Règle compilée
+        """
+        self.rule = rule
+
+    def make_grid(self, size):
+        """
+        Crée une grille (size + 2) x (size + 2).
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            list: Grille 2D initialisée à 0
+        """
+        self.size = size  # Taille réelle de la grille
+        return [[0] * (size + 2) for _ in range(size + 2)]
+
+    def grid_bytes(self, size):
+        """
+        Estime la mémoire occupée par une grille (utilisé avant de la créer).
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            int: Nombre d'octets
+        """
+        return list_grid_bytes(size)
+
+    def _on_edit(self, i, j):
+        """
+        Appelée après la modification d'une seule cellule.
+
+        Args:
+            i (int): Ligne de la cellule
+            j (int): Colonne de la cellule
+        """
+
+    def _on_reset(self, quiet=False):
+        """
+        Appelée après une modification de toute la grille.
+
+        Args:
+            quiet (bool): True si la grille est désormais vide
+        """
+
+    def get_cell(self, grid, i, j):
+        """
+        Retourne l'état de la cellule (i, j).
+
+        Args:
+            grid (list): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 sinon
+        """
+        return grid[i][j]
+
+    def set_cell(self, grid, i, j, value):
+        """
+        Modifie l'état de la cellule (i, j).
+
+        Args:
+            grid (list): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+            value (int): Nouvel état (1 = vivante, 0 = morte)
+        """
+        grid[i][j] = 1 if value else 0
+        self._on_edit(i, j)
+
+    def to_list(self, grid):
+        """
+        Retourne une copie de la grille en liste de listes.
+
+        Args:
+            grid (list): Grille du moteur
+
+        Returns:
+            list: Grille 2D sous forme de listes Python
+        """
+        return [row[:] for row in grid]
+
+    def load(self, grid, state):
+        """
+        Copie un état dans la grille (seule la partie commune si les tailles diffèrent).
+
+        Args:
+            grid (list): Grille du moteur, modifiée sur place
+            state: État à restaurer (liste de listes)
+        """
+        for i in range(min(len(state), len(grid))):
+            for j in range(min(len(state[i]), len(grid[i]))):
+                # Deux états : une cellule mourante (règle Generations) est morte
+                grid[i][j] = 1 if state[i][j] == 1 else 0
+        self._on_reset()
+
+    def diff(self, old, new, region=None):
+        """
+        Lignes qui diffèrent entre deux grilles (voir diff_lists).
+
+        Args:
+            old (list): Grille précédente (None = grille vide)
+            new (list): Grille actuelle
+            region (tuple, optional): Région calculée par la génération : seules
+                ses lignes sont comparées (None : toute la grille)
+
+        Returns:
+            tuple: (positions, empreintes avant, empreintes après), listes Python
+        """
+        if region is None or old is None:
+            return diff_lists(old, new)
+        return diff_lists(old, new, range(region[0], region[2]))
+
+    def count(self, grid):
+        """
+        Compte les cellules vivantes de l'intérieur de la grille.
+
+        Args:
+            grid (list): Grille du moteur
+
+        Returns:
+            int: Nombre de cellules vivantes
+        """
+        return count_lists(grid)
+
+    def bounds(self, grid, region=None):
+        """
+        Boîte englobante des cellules vivantes (voir bounds_lists).
+
+        Args:
+            grid (list): Grille du moteur
+            region (tuple, optional): Région contenant toutes les cellules vivantes
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), bornes bas et droite exclues,
+                ou None si la grille est vide
+        """
+        return bounds_lists(grid, region)
+
+    def census(self, old, new, changes):
+        """
+        Naissances et morts entre deux grilles (voir census_lists).
+
+        Args:
+            old (list): Grille précédente
+            new (list): Grille actuelle
+            changes (tuple): Résultat de diff(old, new)
+
+        Returns:
+            tuple: (naissances, morts)
+        """
+        return census_lists(old, new, changes)
+
+    def any(self, grid):
+        """
+        Indique si au moins une cellule est vivante.
+
+        Args:
+            grid (list): Grille du moteur
+
+        Returns:
+            bool: True si une cellule est vivante
+        """
+        return any(any(row) for row in grid)
+
+    def clear(self, grid):
+        """
+        Tue toutes les cellules de la grille.
+
+        Args:
+            grid (list): Grille du moteur, modifiée sur place
+        """
+        for row in grid:
+            row[:] = [0] * len(row)
+        self._on_reset(quiet=True)
+
+    def randomize(self, grid, density=0.25, seed=None, region=None, symmetry="C1"):
+        """
+        Remplit une région de la grille d'une soupe aléatoire (voir random_soup) ;
+        le reste de la grille est vidé.
+
+        Args:
+            grid (list): Grille du moteur, modifiée sur place
+            density (float): Proportion de cellules vivantes
+            seed (int, optional): Graine de la soupe
+            region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+                en coordonnées de la grille (None : tout l'intérieur)
+            symmetry (str): Symétrie de la soupe (voir SYMMETRIES)
+        """
+        randomize_lists(grid, density, seed, region, symmetry)
+        self._on_reset()
+
+    def wrap(self, grid, topology):
+        """
+        Remet la bordure à 0 (seule la topologie "plane" est gérée).
+
+        Args:
+            grid (list): Grille du moteur, bordure modifiée sur place
+            topology (str): Condition aux bords ("plane")
+        """
+        wrap_list(grid, "plane")
+
+    def close(self):
+        """
+        Libère les ressources du moteur (appelé par stop_workers).
+        """
+        pass
+
+class ActiveEngine(ListGridEngine):
+    """
+    Moteur à région active (frontière des cellules modifiées).
+    La grille est une liste de listes, comme make_grid. À chaque génération,
+    seules les cellules modifiées à la génération précédente et leurs 8 voisines
+    sont recalculées : le coût dépend de l'activité, pas de n x n.
+    L'ensemble des cellules modifiées (changed) est transmis à l'affichage
+    et à l'historique par gamelife_core.
+    """
+
+    name = "active"  # Nom du moteur (utilisé par start_workers)
+    cost_model = (0.0, 1e-7, 6e-6)  # Coût proportionnel à l'activité
+
+    def make_grid(self, size):
+        """
+        Crée une grille (size + 2) x (size + 2) et réinitialise le suivi d'activité.
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            list: Grille 2D initialisée à 0
+        """
+        # Une grille vide est stable : aucune cellule n'est active
+        self.changed = set()  # Cellules modifiées par la dernière génération (None = inconnu)
+        self._edits = set()  # Cellules modifiées hors calcul (dessin à la souris)
+        self._stale = None  # Cellules où Tnext diffère de T (None = toute la grille)
+        return ListGridEngine.make_grid(self, size)
+
+    def step(self, src, dst):
+        """
+        Calcule la génération suivante de src dans dst en ne visitant
+        que la région active.
+
+        Args:
+            src (list): Grille actuelle (T)
+            dst (list): Grille suivante (Tnext), modifiée sur place
+        """
+        # dst contient la génération précédente : on la resynchronise avec src
+        # uniquement là où les deux grilles diffèrent
+        if self._stale is None:
+            for i in range(len(src)):
+                dst[i][:] = src[i]
+        else:
+            for i, j in self._stale:
+                dst[i][j] = src[i][j]
+
+        # Cellules à évaluer : toute la grille si l'activité est inconnue,
+        # sinon les cellules modifiées et leurs 8 voisines
+        size = self.size
+        if self.changed is None:
+            candidates = [(i, j) for i in range(1, size + 1) for j in range(1, size + 1)]
+        else:
+            candidates = set()
+            for i, j in self.changed | self._edits:
+                for di in (-1, 0, 1):
+                    for dj in (-1, 0, 1):
+                        # Ignore les voisins situés dans la bordure
+                        if 1 <= i + di <= size and 1 <= j + dj <= size:
+                            candidates.add((i + di, j + dj))
+
+        # Applique la règle aux seules cellules candidates
+        table = self.rule.table
+        changed = set()
+        for i, j in candidates:
+            above, row, below = src[i - 1], src[i], src[i + 1]
+            # Masque du voisinage 3x3 (bit 3 * colonne + ligne, voir gamelife_rules)
+            mask = (
+                above[j - 1] | row[j - 1] << 1 | below[j - 1] << 2 |  # Colonne de gauche
+                above[j] << 3 | row[j] << 4 | below[j] << 5 |  # Colonne de la cellule
+                above[j + 1] << 6 | row[j + 1] << 7 | below[j + 1] << 8  # Colonne de droite
+            )
+            alive = table[mask]
+            dst[i][j] = alive
+            # Mémorise les cellules qui changent d'état
+            if alive != row[j]:
+                changed.add((i, j))
+
+        # Après l'échange, les grilles diffèrent exactement sur les cellules modifiées
+        self.changed = changed
+        self._stale = set(changed)
+        self._edits = set()
+
+    def diff(self, old, new, region=None):
+        """
+        Lignes qui diffèrent entre la génération précédente et la grille actuelle :
+        seules les lignes de l'ensemble changed sont comparées.
+
+        Args:
+            old (list): Grille précédente (None = grille vide)
+            new (list): Grille actuelle, issue du dernier appel à step
+            region (tuple, optional): Région de la génération (inutile : l'ensemble
+                changed est plus précis)
+
+        Returns:
+            tuple: (positions, empreintes avant, empreintes après), listes Python
+        """
+        if old is None or self.changed is None:
+            return ListGridEngine.diff(self, old, new, region)
+        return diff_lists(old, new, sorted({i for i, _ in self.changed}))
+
+    def census(self, old, new, changes):
+        """
+        Naissances et morts de la dernière génération, lues dans l'ensemble changed.
+
+        Args:
+            old (list): Grille précédente
+            new (list): Grille actuelle, issue du dernier appel à step
+            changes (tuple): Résultat de diff(old, new)
+
+        Returns:
+            tuple: (naissances, morts)
+        """
+        if self.changed is None:
+            return census_lists(old, new, changes)
+        births = sum(new[i][j] for i, j in self.changed)
+        return births, len(self.changed) - births
+
+    def _on_edit(self, i, j):
+        """
+        Ajoute une cellule dessinée à la région active.
+
+        Args:
+            i (int): Ligne de la cellule
+            j (int): Colonne de la cellule
+        """
+        # La cellule et ses voisines devront être réévaluées
+        self._edits.add((i, j))
+        # T diffère désormais de Tnext sur cette cellule
+        if self._stale is not None:
+            self._stale.add((i, j))
+
+    def _on_reset(self, quiet=False):
+        """
+        Oublie le suivi d'activité après une modification de toute la grille.
+
+        Args:
+            quiet (bool): True si la grille est vide (rien à évaluer),
+                False pour évaluer toute la grille à la prochaine génération
+        """
+        self.changed = set() if quiet else None
+        self._stale = None
+        self._edits = set()
+
+# Moteurs disponibles (hors mode "threads"), indexés par leur nom
+ENGINES = {
+    "numpy": NumpyEngine,
+    "bitpacked": BitPackedEngine,
+    "active": ActiveEngine,
+}
+
+def register_engine(engine_class):
+    """
+    Ajoute un moteur défini dans un autre module (ex: gamelife_hashlife).
+
+    Args:
+        engine_class (type): Classe du moteur (attribut name obligatoire)
+    """
+    ENGINES[engine_class.name] = engine_class
+
+def get_engine(name):
+    """
+    Instancie le moteur correspondant à un nom.
+
+    Args:
+        name (str): Nom du moteur (ex: "numpy")
+
+    Returns:
+        objet moteur, ou None si le moteur est inconnu ou indisponible
+    """
+    # Moteur inconnu
+    if name not in ENGINES:
+        return None
+    # Les moteurs vectorisés nécessitent NumPy
+    if ENGINES[name].requires_numpy and not NUMPY_AVAILABLE:
+        return None
+    return ENGINES[name]()
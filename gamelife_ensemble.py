@@ -0,0 +1,462 @@
+"""
+Game of Life - Lots de grilles (statistiques sur des soupes)
+Fait évoluer B grilles n x n indépendantes empilées dans un seul tableau, au
+lieu d'une simulation (start_workers) par grille :
+- Une génération de tout le lot en un seul appel vectorisé, avec les noyaux
+  des moteurs NumPy (Ensemble) et bit-packed (BitPackedEnsemble) de
+  gamelife_engines et la règle compilée par gamelife_rules
+- Population de chaque grille après chaque génération
+- Fin de chaque grille : extinction, stabilisation (état déjà rencontré parmi
+  les max_period dernières générations, hachage de Zobrist de gamelife_cycles)
+  ou limite de générations atteinte
+- Compaction : les grilles terminées sortent du lot, de nouvelles soupes
+  peuvent y entrer (add_soups) pendant que les autres continuent
+
+Les grilles ont une bordure morte (topologie "plane"). Une soupe tirée avec
+une graine est la même que celle de core.randomize_grid avec cette graine.
+
+Dépendance : NumPy
+"""
+
+from collections import namedtuple
+
+import gamelife_cycles as cycles
+import gamelife_engines as engines
+import gamelife_rules as rules
+
+np = engines.np
+
+MAX_PERIOD = 30  # Période maximale reconnue par défaut (nature morte : 1)
+COMPACT_FRACTION = 0.25  # Proportion de grilles terminées qui déclenche la compaction
+
+# Grille terminée : identifiant (ordre d'ajout), graine de la soupe (None pour
+# une grille fournie), génération de fin, période (0 : limite de générations
+# atteinte sans stabilisation), population et cellules finales (n x n, uint8)
+Outcome = namedtuple("Outcome", "ident seed generation period population cells")
+
+class Ensemble:
+    """
+    Lot de grilles à un octet par cellule : tableau (n + 2, B, largeur), les
+    lignes sur l'axe 0 comme dans les moteurs, les grilles sur l'axe 1 et la
+    largeur arrondie à 8 octets (un mot par 8 cellules pour le hachage).
+    Gère toutes les règles de rayon 1, Generations comprises.
+    """
+
+    def __init__(self, size, rule=None, max_period=MAX_PERIOD, max_generations=None):
+        """
+        Crée un lot vide.
+
+        Args:
+            size (int): Taille des grilles (n x n cellules, sans bordures)
+            rule (str ou gamelife_rules.Rule, optional): Règle (Conway par défaut)
+            max_period (int): Période maximale reconnue comme stabilisation
+            max_generations (int, optional): Générations au-delà desquelles une
+                grille non stabilisée est terminée (None : jamais)
+
+        Raises:
+            ValueError: Si NumPy est absent ou si la règle n'est pas gérée
+        """
+        if np is None:
+            raise ValueError("Les lots de grilles nécessitent NumPy")
+        rule = rules.compile_rule(rule) if isinstance(rule, str) else (rule or rules.CONWAY)
+        if not self.supports(rule):
+            raise ValueError(f"Règle {rule.name} non gérée par {type(self).__name__}")
+        self.size = size
+        self.rule = rule
+        self._terms = engines.rule_terms(rule)
+        self.max_period = max_period
+        self.max_generations = max_generations
+        self.cells = self._make_cells(0)  # Grilles du lot (voir la docstring de la classe)
+        self._next = self._make_cells(0)  # Génération suivante (double buffer)
+        self.ids = np.zeros(0, dtype=np.int64)  # Identifiant de chaque grille
+        self.seeds = []  # Graine de chaque grille (None pour une grille fournie)
+        self.ages = np.zeros(0, dtype=np.int64)  # Générations calculées de chaque grille
+        self.population = np.zeros(0, dtype=np.int64)  # Cellules vivantes de chaque grille
+        self.done = np.zeros(0, dtype=bool)  # Grilles terminées, en attente de compaction
+        self._hashes = np.zeros((max_period, 0), dtype=np.uint64)  # Hachages des dernières générations
+        self._tick = 0  # Générations calculées par le lot (indice circulaire de _hashes)
+        self._count = 0  # Grilles ajoutées depuis la création (prochain identifiant)
+
+    @classmethod
+    def supports(cls, rule):
+        """
+        Indique si le lot peut appliquer une règle.
+
+        Args:
+            rule (gamelife_rules.Rule ou RangeRule): Règle compilée
+
+        Returns:
+            bool: True pour une règle de rayon 1
+        """
+        return rule.table is not None
+
+    def __len__(self):
+        """
+        Returns:
+            int: Nombre de grilles du lot (terminées comprises, avant compaction)
+        """
+        return len(self.ids)
+
+    def _make_cells(self, count):
+        """
+        Crée le tableau de count grilles vides.
+
+        Args:
+            count (int): Nombre de grilles
+
+        Returns:
+            numpy.ndarray: Tableau uint8 (n + 2, count, largeur)
+        """
+        return np.zeros((self.size + 2, count, (self.size + 9) & ~7), dtype=np.uint8)
+
+    def _pack_cells(self, grids):
+        """
+        Convertit des grilles n x n dans le format du lot.
+
+        Args:
+            grids (numpy.ndarray): Tableau (count, n, n) d'états
+
+        Returns:
+            numpy.ndarray: Grilles bordées au format du lot
+        """
+        cells = self._make_cells(len(grids))
+        cells[1:-1, :, 1:self.size + 1] = grids.transpose(1, 0, 2)
+        return cells
+
+    def _units(self, cells):
+        """
+        Unités hachées de chaque grille (mots de 8 cellules).
+
+        Args:
+            cells (numpy.ndarray): Grilles au format du lot
+
+        Returns:
+            numpy.ndarray: Tableau uint64 (grilles, unités par grille)
+        """
+        words = cells.view(np.uint64)
+        return words.transpose(1, 0, 2).reshape(words.shape[1], -1)
+
+    def _count_live(self, cells):
+        """
+        Population (cellules dans l'état 1) de chaque grille.
+
+        Args:
+            cells (numpy.ndarray): Grilles au format du lot
+
+        Returns:
+            numpy.ndarray: Population de chaque grille
+        """
+        return np.count_nonzero(cells == 1, axis=(0, 2))
+
+    def _step(self, src, dst):
+        """
+        Calcule la génération suivante de toutes les grilles : somme des 8 vues
+        décalées (comme NumpyEngine.step_rows), sur l'axe des lignes et celui
+        des colonnes à la fois pour tout le lot.
+
+        Args:
+            src (numpy.ndarray): Grilles actuelles
+            dst (numpy.ndarray): Grilles suivantes, modifiées sur place
+        """
+        n = self.size
+        states = self.rule.states
+        # Règle Generations : seules les cellules vivantes (état 1) sont des voisines
+        live = src if states == 2 else (src == 1).view(np.uint8)
+        neighbors = (
+            live[:-2, :, :n] + live[:-2, :, 1:n + 1] + live[:-2, :, 2:n + 2] +  # Ligne du dessus
+            live[1:-1, :, :n] + live[1:-1, :, 2:n + 2] +  # Ligne du milieu (gauche et droite)
+            live[2:, :, :n] + live[2:, :, 1:n + 1] + live[2:, :, 2:n + 2]  # Ligne du dessous
+        )
+        cells = src[1:-1, :, 1:n + 1]
+        born = engines._apply_terms(self._terms, neighbors, cells)
+        dst[1:-1, :, 1:n + 1] = born if states == 2 else engines._age(cells, born, states)
+
+    def _grid(self, cells, k):
+        """
+        Extrait une grille du lot.
+
+        Args:
+            cells (numpy.ndarray): Grilles au format du lot
+            k (int): Rang de la grille dans le lot
+
+        Returns:
+            numpy.ndarray: Cellules n x n (uint8, copie)
+        """
+        return cells[1:-1, k, 1:self.size + 1].copy()
+
+    def grid(self, k):
+        """
+        Retourne l'état actuel d'une grille du lot.
+
+        Args:
+            k (int): Rang de la grille dans le lot (0 à len - 1)
+
+        Returns:
+            numpy.ndarray: Cellules n x n (uint8)
+        """
+        return self._grid(self.cells, k)
+
+    def add(self, grids, seeds=None):
+        """
+        Ajoute des grilles au lot (génération 0).
+
+        Args:
+            grids: Grilles n x n (tableaux ou listes de listes d'états)
+            seeds (list, optional): Graine associée à chaque grille
+
+        Returns:
+            numpy.ndarray: Identifiants des grilles ajoutées
+        """
+        grids = np.asarray(grids, dtype=np.uint8).reshape(-1, self.size, self.size)
+        count = len(grids)
+        cells = self._pack_cells(grids)
+        ids = np.arange(self._count, self._count + count, dtype=np.int64)
+        self._count += count
+
+        # Le hachage de la génération 0 occupe la case de la génération actuelle du lot
+        hashes = np.zeros((self.max_period, count), dtype=np.uint64)
+        hashes[self._tick % self.max_period] = cycles.batch_hashes(self._units(cells))
+
+        self.cells = np.concatenate((self.cells, cells), axis=1)
+        self._next = self._make_cells(len(self.ids) + count)
+        self.ids = np.concatenate((self.ids, ids))
+        self.seeds.extend(seeds if seeds is not None else [None] * count)
+        self.ages = np.concatenate((self.ages, np.zeros(count, dtype=np.int64)))
+        self.population = np.concatenate((self.population, self._count_live(cells)))
+        self.done = np.concatenate((self.done, np.zeros(count, dtype=bool)))
+        self._hashes = np.concatenate((self._hashes, hashes), axis=1)
+        return ids
+
+    def add_soups(self, seeds, density=0.25, region=None, symmetry="C1"):
+        """
+        Ajoute une soupe par graine (voir engines.random_soup) : la même graine
+        donne la même grille que core.randomize_grid.
+
+        Args:
+            seeds (iterable): Graines des soupes
+            density (float): Proportion de cellules vivantes
+            region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+                en coordonnées de la grille bordée (None : toute la grille)
+            symmetry (str): Symétrie des soupes (voir engines.SYMMETRIES)
+
+        Returns:
+            numpy.ndarray: Identifiants des grilles ajoutées
+        """
+        seeds = list(seeds)
+        top, left, bottom, right = region or (1, 1, self.size + 1, self.size + 1)
+        grids = np.zeros((len(seeds), self.size, self.size), dtype=np.uint8)
+        for k, seed in enumerate(seeds):
+            grids[k, top - 1:bottom - 1, left - 1:right - 1] = engines.random_soup(
+                bottom - top, right - left, density, seed, symmetry)
+        return self.add(grids, seeds)
+
+    def step(self, generations=1):
+        """
+        Calcule des générations de toutes les grilles du lot. Après chaque
+        génération, les grilles éteintes, stabilisées ou trop âgées sont
+        terminées ; le lot est compacté dès que COMPACT_FRACTION de ses grilles
+        sont terminées (et à la fin de l'appel).
+
+        Args:
+            generations (int): Nombre de générations
+
+        Returns:
+            list: Grilles terminées pendant l'appel (Outcome)
+        """
+        finished = []
+        for _ in range(generations):
+            if not len(self.ids):
+                break
+            self._step(self.cells, self._next)
+            self.cells, self._next = self._next, self.cells
+            self._tick += 1
+            self.ages += 1
+            self.population = self._count_live(self.cells)
+            finished.extend(self._finish())
+            if np.count_nonzero(self.done) >= COMPACT_FRACTION * len(self.ids):
+                self.compact()
+        self.compact()
+        return finished
+
+    def _finish(self):
+        """
+        Repère les grilles qui viennent de se terminer (après une génération).
+
+        Returns:
+            list: Grilles terminées (Outcome)
+        """
+        units = self._units(self.cells)
+        hashes = cycles.batch_hashes(units)
+        period = np.zeros(len(self.ids), dtype=np.int64)
+        # Grille éteinte (ni cellule vivante ni cellule mourante) sans naissance
+        # sans voisin (B0) : elle restera vide, nature morte dès maintenant. Une
+        # population nulle ne suffit pas (cellules mourantes, règle B0)
+        if 0 not in self.rule.births:
+            period[~units.any(axis=1)] = 1
+        # État déjà rencontré k générations plus tôt : la plus petite période l'emporte
+        for k in range(self.max_period, 0, -1):
+            seen = (self._hashes[(self._tick - k) % self.max_period] == hashes) & (self.ages >= k)
+            period[seen] = k
+        self._hashes[self._tick % self.max_period] = hashes
+
+        # Limite de générations : terminée sans stabilisation (période 0)
+        ended = period > 0
+        if self.max_generations is not None:
+            ended |= self.ages >= self.max_generations
+        ended &= ~self.done
+        self.done |= ended
+        return [Outcome(int(self.ids[k]), self.seeds[k], int(self.ages[k]), int(period[k]),
+                        int(self.population[k]), self._grid(self.cells, k))
+                for k in np.flatnonzero(ended)]
+
+    def compact(self):
+        """
+        Retire du lot les grilles terminées.
+        """
+        if not self.done.any():
+            return
+        keep = np.flatnonzero(~self.done)
+        self.cells = self.cells[:, keep]
+        self._next = self._make_cells(len(keep))
+        self.ids = self.ids[keep]
+        self.seeds = [self.seeds[k] for k in keep]
+        self.ages = self.ages[keep]
+        self.population = self.population[keep]
+        self.done = self.done[keep]
+        self._hashes = self._hashes[:, keep]
+
+    def run(self, generations=None):
+        """
+        Calcule jusqu'à ce que toutes les grilles soient terminées.
+
+        Args:
+            generations (int, optional): Nombre maximal de générations (None :
+                jusqu'à la fin de toutes les grilles, max_generations conseillé)
+
+        Returns:
+            list: Grilles terminées (Outcome)
+        """
+        finished = []
+        while len(self.ids) and (generations is None or generations > 0):
+            step = 16 if generations is None else min(16, generations)
+            finished.extend(self.step(step))
+            if generations is not None:
+                generations -= step
+        return finished
+
+class BitPackedEnsemble(Ensemble):
+    """
+    Lot de grilles bit-packed (64 cellules par mot) : tableau uint64
+    (n + 2, B, mots), calculé avec les additionneurs bit à bit du moteur
+    bit-packed. Règles à deux états et de rayon 1 uniquement.
+    """
+
+    def __init__(self, size, *args, **kwargs):
+        """
+        Crée un lot vide (mêmes arguments que Ensemble).
+        """
+        # Masque des colonnes intérieures (1 à n) : les bits de bordure restent à 0
+        if np is not None:
+            mask = np.zeros((1, size + 2), dtype=np.uint8)
+            mask[0, 1:size + 1] = 1
+            self._mask = engines._pack(mask, (size + 65) // 64)[0]
+        super().__init__(size, *args, **kwargs)
+
+    @classmethod
+    def supports(cls, rule):
+        """
+        Indique si le lot peut appliquer une règle.
+
+        Args:
+            rule (gamelife_rules.Rule ou RangeRule): Règle compilée
+
+        Returns:
+            bool: True pour une règle à deux états de rayon 1
+        """
+        return rule.table is not None and rule.states == 2
+
+    def _make_cells(self, count):
+        """
+        Crée le tableau de count grilles vides.
+
+        Args:
+            count (int): Nombre de grilles
+
+        Returns:
+            numpy.ndarray: Tableau uint64 (n + 2, count, mots)
+        """
+        return np.zeros((self.size + 2, count, len(self._mask)), dtype=np.uint64)
+
+    def _pack_cells(self, grids):
+        """
+        Convertit des grilles n x n dans le format du lot.
+
+        Args:
+            grids (numpy.ndarray): Tableau (count, n, n) de 0 et de 1
+
+        Returns:
+            numpy.ndarray: Grilles bordées au format du lot
+        """
+        cells = self._make_cells(len(grids))
+        bordered = np.zeros((self.size, len(grids), self.size + 2), dtype=np.uint8)
+        bordered[:, :, 1:self.size + 1] = grids.transpose(1, 0, 2) == 1
+        words = engines._pack(bordered.reshape(-1, self.size + 2), cells.shape[2])
+        cells[1:-1] = words.reshape(self.size, len(grids), -1)
+        return cells
+
+    def _units(self, cells):
+        """
+        Unités hachées de chaque grille (mots de 64 cellules).
+
+        Args:
+            cells (numpy.ndarray): Grilles au format du lot
+
+        Returns:
+            numpy.ndarray: Tableau uint64 (grilles, unités par grille)
+        """
+        return cells.transpose(1, 0, 2).reshape(cells.shape[1], -1)
+
+    def _count_live(self, cells):
+        """
+        Population de chaque grille (bits à 1).
+
+        Args:
+            cells (numpy.ndarray): Grilles au format du lot
+
+        Returns:
+            numpy.ndarray: Population de chaque grille
+        """
+        # NumPy 2 : comptage natif ; sinon décompression des octets de chaque grille
+        if hasattr(np, "bitwise_count"):
+            return np.bitwise_count(cells).sum(axis=(0, 2), dtype=np.int64)
+        raw = np.ascontiguousarray(self._units(cells)).view(np.uint8)
+        return np.unpackbits(raw, axis=1).sum(axis=1, dtype=np.int64)
+
+    def _step(self, src, dst):
+        """
+        Calcule la génération suivante de toutes les grilles (comme
+        BitPackedEngine._step_block, les grilles du lot côte à côte).
+
+        Args:
+            src (numpy.ndarray): Grilles actuelles
+            dst (numpy.ndarray): Grilles suivantes, modifiées sur place
+        """
+        # Voisins ouest et est : colonnes j-1 et j+1 amenées sur le bit j
+        west = src << 1
+        west[:, :, 1:] |= src[:, :, :-1] >> 63
+        east = src >> 1
+        east[:, :, :-1] |= src[:, :, 1:] << 63
+        dst[1:-1] = engines._life_words(src, west, east, self._terms) & self._mask
+
+    def _grid(self, cells, k):
+        """
+        Extrait une grille du lot.
+
+        Args:
+            cells (numpy.ndarray): Grilles au format du lot
+            k (int): Rang de la grille dans le lot
+
+        Returns:
+            numpy.ndarray: Cellules n x n (uint8)
+        """
+        return engines._unpack(cells[1:-1, k], self.size + 1)[:, 1:]
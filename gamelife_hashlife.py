@@ -0,0 +1,1019 @@
+"""
+Game of Life - Moteur HashLife
+Algorithme de Gosper pour les très longues simulations (canons, breeders) :
+- Quadtree de nœuds canoniques (hash-consing) : deux carrés identiques
+  sont représentés par le même objet
+- Cache mémoïsé des résultats (RESULT) de taille bornée, avec éviction LRU
+- Saut de 2^k générations par étape
+
+Chaque moteur possède ses tables (HashLife) : la règle et les résultats
+mémorisés ne sont pas partagés entre simulations.
+La grille du moteur est le quadtree lui-même (QuadGrid) : il est conservé
+d'une étape à l'autre et n'est converti en tableau ou en listes que pour
+les générations affichées ou sauvegardées (to_array, to_list).
+Pendant un saut, l'univers est un plan infini ; les cellules sorties de la
+fenêtre n x n sont supprimées à la fin de chaque étape.
+"""
+
+from collections import OrderedDict
+
+import gamelife_engines as engines
+import gamelife_rules as rules
+
+np = engines.np
+
+# Paramètres du cache
+CACHE_SIZE = 500000  # Nombre maximal de résultats mémorisés (éviction LRU au-delà)
+NODE_LIMIT = 4000000  # Nombre de nœuds canoniques au-delà duquel les tables sont vidées
+DEFAULT_JUMP = 0  # Exposant k par défaut : 2^k générations par étape
+BLOCK_LEVEL = 3  # Niveau des blocs 8 x 8 (un mot de 64 bits) lus par diff et to_array
+
+class Node:
+    """
+    Nœud du quadtree : carré de côté 2^level découpé en quatre quadrants.
+    Les nœuds sont canoniques (créés uniquement par join), on peut donc
+    les comparer et les utiliser comme clés par identité.
+    """
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "pop")
+
+    def __init__(self, level, nw, ne, sw, se, pop):
+        """
+        Initialise un nœud (utiliser join pour obtenir un nœud canonique).
+
+        Args:
+            level (int): Niveau du nœud (côté = 2^level cellules)
+            nw, ne, sw, se (Node): Quadrants nord-ouest, nord-est, sud-ouest, sud-est
+            pop (int): Nombre de cellules vivantes dans le carré
+        """
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.pop = pop
+
+# Feuilles (niveau 0) : cellule morte et cellule vivante
+DEAD = Node(0, None, None, None, None, 0)
+ALIVE = Node(0, None, None, None, None, 1)
+
+class HashLife:
+    """
+    Tables d'un univers HashLife : hash-consing des nœuds, carrés vides,
+    cache des résultats et règle appliquée.
+    Chaque moteur possède ses propres tables : deux simulations avec des
+    règles différentes ne partagent ni la règle ni les résultats mémorisés.
+    """
+
+    def __init__(self, rule=rules.CONWAY):
+        """
+        Initialise des tables vides.
+
+        Args:
+            rule (gamelife_rules.Rule): Règle compilée appliquée par le cas de base
+        """
+        # Table de hash-consing : (nw, ne, sw, se) -> nœud canonique
+        self.nodes = {}
+        # Carrés vides déjà construits, indexés par niveau
+        self.empties = {0: DEAD}
+        # Cache des résultats : (nœud, j) -> centre du nœud avancé de 2^j générations
+        self.results = OrderedDict()
+        # Table de la règle appliquée par _life_4x4 (voir set_rule)
+        self.table = rule.table
+        # Mémos de lecture : boîte englobante par nœud, mot des blocs 8 x 8,
+        # carré 4 x 4 par clé de 16 bits (voir bounds, word et from_array)
+        self.boxes = {}
+        self.words = {}
+        self.squares = {}
+
+    def join(self, nw, ne, sw, se):
+        """
+        Retourne le nœud canonique formé de quatre quadrants de même niveau.
+
+        Args:
+            nw, ne, sw, se (Node): Quadrants nord-ouest, nord-est, sud-ouest, sud-est
+
+        Returns:
+            Node: Nœud de niveau supérieur (toujours le même objet pour les mêmes quadrants)
+        """
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+        if node is None:
+            node = Node(nw.level + 1, nw, ne, sw, se, nw.pop + ne.pop + sw.pop + se.pop)
+            self.nodes[key] = node
+        return node
+
+    def empty(self, level):
+        """
+        Retourne le carré vide de côté 2^level.
+
+        Args:
+            level (int): Niveau du carré
+
+        Returns:
+            Node: Nœud canonique sans cellule vivante
+        """
+        node = self.empties.get(level)
+        if node is None:
+            sub = self.empty(level - 1)
+            node = self.join(sub, sub, sub, sub)
+            self.empties[level] = node
+        return node
+
+    def centre(self, node):
+        """
+        Entoure un nœud d'une marge vide : le nœud devient le centre d'un carré deux fois plus grand.
+
+        Args:
+            node (Node): Nœud de niveau >= 1
+
+        Returns:
+            Node: Nœud de niveau node.level + 1
+        """
+        join = self.join
+        border = self.empty(node.level - 1)
+        return join(
+            join(border, border, border, node.nw),
+            join(border, border, node.ne, border),
+            join(border, node.sw, border, border),
+            join(node.se, border, border, border),
+        )
+
+    def clear(self):
+        """
+        Vide la table des nœuds et le cache des résultats (éviction par génération).
+        Les nœuds déjà construits restent valides, ils ne sont simplement plus partagés.
+        """
+        self.nodes.clear()
+        self.results.clear()
+        self.empties.clear()
+        self.empties[0] = DEAD
+        self.boxes.clear()
+        self.words.clear()
+        self.squares.clear()
+
+    def set_rule(self, rule):
+        """
+        Change la règle appliquée par le cas de base.
+        Les résultats mémorisés dépendent de la règle : le cache est vidé si elle change.
+
+        Args:
+            rule (gamelife_rules.Rule): Règle compilée (sans naissance à 0 voisin)
+        """
+        if rule.table != self.table:
+            self.table = rule.table
+            self.results.clear()
+
+    def _life_4x4(self, node):
+        """
+        Cas de base : centre 2x2 d'un carré 4x4 après une génération.
+
+        Args:
+            node (Node): Nœud de niveau 2
+
+        Returns:
+            Node: Nœud de niveau 1
+        """
+        # Cellules du carré 4x4, ligne par ligne
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        cells = (
+            (nw.nw.pop, nw.ne.pop, ne.nw.pop, ne.ne.pop),
+            (nw.sw.pop, nw.se.pop, ne.sw.pop, ne.se.pop),
+            (sw.nw.pop, sw.ne.pop, se.nw.pop, se.ne.pop),
+            (sw.sw.pop, sw.se.pop, se.sw.pop, se.se.pop),
+        )
+        table = self.table
+
+        def rule(i, j):
+            """Applique la règle à la cellule (i, j) du carré 4x4."""
+            # Masque du voisinage 3x3 (bit 3 * colonne + ligne, voir gamelife_rules)
+            mask = 0
+            for di in (-1, 0, 1):
+                for dj in (-1, 0, 1):
+                    mask |= cells[i + di][j + dj] << (3 * (dj + 1) + di + 1)
+            return ALIVE if table[mask] else DEAD
+
+        return self.join(rule(1, 1), rule(1, 2), rule(2, 1), rule(2, 2))
+
+    def successor(self, node, j):
+        """
+        Avance le centre d'un nœud de 2^j générations (algorithme de Gosper).
+
+        Args:
+            node (Node): Nœud de niveau k >= 2
+            j (int): Exposant du saut (limité à k - 2)
+
+        Returns:
+            Node: Centre du nœud (niveau k - 1) après 2^j générations
+        """
+        # Un carré vide reste vide
+        if node.pop == 0:
+            return node.nw
+
+        j = min(j, node.level - 2)
+        key = (node, j)
+        results = self.results
+
+        # Résultat déjà calculé : le marque comme récemment utilisé
+        result = results.get(key)
+        if result is not None:
+            results.move_to_end(key)
+            return result
+
+        if node.level == 2:
+            # Cas de base : une génération sur un carré 4x4
+            result = self._life_4x4(node)
+        else:
+            join, successor = self.join, self.successor
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # Neuf sous-carrés de niveau k - 1 qui se chevauchent, avancés de 2^j générations
+            c1 = successor(nw, j)
+            c2 = successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = successor(ne, j)
+            c4 = successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = successor(sw, j)
+            c8 = successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = successor(se, j)
+
+            if j < node.level - 2:
+                # Saut plus court que le maximum : on recompose les centres sans avancer
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # Saut maximal : une seconde moitié de saut sur les quatre carrés intermédiaires
+                result = join(
+                    successor(join(c1, c2, c4, c5), j),
+                    successor(join(c2, c3, c5, c6), j),
+                    successor(join(c4, c5, c7, c8), j),
+                    successor(join(c5, c6, c8, c9), j),
+                )
+
+        # Mémorise le résultat en respectant la taille maximale du cache
+        results[key] = result
+        if len(results) > CACHE_SIZE:
+            results.popitem(last=False)
+        return result
+
+    def inner(self, node):
+        """
+        Centre d'un nœud : carré de côté moitié, au milieu du nœud.
+
+        Args:
+            node (Node): Nœud de niveau >= 2
+
+        Returns:
+            Node: Nœud de niveau node.level - 1
+        """
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def advance(self, root, jump):
+        """
+        Avance le carré root (entouré de cellules mortes) de 2^jump générations.
+        Pendant le saut, l'univers est un plan infini : les cellules sorties du
+        carré sont perdues, celles qui y reviennent avant la fin du saut sont gardées.
+
+        Args:
+            root (Node): Nœud de départ
+            jump (int): Exposant du saut
+
+        Returns:
+            Node: Nœud de même niveau que root après 2^jump générations
+        """
+        # Ajoute des marges vides : successor n'accepte que j <= niveau - 2
+        node, margins = self.centre(root), 1
+        while node.level < jump + 2:
+            node, margins = self.centre(node), margins + 1
+
+        # Le résultat est le centre du nœud : on retire les marges restantes
+        result = self.successor(node, jump)
+        for _ in range(margins - 1):
+            result = self.inner(result)
+        return result
+
+    def crop(self, node, size, x=0, y=0):
+        """
+        Tue les cellules situées hors du carré [0, size) x [0, size).
+
+        Args:
+            node (Node): Nœud dont le coin nord-ouest est en (x, y)
+            size (int): Côté de la fenêtre conservée
+            x (int): Colonne du coin nord-ouest du nœud
+            y (int): Ligne du coin nord-ouest du nœud
+
+        Returns:
+            Node: Nœud de même niveau, sans cellule hors de la fenêtre
+        """
+        side = 1 << node.level
+        # Nœud vide ou entièrement dans la fenêtre : inchangé
+        if node.pop == 0 or (x + side <= size and y + side <= size):
+            return node
+        # Nœud entièrement hors de la fenêtre
+        if x >= size or y >= size:
+            return self.empty(node.level)
+        half = side >> 1
+        return self.join(
+            self.crop(node.nw, size, x, y),
+            self.crop(node.ne, size, x + half, y),
+            self.crop(node.sw, size, x, y + half),
+            self.crop(node.se, size, x + half, y + half),
+        )
+
+    def get(self, node, x, y):
+        """
+        Retourne l'état d'une cellule d'un nœud.
+
+        Args:
+            node (Node): Nœud parcouru
+            x (int): Colonne de la cellule dans le nœud
+            y (int): Ligne de la cellule dans le nœud
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 sinon
+        """
+        while node.level and node.pop:
+            half = 1 << (node.level - 1)
+            if y < half:
+                node = node.nw if x < half else node.ne
+            else:
+                node = node.sw if x < half else node.se
+            x &= half - 1
+            y &= half - 1
+        return node.pop
+
+    def set(self, node, x, y, value):
+        """
+        Retourne le nœud dont une cellule a été modifiée (les nœuds ne
+        changent jamais : seul le chemin de la racine à la cellule est recréé).
+
+        Args:
+            node (Node): Nœud d'origine
+            x (int): Colonne de la cellule dans le nœud
+            y (int): Ligne de la cellule dans le nœud
+            value (int): Nouvel état (1 = vivante, 0 = morte)
+
+        Returns:
+            Node: Nœud modifié
+        """
+        if node.level == 0:
+            return ALIVE if value else DEAD
+        half = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if y < half:
+            if x < half:
+                nw = self.set(nw, x, y, value)
+            else:
+                ne = self.set(ne, x - half, y, value)
+        elif x < half:
+            sw = self.set(sw, x, y - half, value)
+        else:
+            se = self.set(se, x - half, y - half, value)
+        return self.join(nw, ne, sw, se)
+
+    def bounds(self, node):
+        """
+        Boîte englobante des cellules vivantes d'un nœud (mémorisée par nœud :
+        seuls les nœuds créés depuis le dernier appel sont parcourus).
+
+        Args:
+            node (Node): Nœud parcouru
+
+        Returns:
+            tuple: (haut, gauche, bas, droite) relatifs au coin nord-ouest,
+                bornes bas et droite exclues, ou None si le nœud est vide
+        """
+        if node.pop == 0:
+            return None
+        box = self.boxes.get(node)
+        if box is None:
+            if node.level == 0:
+                box = (0, 0, 1, 1)
+            else:
+                half = 1 << (node.level - 1)
+                for child, dy, dx in ((node.nw, 0, 0), (node.ne, 0, half),
+                                      (node.sw, half, 0), (node.se, half, half)):
+                    sub = self.bounds(child)
+                    if sub is None:
+                        continue
+                    top, left, bottom, right = sub[0] + dy, sub[1] + dx, sub[2] + dy, sub[3] + dx
+                    if box is not None:
+                        top, left = min(top, box[0]), min(left, box[1])
+                        bottom, right = max(bottom, box[2]), max(right, box[3])
+                    box = (top, left, bottom, right)
+            self.boxes[node] = box
+        return box
+
+    def word(self, node):
+        """
+        Cellules d'un nœud de niveau <= 3 sous forme d'entier : la cellule
+        (x, y) est le bit 8 * y + x (un bloc 8 x 8 tient dans un mot de 64 bits).
+
+        Args:
+            node (Node): Nœud de niveau 0 à 3
+
+        Returns:
+            int: Mot des cellules vivantes
+        """
+        if node.pop == 0:
+            return 0
+        word = self.words.get(node)
+        if word is None:
+            if node.level == 0:
+                word = 1
+            else:
+                half = 1 << (node.level - 1)
+                word = (self.word(node.nw) | self.word(node.ne) << half |
+                        self.word(node.sw) << 8 * half | self.word(node.se) << (8 * half + half))
+            self.words[node] = word
+        return word
+
+    def blocks(self, node, x=0, y=0):
+        """
+        Parcourt les blocs 8 x 8 (nœuds de niveau 3) non vides d'un nœud.
+
+        Args:
+            node (Node): Nœud de niveau >= 3
+            x (int): Colonne du coin nord-ouest du nœud
+            y (int): Ligne du coin nord-ouest du nœud
+
+        Yields:
+            tuple: (ligne, colonne, mot) du coin nord-ouest du bloc et de ses cellules
+        """
+        if node.pop == 0:
+            return
+        if node.level == BLOCK_LEVEL:
+            yield y, x, self.word(node)
+            return
+        half = 1 << (node.level - 1)
+        yield from self.blocks(node.nw, x, y)
+        yield from self.blocks(node.ne, x + half, y)
+        yield from self.blocks(node.sw, x, y + half)
+        yield from self.blocks(node.se, x + half, y + half)
+
+    def changed_blocks(self, old, new, stride, x=0, y=0, out=None):
+        """
+        Blocs 8 x 8 qui diffèrent entre deux nœuds de même niveau ; les
+        sous-arbres identiques (le même nœud canonique) ne sont pas parcourus.
+
+        Args:
+            old (Node): Nœud précédent
+            new (Node): Nœud actuel
+            stride (int): Nombre de blocs par ligne de la racine
+            x (int): Colonne du coin nord-ouest des nœuds
+            y (int): Ligne du coin nord-ouest des nœuds
+            out (tuple, optional): Listes (positions, avant, après) complétées
+
+        Returns:
+            tuple: (positions, mots avant, mots après), listes Python ; la
+                position d'un bloc est son rang dans l'ordre de lecture
+        """
+        if out is None:
+            out = ([], [], [])
+        if old is new:
+            return out
+        if old.level == BLOCK_LEVEL:
+            out[0].append((y >> BLOCK_LEVEL) * stride + (x >> BLOCK_LEVEL))
+            out[1].append(self.word(old))
+            out[2].append(self.word(new))
+            return out
+        half = 1 << (old.level - 1)
+        self.changed_blocks(old.nw, new.nw, stride, x, y, out)
+        self.changed_blocks(old.ne, new.ne, stride, x + half, y, out)
+        self.changed_blocks(old.sw, new.sw, stride, x, y + half, out)
+        self.changed_blocks(old.se, new.se, stride, x + half, y + half, out)
+        return out
+
+    def build(self, level, x0, y0, cells):
+        """
+        Construit le nœud couvrant le carré d'origine (x0, y0) et de côté 2^level.
+
+        Args:
+            level (int): Niveau du nœud
+            x0 (int): Colonne du coin nord-ouest
+            y0 (int): Ligne du coin nord-ouest
+            cells (list): Cellules vivantes (x, y) contenues dans le carré
+
+        Returns:
+            Node: Nœud canonique
+        """
+        # Carré sans cellule vivante
+        if not cells:
+            return self.empty(level)
+        # Feuille : une cellule vivante
+        if level == 0:
+            return ALIVE
+
+        # Répartit les cellules entre les quatre quadrants
+        half = 1 << (level - 1)
+        quadrants = ([], [], [], [])
+        for x, y in cells:
+            quadrants[(2 if y >= y0 + half else 0) + (1 if x >= x0 + half else 0)].append((x, y))
+
+        return self.join(
+            self.build(level - 1, x0, y0, quadrants[0]),
+            self.build(level - 1, x0 + half, y0, quadrants[1]),
+            self.build(level - 1, x0, y0 + half, quadrants[2]),
+            self.build(level - 1, x0 + half, y0 + half, quadrants[3]),
+        )
+
+    def from_array(self, level, cells):
+        """
+        Construit le nœud d'un tableau de cellules (NumPy) : les carrés 4 x 4
+        sont lus en une fois sous forme de clés de 16 bits, puis les nœuds sont
+        assemblés niveau par niveau (un seul nœud par motif distinct).
+
+        Args:
+            level (int): Niveau du nœud (>= 3)
+            cells (numpy.ndarray): Cellules (0 ou 1), au plus 2^level x 2^level
+
+        Returns:
+            Node: Nœud canonique dont le coin nord-ouest est la cellule [0, 0]
+        """
+        side = 1 << level
+        padded = np.zeros((side, side), dtype=np.uint8)
+        padded[:cells.shape[0], :cells.shape[1]] = cells
+
+        # Clé de chaque carré 4 x 4 (bit 4 * ligne + colonne), rangée par bloc 8 x 8
+        blocks = side >> BLOCK_LEVEL
+        squares = padded.reshape(blocks, 2, 4, blocks, 2, 4).transpose(0, 3, 1, 4, 2, 5)
+        keys = np.packbits(squares.reshape(blocks, blocks, 4, 16), axis=-1, bitorder="little")
+        keys = keys.view("<u2").reshape(blocks, blocks, 4).astype(np.uint64)
+
+        # Un nœud de niveau 3 par motif distinct (quatre clés de 16 bits)
+        patterns = keys[..., 0] | keys[..., 1] << np.uint64(16) | keys[..., 2] << np.uint64(32) | keys[..., 3] << np.uint64(48)
+        unique, inverse = np.unique(patterns, return_inverse=True)
+        nodes = [self._block(int(pattern)) for pattern in unique]
+        grid = [[nodes[k] for k in row] for row in inverse.reshape(blocks, blocks).tolist()]
+
+        # Assemble les nœuds quatre par quatre jusqu'à la racine
+        join = self.join
+        while len(grid) > 1:
+            grid = [[join(upper[j], upper[j + 1], lower[j], lower[j + 1])
+                     for j in range(0, len(upper), 2)]
+                    for upper, lower in zip(grid[::2], grid[1::2])]
+        return grid[0][0]
+
+    def _block(self, pattern):
+        """
+        Nœud de niveau 3 de quatre carrés 4 x 4 (voir from_array).
+
+        Args:
+            pattern (int): Clés de 16 bits des quadrants nw, ne, sw, se
+
+        Returns:
+            Node: Nœud canonique de niveau 3
+        """
+        quadrants = []
+        for shift in (0, 16, 32, 48):
+            key = (pattern >> shift) & 0xFFFF
+            node = self.squares.get(key)
+            if node is None:
+                # Carré 4 x 4 : quatre carrés 2 x 2 de cellules
+                node = self.join(*(self.join(*(ALIVE if key >> (4 * (2 * qy + y) + 2 * qx + x) & 1 else DEAD
+                                               for y in (0, 1) for x in (0, 1)))
+                                   for qy in (0, 1) for qx in (0, 1)))
+                self.squares[key] = node
+            quadrants.append(node)
+        return self.join(*quadrants)
+
+def export_grid(node, x0, y0, grid):
+    """
+    Écrit les cellules d'un quadtree dans une grille de make_grid.
+    Les cellules hors de la fenêtre n x n sont ignorées.
+
+    Args:
+        node (Node): Nœud à exporter
+        x0 (int): Colonne du coin nord-ouest du nœud
+        y0 (int): Ligne du coin nord-ouest du nœud
+        grid (list): Grille (size + 2) x (size + 2), modifiée sur place
+    """
+    size = len(grid) - 2
+
+    # Vide l'intérieur de la grille avant d'y écrire les cellules vivantes
+    for i in range(1, size + 1):
+        grid[i][1:size + 1] = [0] * size
+
+    def write(node, x, y):
+        """Parcourt récursivement les nœuds non vides situés dans la fenêtre."""
+        side = 1 << node.level
+        # Nœud vide ou entièrement hors de la fenêtre
+        if node.pop == 0 or x >= size or y >= size or x + side <= 0 or y + side <= 0:
+            return
+        if node.level == 0:
+            grid[y + 1][x + 1] = 1
+            return
+        half = side >> 1
+        write(node.nw, x, y)
+        write(node.ne, x + half, y)
+        write(node.sw, x, y + half)
+        write(node.se, x + half, y + half)
+
+    write(node, x0, y0)
+
+
+class QuadGrid:
+    """
+    Grille du moteur HashLife : fenêtre n x n portée par un quadtree.
+    La cellule (i, j) de la grille (1 à n, comme make_grid) est la cellule
+    (x = j - 1, y = i - 1) de la racine. Les nœuds ne sont jamais modifiés :
+    une copie partage la racine.
+    """
+
+    def __init__(self, size, root):
+        """
+        Args:
+            size (int): Taille de la fenêtre (n x n cellules)
+            root (Node): Racine du quadtree (côté 2^level >= size)
+        """
+        self.size = size  # Taille de la fenêtre
+        self.root = root  # Racine du quadtree (cellules hors de la fenêtre mortes)
+
+    def __len__(self):
+        """
+        Nombre de lignes de la fenêtre bordée (même convention que make_grid).
+
+        Returns:
+            int: size + 2
+        """
+        return self.size + 2
+
+    def copy(self):
+        """
+        Copie la grille (utilisé par copy_grid et les instantanés), sans copier de nœud.
+
+        Returns:
+            QuadGrid: Copie indépendante
+        """
+        return QuadGrid(self.size, self.root)
+
+def grid_level(size):
+    """
+    Niveau de la racine d'une fenêtre size x size.
+
+    Args:
+        size (int): Taille de la fenêtre
+
+    Returns:
+        int: Plus petit niveau dont le carré contient la fenêtre (au moins un bloc 8 x 8)
+    """
+    return max(BLOCK_LEVEL, (size - 1).bit_length())
+
+class HashLifeEngine:
+    """
+    Moteur HashLife pour gamelife_core.
+    La grille est un quadtree (QuadGrid) conservé entre les étapes ; chaque
+    appel à step avance d'au plus 2^jump générations (barrier_action ajoute
+    generations_per_step au compteur). La grille reste bornée : le saut est
+    réduit tant que le motif pourrait atteindre le bord pendant l'étape.
+    """
+
+    name = "hashlife"  # Nom du moteur (utilisé par start_workers)
+    requires_numpy = False  # Fonctionne en Python pur (NumPy accélère les conversions)
+    changed = None  # Cellules modifiées par la dernière génération (None = non suivi)
+    generations_per_step = 1  # Générations calculées par le dernier appel à step (voir set_jump)
+    jumps = True  # Le nombre de générations par étape se règle (voir set_jump)
+    tallies = False  # census compte les cellules modifiées données par diff (voir NumpyEngine.set_tally)
+    splittable = False  # Tout le quadtree est avancé par un seul thread
+    unbounded = False  # La grille est bornée (les cellules hors de la fenêtre meurent)
+    topologies = ("plane",)  # Seule la bordure morte est gérée
+    supports_b0 = False  # Les règles B0 font naître des cellules loin de toute activité
+    multistate = False  # Cellules vivantes ou mortes uniquement
+    max_radius = 1  # Voisinage 3x3 uniquement
+    clips = False  # Les carrés vides ne sont jamais calculés (voir HashLife.successor)
+    cost_model = (0.0, 1e-7, 1.4e-5)  # Coûteux sur une soupe, rapide sur un motif régulier
+    rule = rules.CONWAY  # Règle appliquée (voir set_rule)
+
+    def __init__(self, jump=DEFAULT_JUMP):
+        """
+        Initialise le moteur et ses propres tables HashLife.
+
+        Args:
+            jump (int): Exposant k du saut (2^k générations par étape)
+        """
+        self.size = 0  # Taille de la fenêtre
+        self.level = BLOCK_LEVEL  # Niveau des racines (voir grid_level)
+        self.life = HashLife(self.rule)
+        self.set_jump(jump)
+
+    def set_rule(self, rule):
+        """
+        Change la règle appliquée (le cache des résultats est propre au moteur).
+
+        Args:
+            rule (gamelife_rules.Rule): Règle compilée
+        """
+        self.rule = rule
+        self.life.set_rule(rule)
+
+    def set_jump(self, jump):
+        """
+        Modifie le nombre maximal de générations calculées par étape.
+
+        Args:
+            jump (int): Exposant k du saut (au plus 2^k générations par étape)
+        """
+        self.jump = max(0, int(jump))
+        self.generations_per_step = 1 << self.jump
+
+    def make_grid(self, size):
+        """
+        Crée une grille vide size x size.
+
+        Args:
+            size (int): Taille de la fenêtre (n x n cellules)
+
+        Returns:
+            QuadGrid: Grille vide
+        """
+        self.size = size
+        self.level = grid_level(size)
+        return QuadGrid(size, self.life.empty(self.level))
+
+    def grid_bytes(self, size):
+        """
+        Estime la mémoire d'une soupe size x size : de l'ordre d'un nœud
+        (avec son entrée de table et son résultat mémorisé) par carré 4 x 4.
+
+        Args:
+            size (int): Taille de la fenêtre
+
+        Returns:
+            int: Nombre d'octets
+        """
+        return size * size * 16
+
+    def bounded_jump(self, grid):
+        """
+        Plus grand saut sans effet de bord : en 2^k générations, le motif s'étend
+        d'au plus 2^k cellules, il ne doit pas atteindre l'extérieur de la fenêtre
+        (où les cellules meurent). Une génération est toujours exacte, les
+        cellules nées hors de la fenêtre étant retirées par crop.
+
+        Args:
+            grid (QuadGrid): Grille actuelle
+
+        Returns:
+            int: Exposant du saut, au plus self.jump
+        """
+        box = self.life.bounds(grid.root)
+        if box is None:
+            return self.jump
+        top, left, bottom, right = box
+        margin = min(top, left, grid.size - bottom, grid.size - right)
+        return min(self.jump, max(0, margin.bit_length() - 1))
+
+    def step(self, src, dst):
+        """
+        Avance src d'au plus 2^jump générations (voir bounded_jump) et place le
+        résultat dans dst ; generations_per_step donne le nombre calculé.
+
+        Args:
+            src (QuadGrid): Grille actuelle (T)
+            dst (QuadGrid): Grille suivante (Tnext), racine remplacée
+        """
+        life = self.life
+        # Trop de nœuds mémorisés : on repart de tables vides
+        if len(life.nodes) > NODE_LIMIT:
+            life.clear()
+        jump = self.bounded_jump(src)
+        self.generations_per_step = 1 << jump
+        dst.root = life.crop(life.advance(src.root, jump), src.size)
+
+    def _adopt(self, grid, cells):
+        """
+        Remplace le contenu d'une grille par des cellules (intérieur de la fenêtre).
+
+        Args:
+            grid (QuadGrid): Grille modifiée
+            cells: Cellules vivantes, tableau NumPy (0 ou 1), ou liste de
+                positions (x, y) sans NumPy
+        """
+        if np is not None:
+            grid.root = self.life.from_array(self.level, cells[:grid.size, :grid.size])
+        else:
+            grid.root = self.life.build(self.level, 0, 0, cells)
+
+    def get_cell(self, grid, i, j):
+        """
+        Retourne l'état de la cellule (i, j).
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+
+        Returns:
+            int: 1 si la cellule est vivante, 0 sinon
+        """
+        if not (1 <= i <= grid.size and 1 <= j <= grid.size):
+            return 0
+        return self.life.get(grid.root, j - 1, i - 1)
+
+    def set_cell(self, grid, i, j, value):
+        """
+        Modifie l'état de la cellule (i, j).
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+            i (int): Ligne de la cellule (1 à n)
+            j (int): Colonne de la cellule (1 à n)
+            value (int): Nouvel état (1 = vivante, 0 = morte)
+        """
+        grid.root = self.life.set(grid.root, j - 1, i - 1, 1 if value else 0)
+
+    def to_array(self, grid):
+        """
+        Retourne la fenêtre sous forme de tableau uint8 (n + 2) x (n + 2)
+        (la bordure reste à 0, comme make_grid) ; seuls les blocs 8 x 8 non
+        vides sont lus.
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+
+        Returns:
+            numpy.ndarray: Tableau d'octets (une cellule par octet)
+        """
+        side = 1 << grid.root.level
+        blocks = side >> BLOCK_LEVEL
+        cells = np.zeros((blocks, blocks, 8, 8), dtype=np.uint8)
+        found = list(self.life.blocks(grid.root))
+        if found:
+            rows, cols, words = zip(*found)
+            bits = np.unpackbits(np.array(words, dtype="<u8").view(np.uint8), bitorder="little")
+            cells[np.array(rows) >> BLOCK_LEVEL, np.array(cols) >> BLOCK_LEVEL] = bits.reshape(-1, 8, 8)
+        grid_cells = np.zeros((grid.size + 2, grid.size + 2), dtype=np.uint8)
+        grid_cells[1:-1, 1:-1] = cells.transpose(0, 2, 1, 3).reshape(side, side)[:grid.size, :grid.size]
+        return grid_cells
+
+    def to_list(self, grid):
+        """
+        Convertit la fenêtre en liste de listes (format de make_grid).
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+
+        Returns:
+            list: Grille 2D sous forme de listes Python
+        """
+        if np is not None:
+            return self.to_array(grid).tolist()
+        cells = [[0] * (grid.size + 2) for _ in range(grid.size + 2)]
+        export_grid(grid.root, 0, 0, cells)
+        return cells
+
+    def load(self, grid, state):
+        """
+        Remplace le contenu de la grille par un état : une grille du moteur
+        (copie de l'historique, racine partagée) ou une grille bordée (liste de
+        listes, tableau). Si les tailles diffèrent, seule la partie commune est copiée.
+
+        Args:
+            grid (QuadGrid): Grille du moteur, modifiée sur place
+            state: État à restaurer
+        """
+        if isinstance(state, QuadGrid):
+            if state.size == grid.size:
+                grid.root = state.root
+                return
+            state = self.to_list(state)
+
+        if np is not None:
+            self._adopt(grid, engines._live_cells(state)[1:grid.size + 1, 1:grid.size + 1])
+            return
+        # Deux états : une cellule mourante (règle Generations) est morte
+        size = min(len(state) - 2, grid.size)
+        self._adopt(grid, [(j - 1, i - 1) for i in range(1, size + 1)
+                           for j, value in enumerate(state[i][:grid.size + 1])
+                           if value == 1 and j >= 1])
+
+    def any(self, grid):
+        """
+        Indique si au moins une cellule est vivante.
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+
+        Returns:
+            bool: True si une cellule est vivante
+        """
+        return grid.root.pop > 0
+
+    def bounds(self, grid, region=None):
+        """
+        Boîte englobante des cellules vivantes (mémorisée par nœud, voir HashLife.bounds).
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+            region (tuple, optional): Ignorée (seuls les nœuds nouveaux sont parcourus)
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), bornes bas et droite exclues,
+                ou None si la grille est vide
+        """
+        box = self.life.bounds(grid.root)
+        if box is None:
+            return None
+        top, left, bottom, right = box
+        return top + 1, left + 1, bottom + 1, right + 1
+
+    def diff(self, old, new, region=None):
+        """
+        Blocs 8 x 8 qui diffèrent entre deux grilles (voir HashLife.changed_blocks).
+
+        Args:
+            old (QuadGrid): Grille précédente (None = grille vide)
+            new (QuadGrid): Grille actuelle
+            region (tuple, optional): Ignorée (les sous-arbres identiques ne sont
+                pas parcourus)
+
+        Returns:
+            tuple: (positions, mots avant, mots après), listes Python
+        """
+        root = new.root
+        before = old.root if old is not None else self.life.empty(root.level)
+        return self.life.changed_blocks(before, root, 1 << (root.level - BLOCK_LEVEL))
+
+    def count(self, grid):
+        """
+        Compte les cellules vivantes (population de la racine).
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+
+        Returns:
+            int: Nombre de cellules vivantes
+        """
+        return grid.root.pop
+
+    def census(self, old, new, changes):
+        """
+        Naissances et morts, comptées sur les blocs modifiés.
+
+        Args:
+            old (QuadGrid): Grille précédente
+            new (QuadGrid): Grille actuelle
+            changes (tuple): Résultat de diff(old, new)
+
+        Returns:
+            tuple: (naissances, morts)
+        """
+        _, before, after = changes
+        births = sum(bin(b & ~a).count("1") for a, b in zip(before, after))
+        deaths = sum(bin(a & ~b).count("1") for a, b in zip(before, after))
+        return births, deaths
+
+    def clear(self, grid):
+        """
+        Tue toutes les cellules de la grille.
+
+        Args:
+            grid (QuadGrid): Grille du moteur, modifiée sur place
+        """
+        grid.root = self.life.empty(grid.root.level)
+
+    def randomize(self, grid, density=0.25, seed=None, region=None, symmetry="C1"):
+        """
+        Remplit une région de la grille d'une soupe aléatoire (voir
+        engines.random_soup) ; le reste de la grille est vidé.
+
+        Args:
+            grid (QuadGrid): Grille du moteur, modifiée sur place
+            density (float): Proportion de cellules vivantes
+            seed (int, optional): Graine de la soupe
+            region (tuple, optional): (haut, gauche, bas exclu, droite exclue),
+                en coordonnées de la grille (None : toute la fenêtre)
+            symmetry (str): Symétrie de la soupe (voir engines.SYMMETRIES)
+        """
+        top, left, bottom, right = region or (1, 1, grid.size + 1, grid.size + 1)
+        soup = engines.random_soup(bottom - top, right - left, density, seed, symmetry)
+        if np is not None:
+            cells = np.zeros((grid.size, grid.size), dtype=np.uint8)
+            cells[top - 1:bottom - 1, left - 1:right - 1] = soup
+            self._adopt(grid, cells)
+        else:
+            self._adopt(grid, [(left - 1 + j, top - 1 + i) for i, row in enumerate(soup)
+                               for j, value in enumerate(row) if value])
+
+    def wrap(self, grid, topology):
+        """
+        Sans effet : la grille n'a pas de bordure stockée (elle reste morte).
+
+        Args:
+            grid (QuadGrid): Grille du moteur
+            topology (str): Condition aux bords ("plane")
+        """
+        pass
+
+    def close(self):
+        """
+        Libère les ressources du moteur (appelé par stop_workers).
+        """
+        pass
+
+# Rend le moteur disponible pour start_workers
+engines.register_engine(HashLifeEngine)
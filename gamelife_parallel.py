@@ -0,0 +1,283 @@
+"""
+Game of Life - Moteur multiprocessus
+Contourne le GIL : chaque processus calcule une bande de lignes de la grille.
+- T et Tnext sont deux tampons multiprocessing.shared_memory
+- Les lignes de bord d'une bande sont lues directement dans la mémoire
+  partagée (échange de halo sans copie)
+- Une barrière inter-processus synchronise chaque génération
+- La région calculée (boîte englobante élargie, voir NumpyEngine.set_region)
+  est transmise aux processus par un tableau partagé
+
+Les processus sont lancés par "spawn" (interpréteur neuf) : un fork du
+processus principal copierait ses threads (pool de calcul, interface) dans un
+état quelconque, verrous compris.
+
+Côté gamelife_core, le moteur se comporte comme le moteur NumPy : T et Tnext
+sont des tableaux NumPy (adossés à la mémoire partagée) que barrier_action
+échange, et gen_counter est incrémenté comme d'habitude.
+"""
+
+import multiprocessing
+import os
+import threading
+from multiprocessing import shared_memory
+
+import gamelife_engines as engines
+import gamelife_rules as rules
+
+np = engines.np
+
+# Taille maximale de la notation d'une règle transmise aux processus (octets)
+RULE_NAME_SIZE = 64
+
+# Boîte absente (région = toute la grille, grille suivante vide) dans le tableau partagé
+NO_BOX = (-1, -1, -1, -1)
+
+# Méthode de démarrage des processus (voir la docstring du module)
+START_METHOD = "spawn"
+
+# Attente maximale des processus à l'arrêt (secondes) avant de les terminer de force
+CLOSE_TIMEOUT = 5.0
+
+if np is not None:
+    class SharedGrid(np.ndarray):
+        """
+        Grille NumPy adossée à un tampon multiprocessing.shared_memory.
+        Le tampon (attribut shm) vit aussi longtemps que la grille : core.T
+        reste lisible après stop_workers, même une fois le nom supprimé.
+        """
+
+def _as_grid(shm, shape):
+    """
+    Voit un tampon partagé comme une grille NumPy uint8.
+
+    Args:
+        shm (shared_memory.SharedMemory): Tampon partagé
+        shape (tuple): Forme de la grille
+
+    Returns:
+        SharedGrid: Grille adossée au tampon
+    """
+    grid = SharedGrid(shape, dtype=np.uint8, buffer=shm.buf)
+    grid.shm = shm
+    return grid
+
+def _box(values):
+    """
+    Lit une boîte écrite dans le tableau partagé des régions.
+
+    Args:
+        values (list): Quatre entiers (haut, gauche, bas, droite) ou NO_BOX
+
+    Returns:
+        tuple: Boîte, ou None
+    """
+    box = tuple(values)
+    return None if box == NO_BOX else box
+
+def _worker(names, shape, r0, r1, barrier, source, rule_name, window, stop, counts=None, index=0):
+    """
+    Boucle d'un processus de calcul (lignes r0 à r1 - 1).
+
+    Args:
+        names (list): Noms des deux tampons de mémoire partagée
+        shape (tuple): Forme des grilles (n + 2, n + 2)
+        r0 (int): Première ligne de la bande
+        r1 (int): Ligne de fin exclue
+        barrier (multiprocessing.Barrier): Barrière partagée avec le processus principal
+        source (multiprocessing.Value): Indice du tampon contenant T
+        rule_name (multiprocessing.Array): Notation de la règle appliquée (octets)
+        window (multiprocessing.Array): Région calculée puis boîte des cellules
+            non nulles de la grille suivante (8 entiers, NO_BOX si absente)
+        stop (multiprocessing.Event): Demande d'arrêt des processus
+        counts (multiprocessing.Array, optional): Naissances et morts de chaque
+            bande (deux entiers par processus), None si elles ne sont pas comptées
+        index (int): Rang du processus dans counts
+    """
+    # Ouvre les deux tampons partagés et les voit comme des grilles NumPy
+    grids = [_as_grid(shared_memory.SharedMemory(name=name), shape) for name in names]
+    kernel = engines.NumpyEngine()
+    kernel.set_tally(counts is not None)
+    current = None  # Règle compilée dans le noyau
+
+    while True:
+        # Attend le début d'une génération (ou l'arrêt) ; barrière rompue par
+        # close : le processus principal arrête le calcul
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            break
+        if stop.is_set():
+            break
+
+        # Recompile la règle si le processus principal l'a changée
+        if rule_name.value != current:
+            current = rule_name.value
+            kernel.set_rule(rules.compile_rule(current.decode()))
+
+        # Calcule la bande : les lignes r0 - 1 et r1 appartiennent aux voisins
+        # et sont lues directement dans la mémoire partagée
+        kernel.set_region(_box(window[:4]), _box(window[4:]))
+        src = source.value
+        kernel.step_rows(grids[src], grids[1 - src], r0, r1)
+        # Bilan de la bande, additionné par le processus principal
+        if counts is not None:
+            counts[2 * index:2 * index + 2] = kernel.census(None, None, None)
+
+        # Signale la fin de la bande
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            break
+
+class ProcessEngine(engines.NumpyEngine):
+    """
+    Moteur NumPy réparti sur plusieurs processus.
+    Les grilles sont des tableaux uint8 (n + 2) x (n + 2) en mémoire partagée.
+    """
+
+    name = "processes"  # Nom du moteur (utilisé par start_workers)
+    splittable = False  # Un seul thread coordonne les processus
+    cost_model = (1.4e-3, 2e-10, 5e-8)  # Synchronisation des processus à chaque génération
+
+    def __init__(self, processes=None):
+        """
+        Initialise le moteur (les processus sont créés au premier calcul).
+
+        Args:
+            processes (int, optional): Nombre de processus (par défaut : nombre de cœurs)
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self._buffers = []  # Tampons de mémoire partagée (T et Tnext)
+        self._grids = []  # Grilles NumPy correspondantes
+        self._workers = []  # Processus de calcul
+        self._barrier = None  # Barrière inter-processus
+        self._source = None  # Indice du tampon contenant T
+        self._rule_name = None  # Notation de la règle, partagée avec les processus
+        self._window = None  # Région et boîte de la grille suivante, partagées avec les processus
+        self._counts = None  # Naissances et morts de chaque bande, écrites par les processus
+        self._stop = None  # Demande d'arrêt des processus
+
+    def make_grid(self, size):
+        """
+        Crée une grille (size + 2) x (size + 2) dans un nouveau tampon partagé.
+
+        Args:
+            size (int): Taille réelle de la grille (sans bordures)
+
+        Returns:
+            SharedGrid: Grille uint8 adossée à la mémoire partagée
+        """
+        shape = (size + 2, size + 2)
+        shm = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1])
+        grid = _as_grid(shm, shape)
+        grid[...] = 0
+        self._buffers.append(shm)
+        self._grids.append(grid)
+        return grid
+
+    def _start_processes(self):
+        """
+        Démarre les processus de calcul, chacun possédant une bande de lignes.
+        """
+        ctx = multiprocessing.get_context(START_METHOD)
+        shape = self._grids[0].shape
+        size = shape[0] - 2
+        count = max(1, min(self.processes, size))
+
+        # Le processus principal est la dernière partie de la barrière
+        self._barrier = ctx.Barrier(count + 1)
+        self._source = ctx.Value("i", 0, lock=False)
+        self._rule_name = ctx.Array("c", RULE_NAME_SIZE, lock=False)
+        self._window = ctx.Array("i", 8, lock=False)
+        # Bilans des bandes, si le comptage est actif (voir set_tally)
+        self._counts = ctx.Array("q", 2 * count, lock=False) if self.tally else None
+        self._stop = ctx.Event()
+        names = [shm.name for shm in self._buffers]
+
+        for k in range(count):
+            r0 = 1 + k * size // count
+            r1 = 1 + (k + 1) * size // count
+            process = ctx.Process(
+                target=_worker,
+                args=(names, shape, r0, r1, self._barrier, self._source, self._rule_name,
+                      self._window, self._stop, self._counts, k),
+                daemon=True,
+            )
+            process.start()
+            self._workers.append(process)
+
+    def step(self, src, dst):
+        """
+        Calcule la génération suivante de src dans dst avec les processus.
+
+        Args:
+            src (numpy.ndarray): Grille actuelle (T)
+            dst (numpy.ndarray): Grille suivante (Tnext)
+        """
+        if not self._workers:
+            self._start_processes()
+
+        # Indique aux processus quel tampon contient T (échangé par barrier_action),
+        # la règle et la région à calculer (lues par les processus après la barrière)
+        self._source.value = 0 if src is self._grids[0] else 1
+        self._rule_name.value = self.rule.name.encode()
+        self._window[:] = (self.region or NO_BOX) + (self.stale or NO_BOX)
+        # Début de la génération, puis attente de la fin de toutes les bandes
+        self._barrier.wait()
+        self._barrier.wait()
+
+    def census(self, old, new, changes):
+        """
+        Naissances et morts de la dernière génération : somme des bilans des
+        processus si le comptage est actif, sinon comptage sur les mots modifiés.
+
+        Args:
+            old (numpy.ndarray): Grille précédente
+            new (numpy.ndarray): Grille actuelle
+            changes (tuple): Résultat de diff(old, new) (None si les bandes
+                ont été comptées)
+
+        Returns:
+            tuple: (naissances, morts)
+        """
+        if not self.tally:
+            return super().census(old, new, changes)
+        counts = self._counts[:]
+        return sum(counts[0::2]), sum(counts[1::2])
+
+    def close(self):
+        """
+        Arrête les processus et libère les tampons de mémoire partagée. Un
+        processus bloqué qui ne rejoint pas la barrière la rompt après
+        CLOSE_TIMEOUT secondes ; les processus encore vivants sont alors
+        terminés de force. Si un processus a disparu, la barrière n'est pas
+        utilisée : sa condition attendrait sans fin l'accusé de réveil d'un
+        processus mort pendant son attente, tous sont terminés directement.
+        """
+        # Libère les processus bloqués au début d'une génération
+        if self._workers:
+            self._stop.set()
+            complete = all(process.is_alive() for process in self._workers)
+            if complete:
+                try:
+                    self._barrier.wait(timeout=CLOSE_TIMEOUT)
+                except threading.BrokenBarrierError:
+                    # wait a rompu la barrière : les processus en attente s'arrêtent
+                    pass
+            for process in self._workers:
+                if complete:
+                    process.join(timeout=CLOSE_TIMEOUT)
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            self._workers = []
+
+        # Supprime les noms des tampons : la mémoire est libérée avec les grilles
+        for shm in self._buffers:
+            shm.unlink()
+        self._buffers = []
+        self._grids = []
+
+# Rend le moteur disponible pour start_workers
+engines.register_engine(ProcessEngine)
@@ -0,0 +1,167 @@
+"""
+Game of Life - Format RLE
+Lecture et écriture du format "Run Length Encoded" utilisé par Golly et LifeWiki :
+- En-tête "x = largeur, y = hauteur, rule = B3/S23"
+- Suite de <nombre><état> : "b" = morte, "o" = vivante ; "$" = fin de ligne, "!" = fin
+- Règles Generations : "." = morte, "A" = vivante, "B", "C", ... = états mourants
+- Lignes de commentaires "#C ..." avant l'en-tête
+"""
+
+import itertools
+import re
+
+# Longueur maximale d'une ligne de données (convention du format)
+LINE_WIDTH = 70
+
+def _state_chars(states):
+    """
+    Caractères des états d'une cellule.
+
+    Args:
+        states (int): Nombre d'états de la règle
+
+    Returns:
+        str: Caractère de chaque état (indice = état)
+    """
+    if states == 2:
+        return "bo"
+    # Notation multi-états : "." puis "A" à "X", puis "pA" à "pX", ...
+    chars = ["."]
+    for k in range(states - 1):
+        prefix = "" if k < 24 else chr(ord("p") + k // 24 - 1)
+        chars.append(prefix + chr(ord("A") + k % 24))
+    return chars
+
+def encode(cells, rule_name="B3/S23", states=2, comments=()):
+    """
+    Encode un tableau de cellules en texte RLE.
+
+    Args:
+        cells (list): Lignes de cellules (listes ou octets d'états)
+        rule_name (str): Règle écrite dans l'en-tête
+        states (int): Nombre d'états de la règle
+        comments (iterable): Lignes de commentaires (sans "#C")
+
+    Returns:
+        str: Texte RLE
+    """
+    chars = _state_chars(states)
+    height = len(cells)
+    width = len(cells[0]) if height else 0
+
+    # Suite de (nombre, symbole) : les cellules mortes en fin de ligne et les
+    # lignes vides sont omises, plusieurs fins de ligne se regroupent ("3$")
+    runs = []
+    pending_rows = 0
+    for row in cells:
+        groups = [(state, len(list(group))) for state, group in itertools.groupby(row)]
+        if groups and groups[-1][0] == 0:
+            groups.pop()
+        if not groups:
+            pending_rows += 1
+            continue
+        if runs or pending_rows:
+            runs.append((pending_rows, "$"))
+        pending_rows = 1
+        runs.extend((count, chars[state]) for state, count in groups)
+    runs.append((1, "!"))
+
+    # Découpe les données en lignes de LINE_WIDTH caractères au plus
+    lines = [f"#C {comment}" for comment in comments]
+    lines.append(f"x = {width}, y = {height}, rule = {rule_name}")
+    line = ""
+    for count, symbol in runs:
+        token = (str(count) if count > 1 else "") + symbol
+        if len(line) + len(token) > LINE_WIDTH:
+            lines.append(line)
+            line = ""
+        line += token
+    lines.append(line)
+    return "\n".join(lines) + "\n"
+
+def decode(text):
+    """
+    Décode un texte RLE.
+
+    Args:
+        text (str): Texte RLE
+
+    Returns:
+        tuple: (lignes de cellules (listes d'états), règle de l'en-tête ou None)
+
+    Raises:
+        ValueError: Si l'en-tête est absent ou les données mal formées
+    """
+    header = None
+    data = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if header is None:
+            header = line
+        else:
+            data.append(line)
+    if header is None or not header.startswith("x"):
+        raise ValueError("RLE invalide : en-tête « x = ..., y = ... » absent")
+
+    # En-tête : "x = 3, y = 3, rule = B3/S23"
+    fields = dict(
+        (key.strip(), value.strip())
+        for key, value in (part.split("=", 1) for part in header.split(",") if "=" in part)
+    )
+    width, height = int(fields["x"]), int(fields["y"])
+    rule_name = fields.get("rule")
+
+    # Données : <nombre><état>, avec états multi-caractères ("pA") pour les règles Generations
+    cells = [[0] * width for _ in range(height)]
+    i = j = 0
+    for count, prefix, symbol in re.findall(r"(\d*)([p-y]?)([a-zA-Z.$!])", "".join(data)):
+        count = int(count) if count else 1
+        if symbol == "!":
+            break
+        if symbol == "$":
+            i += count
+            j = 0
+            continue
+        # "b" / "." = morte ; "o" = vivante ; "A".."X" (avec préfixe) = état 1, 2, ...
+        if symbol in "b.":
+            state = 0
+        elif symbol == "o":
+            state = 1
+        elif symbol.isupper():
+            state = 1 + ord(symbol) - ord("A") + (24 * (ord(prefix) - ord("p") + 1) if prefix else 0)
+        else:
+            raise ValueError(f"RLE invalide : état {prefix + symbol!r}")
+        if i >= height or j + count > width:
+            raise ValueError("RLE invalide : motif plus grand que l'en-tête")
+        cells[i][j:j + count] = [state] * count
+        j += count
+    return cells, rule_name
+
+def save(path, cells, rule_name="B3/S23", states=2, comments=()):
+    """
+    Écrit un tableau de cellules dans un fichier RLE.
+
+    Args:
+        path (str): Chemin du fichier
+        cells (list): Lignes de cellules
+        rule_name (str): Règle écrite dans l'en-tête
+        states (int): Nombre d'états de la règle
+        comments (iterable): Lignes de commentaires
+    """
+    with open(path, "w") as f:
+        f.write(encode(cells, rule_name, states, comments))
+
+def load(path):
+    """
+    Lit un fichier RLE.
+
+    Args:
+        path (str): Chemin du fichier
+
+    Returns:
+        tuple: (lignes de cellules, règle de l'en-tête ou None)
+    """
+    with open(path) as f:
+        return decode(f.read())
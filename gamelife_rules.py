@@ -0,0 +1,340 @@
+"""
+Game of Life - Règles "Life-like" en notation B/S
+Compile une règle (ex: "B3/S23" pour Conway, "B36/S23" pour HighLife) en une
+table de 512 entrées indexée par le voisinage 3x3 d'une cellule :
+- Bit (3 * colonne + ligne) du masque = cellule du voisinage, colonne et ligne
+  allant de 0 à 2 depuis le coin supérieur gauche (bit 4 = la cellule elle-même)
+- table[masque] = état de la cellule à la génération suivante (0 ou 1)
+
+Tous les moteurs lisent cette table : changer de règle ne coûte rien par cellule.
+Les moteurs qui comptent les voisins lisent sa forme réduite (Rule.outcomes),
+exacte car la table ne dépend que de l'état et du nombre de voisins.
+Les colonnes successives d'une ligne se décalent de 3 bits, ce qui permet de
+faire glisser le masque le long d'une ligne (voir gamelife_core.compute_rows).
+
+Règles "Generations" (ex: "B2/S/C3" pour Brian's Brain) : C états par cellule.
+- 0 = morte, 1 = vivante, 2 à C - 1 = mourante (état réfractaire)
+- Seules les cellules vivantes comptent comme voisines
+- Une cellule vivante qui ne survit pas passe à l'état 2, une cellule mourante
+  avance d'un état puis redevient morte après l'état C - 1
+- Seule une cellule morte (état 0) peut naître
+La table décrit toujours les naissances et les survies ; le vieillissement des
+cellules mourantes est appliqué par le moteur (voir NumpyEngine.step_rows).
+
+Règles "Larger than Life" (ex: "R5,C0,M1,S34..58,B34..45,NM" pour Bosco) :
+voisinage carré de rayon R (jusqu'à MAX_RADIUS) et intervalles de naissance et
+de survie. Elles n'ont pas de table (2^441 voisinages) : les moteurs comptent
+les voisins avec une table de sommes cumulées (voir RangeRule).
+"""
+
+# Règles connues, utilisables par leur nom
+RULES = {
+    "conway": "B3/S23",
+    "highlife": "B36/S23",
+    "daynight": "B3678/S34678",
+    "seeds": "B2/S",
+    "lifewithoutdeath": "B3/S012345678",
+    "maze": "B3/S12345",
+    "replicator": "B1357/S1357",
+    "2x2": "B36/S125",
+    "diamoeba": "B35678/S5678",
+    "morley": "B368/S245",
+    "briansbrain": "B2/S/C3",
+    "starwars": "B2/S345/C4",
+    "brainstorm": "B24/S/C5",
+    "bosco": "R5,C0,M1,S34..58,B34..45,NM",
+    "majority": "R4,C0,M1,S41..81,B41..81,NM",
+    "waffle": "R7,C0,M1,S100..200,B75..170,NM",
+}
+
+# Nombre maximal d'états d'une règle Generations (cellules sur un octet)
+MAX_STATES = 256
+# Rayon maximal du voisinage d'une règle Larger than Life
+MAX_RADIUS = 10
+
+# Bit de la cellule elle-même dans le masque du voisinage
+CENTER_BIT = 4
+
+class Rule:
+    """
+    Règle Life-like ou Generations compilée.
+    Attributs : births et survivals (nombres de voisins), states (nombre
+    d'états, 2 pour une règle Life-like), name (notation B/S canonique),
+    table (512 octets) et outcomes (état suivant selon l'état actuel et le
+    nombre de voisins, déduit de la table).
+    """
+
+    radius = 1  # Voisinage de Moore 3x3
+
+    def __init__(self, births, survivals, states=2):
+        """
+        Compile la table de la règle.
+
+        Args:
+            births (iterable): Nombres de voisins provoquant une naissance
+            survivals (iterable): Nombres de voisins permettant la survie
+            states (int): Nombre d'états d'une cellule (2 à MAX_STATES)
+        """
+        self.births = frozenset(births)
+        self.survivals = frozenset(survivals)
+        self.states = states
+        self.name = "B{}/S{}".format(
+            "".join(str(k) for k in sorted(self.births)),
+            "".join(str(k) for k in sorted(self.survivals)),
+        )
+        if states > 2:
+            self.name += f"/C{states}"
+
+        # Table des 512 voisinages : état de la cellule et nombre de voisins vivants
+        table = bytearray(512)
+        for mask in range(512):
+            alive = (mask >> CENTER_BIT) & 1
+            neighbors = bin(mask).count("1") - alive
+            allowed = self.survivals if alive else self.births
+            table[mask] = 1 if neighbors in allowed else 0
+        self.table = bytes(table)
+
+        # Forme réduite lue dans la table : outcomes[vivante * 9 + voisins]
+        # (moteurs qui comptent les voisins au lieu de former le masque)
+        self.outcomes = tuple(
+            self.table[_mask_for(alive, neighbors)]
+            for alive in (0, 1) for neighbors in range(9)
+        )
+
+    def __eq__(self, other):
+        """
+        Deux règles sont égales si elles ont la même table et le même nombre d'états.
+
+        Args:
+            other: Objet comparé
+
+        Returns:
+            bool: True si les deux règles sont identiques
+        """
+        return isinstance(other, Rule) and (self.table, self.states) == (other.table, other.states)
+
+    def __hash__(self):
+        """
+        Hash de la table et du nombre d'états (les règles peuvent servir de clés).
+
+        Returns:
+            int: Hash de la règle
+        """
+        return hash((self.table, self.states))
+
+    def __repr__(self):
+        """
+        Représentation lisible (notation B/S).
+
+        Returns:
+            str: Par exemple "Rule('B3/S23')"
+        """
+        return f"Rule({self.name!r})"
+
+class RangeRule:
+    """
+    Règle Larger than Life : voisinage carré de rayon radius, naissance et survie
+    quand le nombre de voisins est dans un intervalle.
+    Attributs : radius, birth_range et survival_range (bornes incluses), births
+    et survivals (mêmes nombres sous forme d'ensembles), middle (la cellule se
+    compte parmi ses voisines), states et name (notation "R5,C0,M1,S34..58,B34..45,NM").
+    Pas de table : table et outcomes valent None.
+    """
+
+    table = None  # Voisinage trop grand pour une table
+    outcomes = None
+
+    def __init__(self, radius, birth_range, survival_range, middle=False, states=2):
+        """
+        Initialise la règle.
+
+        Args:
+            radius (int): Rayon du voisinage (1 à MAX_RADIUS)
+            birth_range (tuple): Nombres de voisins (minimum, maximum) d'une naissance
+            survival_range (tuple): Nombres de voisins (minimum, maximum) de la survie
+            middle (bool): True si la cellule est comptée parmi ses voisines
+            states (int): Nombre d'états d'une cellule (2 à MAX_STATES)
+        """
+        self.radius = radius
+        self.birth_range = tuple(birth_range)
+        self.survival_range = tuple(survival_range)
+        self.middle = bool(middle)
+        self.states = states
+        self.births = frozenset(range(self.birth_range[0], self.birth_range[1] + 1))
+        self.survivals = frozenset(range(self.survival_range[0], self.survival_range[1] + 1))
+        self.name = "R{},C{},M{},S{}..{},B{}..{},NM".format(
+            radius, states if states > 2 else 0, int(self.middle),
+            *self.survival_range, *self.birth_range,
+        )
+
+    def __eq__(self, other):
+        """
+        Deux règles sont égales si elles ont la même notation canonique.
+
+        Args:
+            other: Objet comparé
+
+        Returns:
+            bool: True si les deux règles sont identiques
+        """
+        return isinstance(other, RangeRule) and self.name == other.name
+
+    def __hash__(self):
+        """
+        Hash de la notation canonique.
+
+        Returns:
+            int: Hash de la règle
+        """
+        return hash(self.name)
+
+    def __repr__(self):
+        """
+        Représentation lisible.
+
+        Returns:
+            str: Par exemple "RangeRule('R5,C0,M1,S34..58,B34..45,NM')"
+        """
+        return f"RangeRule({self.name!r})"
+
+def _mask_for(alive, neighbors):
+    """
+    Masque d'un voisinage quelconque ayant cet état et ce nombre de voisins.
+
+    Args:
+        alive (int): État de la cellule (0 ou 1)
+        neighbors (int): Nombre de voisins vivants (0 à 8)
+
+    Returns:
+        int: Masque de 9 bits
+    """
+    # Remplit les bits de voisins dans l'ordre en sautant le bit central
+    bits = [bit for bit in range(9) if bit != CENTER_BIT][:neighbors]
+    mask = sum(1 << bit for bit in bits)
+    return mask | (alive << CENTER_BIT)
+
+def parse_rule(text):
+    """
+    Lit une règle en notation B/S ("B3/S23"), S/B ("23/3") ou par son nom ("highlife").
+    Une troisième partie donne le nombre d'états d'une règle Generations :
+    "B2/S/C3" ou, en notation S/B/C, "/2/3".
+
+    Args:
+        text (str): Règle à lire
+
+    Returns:
+        tuple: (naissances, survies, nombre d'états)
+
+    Raises:
+        ValueError: Si la règle est mal formée
+    """
+    spec = RULES.get(text.strip().lower(), text).strip().upper().replace(" ", "")
+    parts = spec.split("/")
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Règle invalide : {text!r} (attendu B3/S23 ou B2/S/C3)")
+
+    # Nombre d'états (Generations), 2 par défaut
+    states = 2
+    if len(parts) == 3:
+        count = parts.pop().removeprefix("C")
+        if not count.isdigit() or not 2 <= int(count) <= MAX_STATES:
+            raise ValueError(f"Règle invalide : {text!r} (de 2 à {MAX_STATES} états)")
+        states = int(count)
+
+    # Notation B/S (dans un ordre quelconque) ou notation historique S/B
+    if parts[0].startswith("S") and parts[1].startswith("B"):
+        parts.reverse()
+    if parts[0].startswith("B") and parts[1].startswith("S"):
+        births, survivals = parts[0][1:], parts[1][1:]
+    else:
+        survivals, births = parts
+
+    # Chaque chiffre est un nombre de voisins (0 à 8)
+    digits = births + survivals
+    if not all(c in "012345678" for c in digits):
+        raise ValueError(f"Règle invalide : {text!r} (voisins de 0 à 8)")
+    return {int(c) for c in births}, {int(c) for c in survivals}, states
+
+def parse_range_rule(text):
+    """
+    Lit une règle Larger than Life : "R5,C0,M1,S34..58,B34..45,NM".
+    R = rayon, C = nombre d'états (0 ou 2 pour deux états), M = 1 si la cellule
+    se compte parmi ses voisines, S et B = intervalles (ou un seul nombre),
+    N = forme du voisinage (seul le carré de Moore "NM" est géré).
+
+    Args:
+        text (str): Règle à lire
+
+    Returns:
+        tuple: (rayon, intervalle de naissance, intervalle de survie, middle, états)
+
+    Raises:
+        ValueError: Si la règle est mal formée
+    """
+    fields = {}
+    for part in text.strip().upper().replace(" ", "").split(","):
+        if not part or part[0] in fields:
+            raise ValueError(f"Règle invalide : {text!r}")
+        fields[part[0]] = part[1:]
+    if fields.get("N", "M") != "M" or not {"R", "B", "S"} <= set(fields):
+        raise ValueError(f"Règle invalide : {text!r} (attendu R5,C0,M1,S34..58,B34..45,NM)")
+
+    def number(key, default=None):
+        """Lit le nombre d'un champ (R, C ou M)."""
+        value = fields.get(key, default)
+        if value is None or not str(value).isdigit():
+            raise ValueError(f"Règle invalide : {text!r} (champ {key})")
+        return int(value)
+
+    radius = number("R")
+    if not 1 <= radius <= MAX_RADIUS:
+        raise ValueError(f"Règle invalide : {text!r} (rayon de 1 à {MAX_RADIUS})")
+    states = max(2, number("C", 0))
+    if states > MAX_STATES:
+        raise ValueError(f"Règle invalide : {text!r} (de 2 à {MAX_STATES} états)")
+    middle = number("M", 0) == 1
+
+    # Intervalles "a..b" ou nombre seul, bornés par la taille du voisinage
+    cells = (2 * radius + 1) ** 2
+    ranges = []
+    for key in ("B", "S"):
+        bounds = fields[key].split("..")
+        if len(bounds) > 2 or not all(b.isdigit() for b in bounds):
+            raise ValueError(f"Règle invalide : {text!r} (intervalle {key})")
+        low, high = int(bounds[0]), int(bounds[-1])
+        if not low <= high <= cells:
+            raise ValueError(f"Règle invalide : {text!r} (intervalle {key} de 0 à {cells})")
+        ranges.append((low, high))
+    return radius, ranges[0], ranges[1], middle, states
+
+def compile_rule(text):
+    """
+    Compile une règle texte en objet Rule (ou RangeRule pour un rayon > 1).
+
+    Args:
+        text (str): Règle en notation B/S, S/B, Larger than Life ou nom connu (voir RULES)
+
+    Returns:
+        Rule ou RangeRule: Règle compilée
+
+    Raises:
+        ValueError: Si la règle est mal formée
+    """
+    spec = RULES.get(text.strip().lower(), text)
+    if not spec.strip().upper().startswith("R"):
+        births, survivals, states = parse_rule(spec)
+        return Rule(births, survivals, states)
+
+    radius, birth_range, survival_range, middle, states = parse_range_rule(spec)
+    if radius > 1:
+        return RangeRule(radius, birth_range, survival_range, middle, states)
+
+    # Rayon 1 : règle Life-like équivalente (avec M1, une cellule vivante se compte)
+    births = range(birth_range[0], birth_range[1] + 1)
+    survivals = range(survival_range[0], survival_range[1] + 1)
+    if middle:
+        survivals = [k - 1 for k in survivals if k >= 1]
+    return Rule([k for k in births if k <= 8], [k for k in survivals if k <= 8], states)
+
+# Règle par défaut : jeu de la vie de Conway
+CONWAY = compile_rule("B3/S23")
@@ -0,0 +1,155 @@
+"""
+Game of Life - Cadencement des générations
+Le planificateur (FrameScheduler) fixe l'instant de publication de chaque
+génération au lieu de dormir 1 / vitesse après chaque calcul :
+- Échéances sur l'horloge monotone : la génération k est publiée à t0 + k / vitesse,
+  le temps de calcul et d'enregistrement est donc absorbé dans la période
+- Correction de dérive : l'échéance suivante part de l'échéance précédente,
+  pas de l'instant du réveil (les retards ne s'accumulent pas)
+- Rattrapage borné : un retard de quelques périodes est rattrapé en publiant
+  sans attendre, au-delà de MAX_CATCH_UP périodes l'horloge est recalée
+- Pipeline : gamelife_core attend l'échéance une fois la génération suivante
+  déjà calculée dans Tnext, juste avant l'échange des grilles
+- Vitesse 0 : mode "aussi vite que possible", sans attente
+
+Le débit réellement obtenu (générations par seconde) est mesuré dans tous
+les modes (achieved_rate).
+"""
+
+import threading
+import time
+from collections import deque
+
+# Retard maximal rattrapé (en périodes) avant de recaler l'horloge
+MAX_CATCH_UP = 3
+# Durée de la fenêtre de mesure du débit obtenu (secondes)
+RATE_WINDOW = 2.0
+
+class FrameScheduler:
+    """
+    Planificateur des publications de générations à une vitesse cible.
+    Utilisé par un seul thread (barrier_action) ; set_rate et wake peuvent
+    être appelés depuis n'importe quel thread.
+    """
+
+    def __init__(self, rate=0.0):
+        """
+        Initialise le planificateur.
+
+        Args:
+            rate (float): Vitesse cible en générations par seconde (0 = sans limite)
+        """
+        self._lock = threading.Lock()  # Protège la vitesse et les échéances
+        self._wake = threading.Event()  # Interrompt une attente (vitesse modifiée, arrêt)
+        self._rate = float(rate)
+        self._deadline = None  # Échéance de la prochaine publication (None = à recaler)
+        self._ticks = deque()  # (instant, générations) des dernières publications (mesure du débit)
+
+    def set_rate(self, rate):
+        """
+        Change la vitesse cible ; une attente en cours est recalculée aussitôt.
+
+        Args:
+            rate (float): Vitesse cible en générations par seconde (0 = sans limite)
+        """
+        with self._lock:
+            self._rate = float(rate)
+            self._deadline = None
+        self.wake()
+
+    def get_rate(self):
+        """
+        Retourne la vitesse cible.
+
+        Returns:
+            float: Générations par seconde (0 = sans limite)
+        """
+        with self._lock:
+            return self._rate
+
+    def wake(self):
+        """
+        Interrompt l'attente en cours (changement de vitesse, pause ou arrêt).
+        """
+        self._wake.set()
+
+    def reset(self):
+        """
+        Oublie l'échéance et la mesure du débit (reprise après une pause).
+        """
+        with self._lock:
+            self._deadline = None
+            self._ticks.clear()
+
+    def wait_for_tick(self, cancelled=None, generations=1):
+        """
+        Attend l'échéance de la prochaine publication puis fixe la suivante.
+
+        Args:
+            cancelled (callable, optional): Retourne True si l'attente doit cesser
+                (pause, arrêt) ; vérifié à chaque réveil
+            generations (int): Générations publiées à cette échéance (mesure du débit)
+
+        Returns:
+            bool: True si l'échéance est atteinte, False si l'attente a été annulée
+        """
+        while True:
+            with self._lock:
+                rate = self._rate
+                now = time.monotonic()
+                if rate <= 0:
+                    # Aussi vite que possible : aucune attente
+                    self._deadline = None
+                    break
+                period = 1.0 / rate
+                # Premier tick, changement de vitesse ou retard trop grand : recale l'horloge
+                if self._deadline is None or now - self._deadline > MAX_CATCH_UP * period:
+                    self._deadline = now
+                remaining = self._deadline - now
+                if remaining <= 0:
+                    # Échéance atteinte (ou en retard rattrapable) : la suivante
+                    # part de celle-ci, ce qui corrige la dérive
+                    self._deadline += period
+                    break
+                self._wake.clear()
+
+            # Annulation signalée avant l'effacement du réveil : vérifiée ici,
+            # sinon elle ne serait vue qu'à l'échéance
+            if cancelled is not None and cancelled():
+                return False
+            # Attente interruptible jusqu'à l'échéance
+            self._wake.wait(remaining)
+            if cancelled is not None and cancelled():
+                return False
+
+        self._record(time.monotonic(), generations)
+        return True
+
+    def _record(self, now, generations):
+        """
+        Mémorise une publication pour la mesure du débit.
+
+        Args:
+            now (float): Instant de la publication (horloge monotone)
+            generations (int): Générations publiées
+        """
+        with self._lock:
+            self._ticks.append((now, generations))
+            while now - self._ticks[0][0] > RATE_WINDOW:
+                self._ticks.popleft()
+
+    def achieved_rate(self):
+        """
+        Débit réellement obtenu sur les dernières secondes.
+
+        Returns:
+            float: Générations publiées par seconde (0 si la mesure est impossible)
+        """
+        with self._lock:
+            # Une simulation arrêtée depuis plus d'une fenêtre n'a plus de débit
+            if len(self._ticks) < 2 or time.monotonic() - self._ticks[-1][0] > RATE_WINDOW:
+                return 0.0
+            elapsed = self._ticks[-1][0] - self._ticks[0][0]
+            # Générations publiées après la première publication de la fenêtre
+            generations = sum(count for _, count in self._ticks) - self._ticks[0][1]
+            return generations / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,459 @@
+"""
+Game of Life - Recherche de soupes (recensement des cendres, à la apgsearch)
+Fait évoluer des soupes numérotées par leur graine jusqu'à leur stabilisation
+et recense les objets de leurs cendres :
+- Processus de calcul (ProcessPoolExecutor) : chacun fait évoluer un lot de
+  soupes consécutives (gamelife_ensemble) et retourne le recensement de ses
+  cendres ; les processus ne partagent rien, le débit suit le nombre de cœurs
+- Séparation des cendres en objets : cellules vivantes à l'une des phases de
+  la période, reliées par leurs 8 voisines ; un morceau qui n'évolue pas seul
+  comme dans les cendres (quart de pulsar) est réuni au morceau le plus proche
+- Forme canonique d'un objet (apgcode) : code de Wechsler étendu le plus
+  court, puis le plus petit, parmi ses 8 orientations et ses phases, préfixé
+  de xs<population> (nature morte) ou xp<période> (oscillateur)
+- Le processus principal fusionne les recensements, sauvegarde l'avancement
+  (reprise après interruption) et affiche le débit en soupes par seconde
+
+La soupe de graine s est celle de core.randomize_grid(..., seed=s) : une soupe
+remarquable se rejoue avec python -m gamelife run --seed s --soup-size ...
+
+Les grilles sont bornées : un vaisseau qui atteint la bordure s'y écrase. Les
+objets à moins de EDGE cellules de la bordure sont comptés à part (objets
+échappés) au lieu d'être recensés. Ce compte est approché : des cendres
+ordinaires posées près du bord y sont comptées, et les débris d'une collision
+avec la bordure qui s'en éloignent de plus de EDGE cellules sont recensés.
+Des grilles plus grandes (size) autour d'une soupe de même côté réduisent ces
+deux erreurs, au prix du débit.
+
+Utilisation:
+    python -m gamelife search --soups 100000 --workers 4 --checkpoint census.json
+"""
+
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_ensemble as ensemble
+import gamelife_rules as rules
+
+np = engines.np
+
+SOUP_SIZE = 16  # Côté d'une soupe
+GRID_SIZE = 62  # Côté des grilles (62 + 2 colonnes : une ligne = un mot de 64 bits)
+DENSITY = 0.5  # Proportion de cellules vivantes d'une soupe
+MAX_GENERATIONS = 6000  # Au-delà, une soupe non stabilisée est déclarée pathologique
+BATCH = 256  # Soupes par tâche d'un processus de calcul
+EDGE = 4  # Largeur de la bande de bordure où les débris sont des objets échappés
+REPORT_INTERVAL = 5.0  # Secondes entre deux lignes de progression
+CHECKPOINT_INTERVAL = 60.0  # Secondes entre deux sauvegardes de l'avancement
+
+# Caches par processus, indexés par les phases cadrées d'un morceau de cendres :
+# {(règle, forme, octets): évolue seul} et {(forme, octets): apgcode}
+_independent_cache = {}
+_canonical_cache = {}
+
+# Chiffres du code de Wechsler (colonnes de 5 cellules : 0 à v ; zéros : y0 à yz)
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def _zeros(count):
+    """
+    Code d'une suite de colonnes vides (format de Wechsler étendu).
+
+    Args:
+        count (int): Nombre de colonnes vides
+
+    Returns:
+        str: "0", "w" (2), "x" (3) ou "y" suivi de count - 4 (4 à 39)
+    """
+    text = ""
+    while count >= 40:
+        text += "yz"
+        count -= 39
+    if count >= 4:
+        return text + "y" + _DIGITS[count - 4]
+    return text + ("", "0", "w", "x")[count]
+
+def wechsler(cells):
+    """
+    Code de Wechsler étendu d'un motif cadré sur sa boîte englobante : bandes
+    de 5 lignes séparées par "z", un chiffre par colonne (ligne du haut = bit
+    de poids faible), colonnes vides finales omises.
+
+    Args:
+        cells (numpy.ndarray): Cellules 0/1 du motif
+
+    Returns:
+        str: Code du motif
+    """
+    strips = []
+    for top in range(0, cells.shape[0], 5):
+        band = cells[top:top + 5].astype(np.int64)
+        values = (band << np.arange(len(band))[:, None]).sum(axis=0)
+        text, zeros = [], 0
+        for value in values:
+            if not value:
+                zeros += 1
+                continue
+            text.append(_zeros(zeros) + _DIGITS[value])
+            zeros = 0
+        strips.append("".join(text))
+    return "z".join(strips)
+
+def canonical(phases):
+    """
+    Forme canonique (apgcode) d'un objet à partir de ses phases.
+
+    Args:
+        phases (list): Cellules 0/1 de l'objet à chaque génération de sa période
+
+    Returns:
+        str: xs<population>_<code> pour une nature morte, xp<période>_<code> sinon
+    """
+    best = None
+    for cells in phases:
+        for k in range(8):
+            # Quatre rotations, puis leurs transposées (réflexions)
+            oriented = np.rot90(cells, k % 4)
+            if k >= 4:
+                oriented = oriented.T
+            rows = np.flatnonzero(oriented.any(axis=1))
+            cols = np.flatnonzero(oriented.any(axis=0))
+            code = wechsler(oriented[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1])
+            if best is None or (len(code), code) < (len(best), best):
+                best = code
+    prefix = f"xs{int(phases[0].sum())}" if len(phases) == 1 else f"xp{len(phases)}"
+    return f"{prefix}_{best}"
+
+def separate(live):
+    """
+    Sépare des cellules en objets reliés par leurs 8 voisines.
+
+    Args:
+        live (numpy.ndarray): Cellules 0/1
+
+    Returns:
+        list: Masque booléen de chaque objet
+    """
+    remaining = set(zip(*np.nonzero(live)))
+    objects = []
+    while remaining:
+        # Parcours en profondeur depuis une cellule quelconque
+        stack = [remaining.pop()]
+        mask = np.zeros(live.shape, dtype=bool)
+        while stack:
+            i, j = stack.pop()
+            mask[i, j] = True
+            for di in (-1, 0, 1):
+                for dj in (-1, 0, 1):
+                    cell = (i + di, j + dj)
+                    if cell in remaining:
+                        remaining.remove(cell)
+                        stack.append(cell)
+        objects.append(mask)
+    return objects
+
+def _phases(cells, rule, period):
+    """
+    Phases d'un motif sur une période (bordure morte autour de la grille).
+
+    Args:
+        cells (numpy.ndarray): Cellules 0/1, rectangle sans bordure
+        rule (gamelife_rules.Rule): Règle
+        period (int): Nombre de phases
+
+    Returns:
+        list: Cellules de chaque génération 0 à period - 1
+    """
+    # Grille carrée (celle de iterate), recadrée ensuite sur le motif
+    height, width = cells.shape
+    bordered = np.zeros((max(height, width) + 2,) * 2, dtype=np.uint8)
+    bordered[1:height + 1, 1:width + 1] = cells
+    return [np.array(grid[:height, :width], dtype=np.uint8) for _, grid in
+            core.iterate(bordered, rule=rule, generations=period - 1)]
+
+def _independent(phases, mask, rule):
+    """
+    Indique si un morceau de cendres évolue seul comme dans les cendres.
+
+    Args:
+        phases (list): Cellules des cendres à chaque phase
+        mask (numpy.ndarray): Masque booléen du morceau
+        rule (gamelife_rules.Rule): Règle
+
+    Returns:
+        bool: True si les phases du morceau isolé sont celles des cendres
+    """
+    # Morceau cadré avec une marge de 2 cellules (il ne peut pas en sortir en une génération)
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    window = (slice(max(0, rows[0] - 2), rows[-1] + 3), slice(max(0, cols[0] - 2), cols[-1] + 3))
+    own = [(phase * mask)[window] for phase in phases]
+    key = (rule.name, own[0].shape, b"".join(cells.tobytes() for cells in own))
+    if key not in _independent_cache:
+        alone = _phases(own[0], rule, len(own))
+        _independent_cache[key] = all((a == b).all() for a, b in zip(alone, own))
+    return _independent_cache[key]
+
+def _distance(first, second):
+    """
+    Distance (nombre de pas de roi) entre les cellules les plus proches de deux objets.
+
+    Args:
+        first, second (numpy.ndarray): Masques booléens
+
+    Returns:
+        int: Distance de Tchebychev
+    """
+    a = np.argwhere(first)
+    b = np.argwhere(second)
+    return int(np.abs(a[:, None, :] - b[None, :, :]).max(axis=2).min())
+
+def ash_objects(cells, period, rule, edge=EDGE):
+    """
+    Objets des cendres d'une soupe stabilisée.
+
+    Args:
+        cells (numpy.ndarray): Cellules n x n de la génération de stabilisation
+        period (int): Période des cendres
+        rule (gamelife_rules.Rule): Règle
+        edge (int): Largeur de la bande de bordure (débris d'objets échappés)
+
+    Returns:
+        list: apgcode de chaque objet, None pour un débris au contact de la bordure
+    """
+    size = cells.shape[0]
+    phases = _phases(cells, rule, period)
+
+    # Morceaux reliés ; un morceau qui n'évolue pas seul rejoint le plus proche
+    objects = separate(np.logical_or.reduce(phases))
+    merged = True
+    while merged and len(objects) > 1:
+        merged = False
+        for k, mask in enumerate(objects):
+            if not _independent(phases, mask, rule):
+                others = objects[:k] + objects[k + 1:]
+                nearest = min(range(len(others)), key=lambda m: _distance(mask, others[m]))
+                others[nearest] = others[nearest] | mask
+                objects = others
+                merged = True
+                break
+
+    codes = []
+    for mask in objects:
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if min(rows[0], cols[0]) < edge or max(rows[-1], cols[-1]) >= size - edge:
+            codes.append(None)
+            continue
+        # Période propre de l'objet : plus petit diviseur de la période des cendres
+        window = (slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1))
+        own = [(phase * mask)[window] for phase in phases]
+        step = next(d for d in range(1, period + 1)
+                    if period % d == 0 and (d == period or (own[d] == own[0]).all()))
+        key = (own[0].shape, b"".join(cells.tobytes() for cells in own[:step]))
+        if key not in _canonical_cache:
+            _canonical_cache[key] = canonical(own[:step])
+        codes.append(_canonical_cache[key])
+    return codes
+
+def new_census():
+    """
+    Crée un recensement vide.
+
+    Returns:
+        dict: soups (soupes traitées), objects ({apgcode: nombre}), samples
+            ({apgcode: plus petite graine d'une soupe qui le contient}), escapes
+            (objets au contact de la bordure, compte approché : voir la docstring
+            du module), pathological (graines non stabilisées)
+    """
+    return {"soups": 0, "objects": {}, "samples": {}, "escapes": 0, "pathological": []}
+
+def merge_census(total, part):
+    """
+    Ajoute un recensement (résultat d'une tâche) au recensement total.
+
+    Args:
+        total (dict): Recensement total, modifié sur place
+        part (dict): Recensement à ajouter
+    """
+    total["soups"] += part["soups"]
+    total["escapes"] += part["escapes"]
+    total["pathological"].extend(part["pathological"])
+    for code, count in part["objects"].items():
+        total["objects"][code] = total["objects"].get(code, 0) + count
+    for code, seed in part["samples"].items():
+        total["samples"][code] = min(seed, total["samples"].get(code, seed))
+
+def search_batch(first, count, rule="B3/S23", soup=SOUP_SIZE, size=GRID_SIZE, density=DENSITY,
+                 symmetry="C1", max_generations=MAX_GENERATIONS):
+    """
+    Fait évoluer les soupes de graines first à first + count - 1 et recense
+    leurs cendres (tâche d'un processus de calcul).
+
+    Args:
+        first (int): Graine de la première soupe
+        count (int): Nombre de soupes
+        rule (str): Règle (deux états, rayon 1)
+        soup (int): Côté des soupes, tirées au centre des grilles
+        size (int): Côté des grilles
+        density (float): Proportion de cellules vivantes des soupes
+        symmetry (str): Symétrie des soupes (voir engines.SYMMETRIES)
+        max_generations (int): Limite de générations d'une soupe
+
+    Returns:
+        dict: Recensement des soupes (voir new_census)
+    """
+    batch = ensemble.BitPackedEnsemble(size, rule, max_generations=max_generations)
+    top = (size - soup) // 2 + 1
+    batch.add_soups(range(first, first + count), density, (top, top, top + soup, top + soup), symmetry)
+
+    census = new_census()
+    census["soups"] = count
+    objects = Counter()
+    for outcome in batch.run():
+        # Sans stabilisation : soupe pathologique (graine conservée pour l'étudier)
+        if outcome.period == 0:
+            census["pathological"].append(outcome.seed)
+            continue
+        for code in ash_objects(outcome.cells, outcome.period, batch.rule):
+            if code is None:
+                census["escapes"] += 1
+                continue
+            objects[code] += 1
+            if outcome.seed < census["samples"].get(code, outcome.seed + 1):
+                census["samples"][code] = outcome.seed
+    census["objects"] = dict(objects)
+    return census
+
+def load_checkpoint(path, params):
+    """
+    Relit l'avancement d'une recherche interrompue.
+
+    Args:
+        path (str): Fichier de sauvegarde
+        params (dict): Paramètres de la recherche en cours
+
+    Returns:
+        dict: Avancement (voir search), None si le fichier n'existe pas
+
+    Raises:
+        ValueError: Si la sauvegarde vient d'une recherche aux autres paramètres
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        progress = json.load(f)
+    if progress.get("params") != params:
+        raise ValueError(f"La sauvegarde {path} vient d'une autre recherche ({progress.get('params')})")
+    return progress
+
+def save_checkpoint(path, progress):
+    """
+    Écrit l'avancement d'une recherche (fichier remplacé d'un coup : une
+    interruption pendant l'écriture laisse la sauvegarde précédente intacte).
+
+    Args:
+        path (str): Fichier de sauvegarde
+        progress (dict): Avancement
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "w") as f:
+        json.dump(progress, f, indent=1, sort_keys=True)
+    os.replace(temporary, path)
+
+def search(soups, first_seed=0, rule="B3/S23", workers=None, batch=BATCH, soup=SOUP_SIZE,
+           size=GRID_SIZE, density=DENSITY, symmetry="C1", max_generations=MAX_GENERATIONS,
+           checkpoint=None, report=REPORT_INTERVAL, out=sys.stdout):
+    """
+    Recense les cendres des soupes de graines first_seed à first_seed + soups - 1,
+    réparties par tâches de batch soupes entre des processus de calcul.
+
+    Args:
+        soups (int): Nombre de soupes
+        first_seed (int): Graine de la première soupe
+        rule (str): Règle (deux états, rayon 1)
+        workers (int, optional): Nombre de processus (par défaut : un par cœur)
+        batch (int): Soupes par tâche
+        soup (int): Côté des soupes
+        size (int): Côté des grilles
+        density (float): Proportion de cellules vivantes des soupes
+        symmetry (str): Symétrie des soupes (voir engines.SYMMETRIES)
+        max_generations (int): Limite de générations d'une soupe
+        checkpoint (str, optional): Fichier de sauvegarde de l'avancement,
+            relu au lancement pour reprendre une recherche interrompue
+        report (float): Intervalle entre deux lignes de progression (0 = aucune)
+        out: Flux des lignes de progression
+
+    Returns:
+        dict: Avancement : params, done (graines de début des tâches terminées),
+            census (recensement, voir new_census), seconds (temps de calcul)
+
+    Raises:
+        ValueError: Si la règle, la symétrie ou les tailles sont invalides, ou si
+            la sauvegarde vient d'une autre recherche
+    """
+    # Vérifie les paramètres avant de lancer les processus
+    compiled = rules.compile_rule(rule)
+    if not ensemble.BitPackedEnsemble.supports(compiled):
+        raise ValueError(f"Règle {compiled.name} non gérée (deux états et rayon 1 uniquement)")
+    if symmetry not in engines.SYMMETRIES:
+        raise ValueError(f"Symétrie inconnue : {symmetry} (attendu : {', '.join(engines.SYMMETRIES)})")
+    if not 1 <= soup <= size - 2 * EDGE:
+        raise ValueError(f"Soupe de {soup} x {soup} trop grande pour des grilles de {size} x {size}")
+
+    # Reprend la recherche sauvegardée aux mêmes paramètres
+    params = {"rule": compiled.name, "first_seed": first_seed, "soups": soups, "batch": batch,
+              "soup": soup, "size": size, "density": density, "symmetry": symmetry,
+              "max_generations": max_generations}
+    progress = load_checkpoint(checkpoint, params) if checkpoint else None
+    if progress is None:
+        progress = {"params": params, "done": [], "census": new_census(), "seconds": 0.0}
+    done = set(progress["done"])
+    todo = [first for first in range(first_seed, first_seed + soups, batch) if first not in done]
+    census = progress["census"]
+
+    start = time.perf_counter()
+    before = progress["seconds"]
+    last_report = last_save = start
+    processed = 0  # Soupes traitées depuis le lancement (débit)
+    workers = workers or os.cpu_count() or 1
+    pending = {}
+    with ProcessPoolExecutor(workers) as pool:
+        try:
+            while todo or pending:
+                # Au plus deux tâches en attente par processus (mémoire bornée)
+                while todo and len(pending) < 2 * workers:
+                    first = todo.pop(0)
+                    count = min(batch, first_seed + soups - first)
+                    pending[pool.submit(search_batch, first, count, compiled.name, soup, size,
+                                        density, symmetry, max_generations)] = first
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    part = future.result()
+                    merge_census(census, part)
+                    progress["done"].append(pending.pop(future))
+                    processed += part["soups"]
+
+                now = time.perf_counter()
+                progress["seconds"] = before + now - start
+                if report and now - last_report >= report:
+                    last_report = now
+                    print(f"soupes {census['soups']:>10} : {processed / (now - start):,.1f} soupes/s, "
+                          f"{sum(census['objects'].values()):,} objets", file=out, flush=True)
+                if checkpoint and now - last_save >= CHECKPOINT_INTERVAL:
+                    last_save = now
+                    save_checkpoint(checkpoint, progress)
+        except KeyboardInterrupt:
+            # Interruption (Ctrl+C) : les tâches en attente sont abandonnées,
+            # celles déjà terminées sont tout de même sauvegardées
+            for future in pending:
+                future.cancel()
+    progress["done"].sort()
+    if checkpoint:
+        save_checkpoint(checkpoint, progress)
+    return progress
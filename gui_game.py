@@ -6,6 +6,8 @@ Interface de simulation du Jeu de la Vie
 import tkinter as tk
 from tkinter import ttk
 import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_rules as rules
 import theme_manager as tm
 import history_manager as hm
 from gui_components import show_custom_message, ModernButton
@@ -102,6 +104,11 @@ class ModernApp(tk.Tk):
         # F11 = bascule plein écran / fenêtré
         self.bind("<F11>", toggle_fullscreen)
 
+        # Flèches = déplacement de la vue dans l'univers infini (moteur "infinite")
+        for key, (rows, cols) in {"<Up>": (-1, 0), "<Down>": (1, 0),
+                                  "<Left>": (0, -1), "<Right>": (0, 1)}.items():
+            self.bind(key, lambda event, r=rows, c=cols: self.pan_view(r, c))
+
         def on_resize(event):
             """
             Gère le redimensionnement de la fenêtre en mode fenêtré.
@@ -147,7 +154,12 @@ class ModernApp(tk.Tk):
         self.create_ui()
         
         # Démarre les threads workers pour les calculs parallèles
-        core.start_workers(core.n)
+        # (taille par défaut si la grille sauvegardée dépasse le budget mémoire)
+        # (modèles de coût mesurés lors d'une calibration précédente, sans nouvelle mesure)
+        core.load_calibration(tm.CALIBRATION_FILE)
+        engine = core.AUTO if core.auto_engine else core.engine_name
+        if not self.start_grid(core.n, engine, core.topology_name):
+            self.start_grid(core.DEFAULT_N, "threads", core.topology_name)
         
         # Charger l'historique AVANT de randomiser
         hm.load_history_from_file()
@@ -185,6 +197,12 @@ class ModernApp(tk.Tk):
         # Le délai permet à l'interface de se charger complètement avant d'afficher le message
         if has_previous_session:
             self.after(500, lambda: self.show_resume_info_with_choice(was_running))
+
+        # Règle sauvegardée refusée (malformée ou non gérée par le moteur choisi)
+        if tm.rule_error:
+            self.after(500, lambda: show_custom_message(
+                self, "Règle non restaurée",
+                f"{tm.rule_error}\nRègle appliquée : {core.rule.name}", "warning"))
         
         # Démarre la boucle de mise à jour de l'interface (30ms)
         self.after(30, self.ui_loop)
@@ -219,6 +237,22 @@ class ModernApp(tk.Tk):
         )
         self.gen_label.pack(side='left', padx=20)
 
+        # Label de la population (naissances et morts de la dernière génération)
+        self.pop_label = tk.Label(
+            stats_inner, text="",
+            font=("Arial", 12),
+            bg=tm.current_theme["panel"], fg=tm.current_theme["text"]
+        )
+        self.pop_label.pack(side='left', padx=20)
+
+        # Label du débit réellement obtenu (mesuré par le planificateur)
+        self.rate_label = tk.Label(
+            stats_inner, text="",
+            font=("Arial", 12),
+            bg=tm.current_theme["panel"], fg=tm.current_theme["text"]
+        )
+        self.rate_label.pack(side='left', padx=20)
+
         # Label du statut de la simulation (à droite)
         self.status_label = tk.Label(
             stats_inner, text="▶️ En cours" if core.running.is_set() else "⏸️ En pause",
@@ -438,14 +472,14 @@ class ModernApp(tk.Tk):
 
         # Section vitesse de simulation
         tk.Label(
-            config_inner, text="⚡ Vitesse (gen/s)",
+            config_inner, text="⚡ Vitesse (gen/s, 0 = max)",
             font=("Arial", 9, "bold"),
             bg=tm.current_theme["panel"], fg=tm.current_theme["text"]
         ).pack(pady=(5, 2))
 
-        # Curseur de vitesse (1 à 30 générations par seconde)
+        # Curseur de vitesse (1 à 30 générations par seconde, 0 = aussi vite que possible)
         self.speed_scale = tk.Scale(
-            config_inner, from_=1, to=30, orient='horizontal',
+            config_inner, from_=0, to=30, orient='horizontal',
             command=self.on_speed,  # Callback lors du changement
             bg=tm.current_theme["accent"],
             fg=tm.current_theme["text"],
@@ -456,6 +490,88 @@ class ModernApp(tk.Tk):
         self.speed_scale.set(core._speed)  # Valeur initiale
         self.speed_scale.pack(pady=2)
 
+        # Pause automatique quand la grille répète un état (cendres stables ou périodiques)
+        self.cycle_var = tk.BooleanVar(value=core.stop_on_cycle)
+        tk.Checkbutton(
+            config_inner, text="🔁 Pause sur cycle", variable=self.cycle_var,
+            command=self.on_stop_on_cycle,
+            bg=tm.current_theme["panel"], fg=tm.current_theme["text"],
+            selectcolor=tm.current_theme["bg"], activebackground=tm.current_theme["panel"]
+        ).pack(pady=2)
+
+        # Vue recadrée sur la boîte englobante des cellules (grandes grilles, en image)
+        self.fit_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            config_inner, text="🔍 Recadrer", variable=self.fit_var,
+            command=self.on_fit_view,
+            bg=tm.current_theme["panel"], fg=tm.current_theme["text"],
+            selectcolor=tm.current_theme["bg"], activebackground=tm.current_theme["panel"]
+        ).pack(pady=2)
+
+        # Section taille de la grille, moteur de calcul et topologie
+        tk.Label(
+            config_inner, text="📐 Grille (taille, moteur, bords)",
+            font=("Arial", 9, "bold"),
+            bg=tm.current_theme["panel"], fg=tm.current_theme["text"]
+        ).pack(pady=(10, 2))
+
+        # Champ de saisie de la taille (n x n cellules)
+        self.size_var = tk.StringVar(value=str(core.n))
+        tk.Spinbox(
+            config_inner, from_=core.MIN_N, to=100000, increment=10,
+            textvariable=self.size_var, width=10, justify='center',
+            bg=tm.current_theme["bg"], fg=tm.current_theme["text"],
+            buttonbackground=tm.current_theme["accent"]
+        ).pack(pady=2)
+
+        # Liste des moteurs disponibles
+        # (AUTO : moteur le moins coûteux pour la taille et la règle, voir core.choose_engine)
+        self.engine_var = tk.StringVar(value=core.AUTO if core.auto_engine else core.engine_name)
+        ttk.Combobox(
+            config_inner, textvariable=self.engine_var, state='readonly', width=12,
+            values=[core.AUTO, "threads"] + sorted(engines.ENGINES)
+        ).pack(pady=2)
+
+        # Liste des topologies (conditions aux bords)
+        self.topology_var = tk.StringVar(value=core.topology_name)
+        ttk.Combobox(
+            config_inner, textvariable=self.topology_var, state='readonly', width=12,
+            values=list(engines.TOPOLOGIES)
+        ).pack(pady=2)
+
+        # Bouton d'application (recrée la grille)
+        ModernButton(config_inner, "✔ Appliquer", self.apply_grid_size,
+                    width=160, height=35, bg=tm.current_theme["panel"]).pack(pady=3)
+
+        # Saut du moteur hashlife : au plus 2^k générations par étape (appliqué sans recréer la grille)
+        tk.Label(
+            config_inner, text="Saut hashlife (2^k gén.)", font=("Arial", 8),
+            bg=tm.current_theme["panel"], fg=tm.current_theme["text"]
+        ).pack(pady=(4, 0))
+        self.jump_var = tk.StringVar(value=str(core.jump))
+        tk.Spinbox(
+            config_inner, from_=0, to=core.MAX_JUMP, increment=1, command=self.apply_jump,
+            textvariable=self.jump_var, width=10, justify='center',
+            bg=tm.current_theme["bg"], fg=tm.current_theme["text"],
+            buttonbackground=tm.current_theme["accent"]
+        ).pack(pady=2)
+
+        # Section règle d'évolution (notation B/S, modifiable pendant la simulation)
+        tk.Label(
+            config_inner, text="🧬 Règle (B/S)",
+            font=("Arial", 9, "bold"),
+            bg=tm.current_theme["panel"], fg=tm.current_theme["text"]
+        ).pack(pady=(10, 2))
+
+        # Liste des règles connues, ou saisie libre (ex: B36/S23)
+        self.rule_var = tk.StringVar(value=core.rule.name)
+        ttk.Combobox(
+            config_inner, textvariable=self.rule_var, width=14,
+            values=sorted(rules.RULES.values())
+        ).pack(pady=2)
+        ModernButton(config_inner, "✔ Appliquer la règle", self.apply_rule,
+                    width=160, height=35, bg=tm.current_theme["panel"]).pack(pady=3)
+
         # Section sélection de thèmes
         tk.Label(
             config_inner, text="🎨 Thèmes",
@@ -541,13 +657,12 @@ class ModernApp(tk.Tk):
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
-        # Calcule la taille d'une cellule
-        cell_width = canvas_width / core.n
-        cell_height = canvas_height / core.n
+        # Rectangle de cellules affiché (toute la grille, ou vue recadrée)
+        top, left, bottom, right = self.view_box()
         
         # Conversion des coordonnées pixel en indices de cellule (1-indexed)
-        j = int(event.x / cell_width) + 1
-        i = int(event.y / cell_height) + 1
+        j = left + int(event.x * (right - left) / canvas_width)
+        i = top + int(event.y * (bottom - top) / canvas_height)
         
         # Vérifie que les coordonnées sont dans la grille valide
         if 1 <= i <= core.n and 1 <= j <= core.n:
@@ -624,10 +739,11 @@ class ModernApp(tk.Tk):
             # Mode dessin normal : active le drag
             self.is_dragging = True
             self.last_cell = (i, j)
-            # Détermine le mode selon l'état actuel de la cellule
-            self.drag_mode = 'erase' if core.T[i][j] == 1 else 'draw'
+            # Détermine le mode selon l'état affiché de la cellule (dernier instantané)
+            alive = core.get_cell(i, j, core.snapshot.grid) == 1
+            self.drag_mode = 'erase' if alive else 'draw'
             # Inverse l'état de la cellule cliquée
-            core.T[i][j] = 0 if core.T[i][j] == 1 else 1
+            core.set_cell(i, j, 0 if alive else 1)
             # Force le rafraîchissement
             core.redraw_event.set()
 
@@ -653,9 +769,9 @@ class ModernApp(tk.Tk):
                 
                 # Applique le mode approprié
                 if self.drag_mode == 'draw':
-                    core.T[i][j] = 1  # Dessine (cellule vivante)
+                    core.set_cell(i, j, 1)  # Dessine (cellule vivante)
                 else:
-                    core.T[i][j] = 0  # Efface (cellule morte)
+                    core.set_cell(i, j, 0)  # Efface (cellule morte)
                 
                 # Force le rafraîchissement
                 core.redraw_event.set()
@@ -701,6 +817,11 @@ class ModernApp(tk.Tk):
         if new_width < 50 or new_height < 50:
             return
         
+        # Grande grille : l'image est simplement recalculée à la nouvelle taille
+        if self.use_image():
+            self.build_canvas()
+            return
+
         # Calcule la nouvelle taille de cellule (carré)
         new_cell_size = min(new_width // core.n, new_height // core.n)
         
@@ -717,8 +838,10 @@ class ModernApp(tk.Tk):
         """
         # Supprime tous les éléments existants du canvas
         self.canvas.delete('all')
-        # Réinitialise la liste des rectangles
-        self.rects = [[None]*(core.n+1) for _ in range(core.n+1)]
+        # Réinitialise la liste des rectangles (remplie seulement en mode rectangles)
+        self.rects = []
+        # Boîte des cellules dessinées non mortes (None = aucune)
+        self.drawn_bounds = None
         
         # Force la mise à jour des dimensions
         self.canvas.update_idletasks()
@@ -733,6 +856,20 @@ class ModernApp(tk.Tk):
         # Calcule la taille d'une cellule en pixels
         cell_width = canvas_width / core.n
         cell_height = canvas_height / core.n
+        core.cell_size = int((cell_width + cell_height) / 2)
+
+        # Grande grille : une seule image au lieu d'un rectangle par cellule
+        if self.use_image():
+            self.image_item = self.canvas.create_image(0, 0, anchor='nw')
+            self.render_image()
+            return
+        
+        # Lit le dernier instantané publié au format liste (quel que soit le moteur)
+        snapshot = core.snapshot
+        cells = core.grid_to_list(snapshot.grid) if snapshot is not None else None
+        self.rects = [[None]*(core.n+1) for _ in range(core.n+1)]
+        # Couleur de chaque état (morte, vivante, états mourants des règles Generations)
+        palette = tm.state_colors(core.rule.states)
         
         # Crée tous les rectangles de la grille
         for i in range(1, core.n+1):
@@ -744,7 +881,7 @@ class ModernApp(tk.Tk):
                 y1 = i * cell_height
                 
                 # Détermine la couleur selon l'état de la cellule
-                color = tm.current_theme["alive"] if core.T and core.T[i][j] else tm.current_theme["dead"]
+                color = palette[cells[i][j]] if cells else palette[0]
                 # Crée le rectangle
                 r = self.canvas.create_rectangle(x0, y0, x1, y1,
                                                 fill=color, 
@@ -752,10 +889,257 @@ class ModernApp(tk.Tk):
                                                 width=1)
                 # Stocke la référence du rectangle
                 self.rects[i][j] = r
-        
-        # Met à jour la taille de cellule globale
-        core.cell_size = int((cell_width + cell_height) / 2)
+        self.drawn_bounds = snapshot.bounds if snapshot is not None else None
     
+    def pan_view(self, rows, cols):
+        """
+        Déplace la fenêtre affichée d'un quart de grille (univers infini uniquement).
+
+        Args:
+            rows (int): Direction verticale (-1, 0 ou 1)
+            cols (int): Direction horizontale (-1, 0 ou 1)
+        """
+        if not getattr(core._engine, "unbounded", False):
+            return
+        step = max(1, core.n // 4)
+        core._engine.pan(rows * step, cols * step)
+        # Toute la fenêtre change
+        core.mark_dirty(None)
+        core.redraw_event.set()
+
+    def view_box(self):
+        """
+        Rectangle de cellules affiché : toute la grille, ou un carré centré sur
+        la boîte englobante des cellules (avec une marge) quand le recadrage est
+        actif en mode image.
+
+        Returns:
+            tuple: (haut, gauche, bas, droite), bornes bas et droite exclues
+        """
+        snapshot = core.snapshot
+        if not self.fit_var.get() or not self.use_image() or snapshot is None or snapshot.bounds is None:
+            return 1, 1, core.n + 1, core.n + 1
+        top, left, bottom, right = snapshot.bounds
+        # Côté du carré : la boîte et une marge de 10 % de chaque côté (au moins 4 cellules)
+        side = max(bottom - top, right - left)
+        side = min(core.n, side + max(8, side // 5))
+        # Carré centré sur la boîte, sans sortir de la grille
+        top = min(max(1, (top + bottom - side) // 2), core.n + 1 - side)
+        left = min(max(1, (left + right - side) // 2), core.n + 1 - side)
+        return top, left, top + side, left + side
+
+    def on_fit_view(self):
+        """
+        Callback de la case « Recadrer » : redessine la grille avec la nouvelle vue.
+        """
+        core.mark_dirty(None)
+        core.redraw_event.set()
+
+    def use_image(self):
+        """
+        Indique si la grille est affichée sous forme d'image.
+        Au-delà de core.MAX_N cellules par côté, un rectangle Tk par cellule
+        devient trop coûteux : la grille est réduite à la taille du canvas.
+
+        Returns:
+            bool: True en mode image (nécessite NumPy)
+        """
+        return core.n > core.MAX_N and engines.NUMPY_AVAILABLE
+
+    def render_image(self):
+        """
+        Dessine la grille dans une image de la taille du canvas.
+        Chaque pixel est vivant si une cellule de son bloc est vivante
+        (réduction vectorisée, sans boucle Python par cellule) ; avec une règle
+        Generations, il prend l'état le plus jeune de son bloc.
+        """
+        np = engines.np
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        snapshot = core.snapshot
+        if width <= 1 or height <= 1 or snapshot is None:
+            return
+
+        # Cellules affichées (toute la grille ou vue recadrée) du dernier instantané,
+        # quel que soit le moteur
+        top, left, bottom, right = self.view_box()
+        cells = core.grid_to_array(snapshot.grid)[top:bottom, left:right]
+
+        # Première ligne / colonne de cellules de chaque pixel
+        rows = np.arange(height) * (bottom - top) // height
+        cols = np.arange(width) * (right - left) // width
+        states = core.rule.states
+        colors = tm.state_colors(states)
+        if states > 2:
+            # Priorité d'affichage : vivante (states - 1), puis mourantes de la plus
+            # jeune à la plus ancienne, morte (0) ; le maximum de chaque bloc l'emporte
+            colors = [colors[0]] + colors[:0:-1]
+
+        # Couleurs du thème (une par état) ; tous les pixels sont d'abord morts
+        palette = np.array([
+            [c >> 8 for c in self.winfo_rgb(color)] for color in colors
+        ], dtype=np.uint8)
+        pixels = np.empty((height, width, 3), dtype=np.uint8)
+        pixels[...] = palette[0]
+
+        # Seuls les pixels qui recouvrent la boîte englobante des cellules sont calculés
+        def covering(starts, first, last):
+            """
+            Pixels dont le bloc de cellules croise les cellules first à last - 1.
+
+            Args:
+                starts (numpy.ndarray): Première cellule de chaque pixel
+                first (int): Première cellule occupée
+                last (int): Cellule de fin exclue
+
+            Returns:
+                tuple: Premier pixel et pixel de fin exclu
+            """
+            p0 = int(np.searchsorted(starts, first))
+            # Le pixel précédent déborde sur first s'il commence avant
+            if p0 > 0 and (p0 == len(starts) or starts[p0] > first):
+                p0 -= 1
+            return p0, int(np.searchsorted(starts, last))
+
+        if snapshot.bounds is not None:
+            b_top, b_left, b_bottom, b_right = snapshot.bounds
+            p0, p1 = covering(rows, b_top - top, b_bottom - top)
+            q0, q1 = covering(cols, b_left - left, b_right - left)
+            if p0 < p1 and q0 < q1:
+                # Cellules de ces pixels, puis OU (ou maximum) par bloc
+                # (les lignes d'abord : la réduction porte sur des lignes contiguës)
+                block = cells[rows[p0]:rows[p1] if p1 < height else None,
+                              cols[q0]:cols[q1] if q1 < width else None]
+                starts, ends = rows[p0:p1] - rows[p0], cols[q0:q1] - cols[q0]
+                if states == 2:
+                    blocks = np.bitwise_or.reduceat(np.bitwise_or.reduceat(block, starts, axis=0), ends, axis=1)
+                else:
+                    rank = np.where(block > 0, states - block, 0).astype(np.uint8)
+                    blocks = np.maximum.reduceat(np.maximum.reduceat(rank, starts, axis=0), ends, axis=1)
+                pixels[p0:p1, q0:q1] = palette[blocks]
+
+        # Image PPM construite en mémoire puis affichée dans le canvas
+        header = f"P6 {width} {height} 255\n".encode()
+        self.photo = tk.PhotoImage(width=width, height=height,
+                                   data=header + pixels.tobytes(), format="PPM")
+        self.canvas.itemconfig(self.image_item, image=self.photo)
+
+    def start_grid(self, size, engine, topology):
+        """
+        Démarre une grille size x size si elle tient dans le budget mémoire.
+        Le moteur peut être remplacé par un moteur plus compact et l'historique
+        raccourci (voir core.plan_grid).
+
+        Args:
+            size (int): Taille de la grille (n x n cellules)
+            engine (str): Moteur souhaité (core.AUTO : choisi par core.choose_engine)
+            topology (str): Condition aux bords souhaitée
+
+        Returns:
+            bool: True si la grille a été créée, False si elle est trop grande
+        """
+        # Sans NumPy, l'affichage se limite à un rectangle par cellule
+        if size > core.MAX_N and not engines.NUMPY_AVAILABLE:
+            return False
+
+        # Choix automatique : moteur le moins coûteux pour cette taille
+        auto = engine == core.AUTO
+        if auto:
+            engine = core.choose_engine(size, topology=topology)
+
+        plan = core.plan_grid(size, engine, hm.MAX_HISTORY_GENERATIONS)
+        if plan is None:
+            return False
+
+        # Applique le moteur retenu et la profondeur d'historique possible
+        engine, core.history_limit = plan
+        core.start_workers(size, engine=engine, topology=topology)
+        # Le choix automatique est conservé pour les grilles suivantes
+        core.auto_engine = auto
+        return True
+
+    def apply_grid_size(self):
+        """
+        Recrée la grille avec la taille, le moteur et la topologie choisis.
+        Vérifie la mémoire nécessaire avant d'arrêter la simulation en cours.
+        """
+        # Lit la taille saisie
+        try:
+            size = int(self.size_var.get())
+        except ValueError:
+            show_custom_message(self, "Taille invalide",
+                                "La taille doit être un nombre entier.", "error")
+            return
+        if size < core.MIN_N:
+            show_custom_message(self, "Taille invalide",
+                                f"La taille minimale est {core.MIN_N}.", "error")
+            return
+        engine = self.engine_var.get()
+        topology = self.topology_var.get()
+
+        # Si on n'est pas à la génération 0, demande confirmation
+        if core.gen_counter > 0:
+            result = show_custom_message(
+                self,
+                "⚠️ Réinitialiser ?",
+                f"Vous êtes à la génération {core.gen_counter}.\n\nVoulez-vous créer une nouvelle grille {size}x{size} et remettre le compteur à 0 ?",
+                "question"
+            )
+            if not result:
+                return
+
+        # Arrête la simulation puis crée la nouvelle grille
+        core.running.clear()
+        if not self.start_grid(size, engine, topology):
+            if size > core.MAX_N and not engines.NUMPY_AVAILABLE:
+                message = f"Au-delà de {core.MAX_N}x{core.MAX_N}, NumPy est nécessaire (pip install numpy)."
+            else:
+                message = (f"Une grille {size}x{size} dépasse le budget mémoire "
+                           f"({core.MEMORY_BUDGET // 1024 ** 2} Mio), même avec le moteur bitpacked.")
+            show_custom_message(self, "⚠️ Grille trop grande", message, "warning")
+            return
+
+        # Informe si le moteur a été remplacé ou l'historique raccourci
+        replaced = engine != core.AUTO and core.engine_name != engine
+        if replaced or core.history_limit < hm.MAX_HISTORY_GENERATIONS:
+            show_custom_message(
+                self, "Mémoire limitée",
+                f"Moteur utilisé : {core.engine_name}\n"
+                f"Historique : {core.history_limit} générations",
+                "info"
+            )
+        # Informe si le moteur ne gère pas la topologie demandée
+        if core.topology_name != topology:
+            show_custom_message(
+                self, "Topologie indisponible",
+                f"Le moteur {core.engine_name} ne gère que la bordure morte (plane).",
+                "info"
+            )
+        self.engine_var.set(core.AUTO if core.auto_engine else core.engine_name)
+        self.topology_var.set(core.topology_name)
+        self.rule_var.set(core.rule.name)
+        # Choix automatique demandé : mesure en arrière-plan des moteurs non
+        # calibrés, utilisée par les choix suivants (le choix actuel est gardé)
+        if engine == core.AUTO:
+            core.calibrate(tm.CALIBRATION_FILE, background=True)
+
+        # Nouvelle grille aléatoire et nouvel historique
+        hm.generation_history.clear()
+        core.randomize_grid(core.T)
+        hm.save_state_to_history()
+
+        # Met à jour l'interface
+        self.start_btn.text = "▶ Démarrer"
+        self.start_btn.draw()
+        self.status_label.config(text="⏸️ En pause")
+        self.update_control_buttons()
+        self.update_history_buttons()
+        self.build_canvas()
+        core.redraw_event.set()
+
+        # Sauvegarde la nouvelle taille
+        tm.save_config()
+
     def force_initial_resize(self):
         """
         Force un redimensionnement initial du canvas.
@@ -1074,6 +1458,35 @@ class ModernApp(tk.Tk):
             # Force le rafraîchissement visuel de la grille
             core.redraw_event.set()
     
+    def apply_jump(self):
+        """
+        Applique le saut saisi (moteur hashlife, pris en compte dès l'étape suivante).
+        """
+        try:
+            core.set_jump(int(self.jump_var.get()))
+        except ValueError:
+            show_custom_message(self, "Saut invalide",
+                                f"Le saut doit être un entier de 0 à {core.MAX_JUMP}.", "error")
+            self.jump_var.set(str(core.jump))
+            return
+        tm.save_config()
+
+    def apply_rule(self):
+        """
+        Applique la règle saisie (prise en compte dès la génération suivante).
+        """
+        try:
+            core.set_rule(self.rule_var.get())
+        except ValueError as error:
+            show_custom_message(self, "Règle invalide", str(error), "error")
+            return
+        # Affiche la règle en notation canonique et la sauvegarde
+        self.rule_var.set(core.rule.name)
+        tm.save_config()
+        # La palette dépend du nombre d'états : toute la grille est redessinée
+        core.mark_dirty(None)
+        core.redraw_event.set()
+
     def on_speed(self, val):
         """
         Callback appelé lors du changement de vitesse.
@@ -1087,6 +1500,14 @@ class ModernApp(tk.Tk):
         # Sauvegarde la configuration
         tm.save_config()
     
+    def on_stop_on_cycle(self):
+        """
+        Callback de la case « Pause sur cycle » : active ou non la pause
+        automatique et sauvegarde la configuration.
+        """
+        core.stop_on_cycle = self.cycle_var.get()
+        tm.save_config()
+
     def reset_params(self):
         """
         Réinitialise les paramètres (vitesse et thème) aux valeurs par défaut.
@@ -1105,7 +1526,7 @@ class ModernApp(tk.Tk):
             tm.current_theme_name = "dark"
             tm.current_theme = tm.THEMES["dark"]
             # Réinitialise la vitesse à 5 gen/s
-            core._speed = 5.0
+            core.set_speed(5.0)
             
             # Reconstruit l'interface avec les nouvelles valeurs
             self.create_ui()
@@ -1348,6 +1769,26 @@ class ModernApp(tk.Tk):
             
         # Met à jour le compteur de génération
         self.gen_label.config(text=f"🧬 Génération: {core.gen_counter}")
+        # Population tenue à jour par le moteur (vide si le suivi est désactivé)
+        if core.track_population:
+            self.pop_label.config(text=f"👥 Population: {core.population:,} "
+                                       f"(+{core.births:,} / -{core.deaths:,})")
+        else:
+            self.pop_label.config(text="")
+        # Débit obtenu (vide en pause), ou cycle détecté
+        rate = core.get_achieved_rate()
+        if core.cycle is not None:
+            period, start = core.cycle
+            kind = "🪨 Stable" if period == 1 else f"🔁 Période {period}"
+            self.rate_label.config(text=f"{kind} depuis la génération {start}")
+        else:
+            self.rate_label.config(text=f"⏱️ {rate:,.1f} gen/s" if rate > 0 else "")
+        # Pause automatique sur un cycle : les contrôles suivent l'état du moteur
+        if not core.running.is_set() and self.start_btn.text == "⏸ Pause":
+            self.start_btn.text = "▶ Démarrer"
+            self.start_btn.draw()
+            self.status_label.config(text="⏸️ En pause")
+            self.update_control_buttons()
         # Met à jour les boutons historique
         self.update_history_buttons()
         # Planifie le prochain appel de la boucle UI
@@ -1355,14 +1796,56 @@ class ModernApp(tk.Tk):
     
     def redraw(self):
         """
-        Redessine toutes les cellules de la grille.
+        Redessine les cellules de la grille modifiées depuis le dernier affichage.
         Met à jour les couleurs selon l'état actuel.
         """
-        # Parcourt toutes les cellules
-        for i in range(1, core.n+1):
-            for j in range(1, core.n+1):
-                # Détermine la couleur selon l'état (vivante ou morte)
-                color = tm.current_theme["alive"] if core.T[i][j] else tm.current_theme["dead"]
+        # Cellules modifiées depuis le dernier redessin (None = toute la grille)
+        dirty = core.take_dirty_cells()
+        # Dernier instantané publié : une seule lecture, jamais modifié pendant le dessin
+        snapshot = core.snapshot
+        if snapshot is None:
+            return
+        
+        # Grande grille : l'image complète est recalculée (opérations vectorisées)
+        if self.use_image():
+            self.render_image()
+            return
+
+        # Couleur de chaque état (morte, vivante, états mourants des règles Generations)
+        palette = tm.state_colors(core.rule.states)
+
+        # Boîte des cellules non mortes, dessinées ou à dessiner
+        if snapshot.bounds is not None:
+            bounds = snapshot.bounds if self.drawn_bounds is None else core._union(self.drawn_bounds, snapshot.bounds)
+        else:
+            bounds = self.drawn_bounds
+
+        # Seules les cellules modifiées sont mises à jour (moteur "active", dessin)
+        if dirty is not None:
+            self.drawn_bounds = bounds
+            for i, j in dirty:
+                # Détermine la couleur selon l'état de la cellule
+                color = palette[core.get_cell(i, j, snapshot.grid)]
+                try:
+                    # Met à jour la couleur du rectangle
+                    self.canvas.itemconfig(self.rects[i][j], fill=color)
+                except:
+                    # Ignore les erreurs (rectangle inexistant)
+                    pass
+            return
+        
+        # Lit l'instantané une seule fois au format liste (quel que soit le moteur)
+        cells = core.grid_to_list(snapshot.grid)
+        self.drawn_bounds = snapshot.bounds
+        if bounds is None:
+            return
+
+        # Parcourt les cellules de la boîte (hors de la boîte, toutes restent mortes)
+        top, left, bottom, right = bounds
+        for i in range(max(1, top), min(core.n + 1, bottom)):
+            for j in range(max(1, left), min(core.n + 1, right)):
+                # Détermine la couleur selon l'état de la cellule
+                color = palette[cells[i][j]]
                 try:
                     # Met à jour la couleur du rectangle
                     self.canvas.itemconfig(self.rects[i][j], fill=color)
@@ -1,44 +1,35 @@
 """
 History Manager - Gestion de l'historique des générations
-Permet de naviguer dans l'historique (undo/redo)
+Permet de naviguer dans l'historique (undo/redo) de la simulation par défaut
+de gamelife_core (l'historique lui-même appartient à la simulation, voir
+Simulation.record_history) et de le sauvegarder dans un fichier.
 """
 
+import base64
+import itertools
 import json
 import os
+import zlib
 import gamelife_core as core
+import gamelife_engines as engines
 
-# Dictionnaire contenant l'état de la grille pour chaque génération
+# Historique de la simulation par défaut (même dictionnaire que core.history)
 # Format : {numero_generation: grille}
-generation_history = {}
+generation_history = core.history
 
 # Constantes de configuration
-MAX_HISTORY_GENERATIONS = 100  # Nombre maximum de générations conservées en mémoire
+MAX_HISTORY_GENERATIONS = core.MAX_HISTORY_GENERATIONS  # Nombre maximum de générations conservées en mémoire
 HISTORY_FILE = "gamelife_history.json"  # Fichier de sauvegarde de l'historique
+# Nombre maximal de cellules écrites dans le fichier (état actuel compris) : au-delà,
+# seules les générations les plus récentes de l'historique sont sauvegardées
+HISTORY_FILE_CELLS = 50_000_000
 
 def save_state_to_history():
     """
     Sauvegarde l'état actuel de la grille dans l'historique.
-    Limite la taille de l'historique à MAX_HISTORY_GENERATIONS.
+    Limite la taille de l'historique à core.history_limit.
     """
-    global generation_history
-
-    # Vérifie que la grille existe
-    if not core.T:
-        return
-
-    # Copie profonde de la grille actuelle pour éviter les références
-    # Chaque ligne est copiée indépendamment pour préserver l'état
-    state = [row[:] for row in core.T]
-
-    # Sauvegarde l'état avec le numéro de génération comme clé
-    generation_history[core.gen_counter] = state
-
-    # Limite la taille de l'historique si nécessaire
-    if len(generation_history) > MAX_HISTORY_GENERATIONS:
-        # Trouve la génération la plus ancienne dans l'historique
-        min_gen = min(generation_history.keys())
-        # Supprime cette génération pour libérer de la mémoire
-        del generation_history[min_gen]
+    core.record_history()
 
 def load_state_from_history(direction):
     """
@@ -50,56 +41,7 @@ def load_state_from_history(direction):
     Returns:
         bool: True si l'opération a réussi, False sinon
     """
-    # Vérifie que l'historique existe et n'est pas vide
-    if not generation_history:
-        return False
-
-    # Liste triée des générations disponibles (ordre chronologique)
-    available_gens = sorted(generation_history.keys())
-
-    if direction == "undo":
-        # Cherche les générations antérieures à la génération actuelle
-        previous_gens = [g for g in available_gens if g < core.gen_counter]
-        if previous_gens:
-            # Prend la génération précédente la plus proche (dernière de la liste)
-            target_gen = previous_gens[-1]
-        else:
-            # Aucune génération antérieure disponible
-            return False
-
-    elif direction == "redo":
-        # Cherche les générations ultérieures à la génération actuelle
-        next_gens = [g for g in available_gens if g > core.gen_counter]
-        if next_gens:
-            # Prend la génération suivante la plus proche (première de la liste)
-            target_gen = next_gens[0]
-        else:
-            # Aucune génération ultérieure disponible
-            return False
-
-    else:
-        # Direction inconnue, opération impossible
-        return False
-
-    # Récupère l'état de la grille à restaurer depuis l'historique
-    state = generation_history[target_gen]
-
-    # Copie les cellules dans la grille actuelle
-    # Parcourt toutes les lignes de l'état sauvegardé
-    for i in range(len(state)):
-        # Parcourt toutes les colonnes de chaque ligne
-        for j in range(len(state[i])):
-            # Restaure l'état de chaque cellule (vivante ou morte)
-            core.T[i][j] = state[i][j]
-
-    # Met à jour le compteur de génération pour refléter le nouvel état
-    core.gen_counter = target_gen
-
-    # Force le rafraîchissement de l'affichage pour montrer le nouvel état
-    core.redraw_event.set()
-
-    # Opération réussie
-    return True
+    return core.restore_history(direction)
 
 def can_undo():
     """
@@ -108,16 +50,7 @@ def can_undo():
     Returns:
         bool: True si un undo est possible, False sinon
     """
-    # Aucun undo possible si l'historique est vide
-    if not generation_history:
-        return False
-
-    # Récupère les générations disponibles triées
-    available_gens = sorted(generation_history.keys())
-
-    # Undo possible si on n'est pas à la plus ancienne génération
-    # Compare la génération actuelle avec la plus ancienne disponible
-    return core.gen_counter > min(available_gens)
+    return core.can_undo()
 
 def can_redo():
     """
@@ -126,46 +59,110 @@ def can_redo():
     Returns:
         bool: True si un redo est possible, False sinon
     """
-    # Aucun redo possible si l'historique est vide
-    if not generation_history:
-        return False
-
-    # Récupère les générations disponibles triées
-    available_gens = sorted(generation_history.keys())
-
-    # Redo possible si on n'est pas à la plus récente génération
-    # Compare la génération actuelle avec la plus récente disponible
-    return core.gen_counter < max(available_gens)
+    return core.can_redo()
 
 def clear_history():
     """
     Supprime complètement l'historique des générations.
     Libère la mémoire utilisée par tous les snapshots sauvegardés.
     """
-    global generation_history
     # Vide le dictionnaire d'historique (supprime toutes les entrées)
     generation_history.clear()
 
+def encode_state(state):
+    """
+    Encode une grille pour le fichier d'historique : une cellule par bit (un
+    octet par cellule si la règle a plus de deux états), compressée avec zlib
+    puis écrite en base64.
+
+    Args:
+        state: Grille à encoder (liste de listes, tuples ou grille du moteur)
+
+    Returns:
+        dict: {"size": côté bordure comprise, "packed": un bit par cellule,
+            "cells": octets compressés en base64}
+    """
+    cells = core.grid_to_array(state)
+    if cells is not None:
+        side = cells.shape[0]
+        packed = int(cells.max(initial=0)) <= 1
+        data = engines.np.packbits(cells).tobytes() if packed else cells.tobytes()
+    else:
+        # Sans NumPy : un octet par cellule
+        rows = core.grid_to_list(state)
+        side, packed = len(rows), False
+        data = bytes(itertools.chain.from_iterable(rows))
+    return {"size": side, "packed": packed,
+            "cells": base64.b64encode(zlib.compress(data, 1)).decode("ascii")}
+
+def decode_state(entry):
+    """
+    Décode une grille du fichier d'historique (voir encode_state).
+
+    Args:
+        entry: Grille encodée, ou liste de listes (ancien format du fichier)
+
+    Returns:
+        Tableau NumPy d'octets (tuples si la grille actuelle est en listes ou
+        sans NumPy), accepté par core.load_grid
+    """
+    # Ancien format : une liste de listes de cellules
+    if isinstance(entry, list):
+        return entry
+    side = entry["size"]
+    data = zlib.decompress(base64.b64decode(entry["cells"]))
+
+    if engines.NUMPY_AVAILABLE:
+        cells = engines.np.frombuffer(data, dtype=engines.np.uint8)
+        if entry["packed"]:
+            cells = engines.np.unpackbits(cells, count=side * side)
+        cells = cells.reshape(side, side)
+        # Grille en listes : parcourue cellule par cellule par load_grid
+        if isinstance(core.T, list):
+            return tuple(map(tuple, cells.tolist()))
+        return cells
+
+    # Sans NumPy : bits (poids fort en premier, comme numpy.packbits) ou octets
+    if entry["packed"]:
+        bits = "".join(format(byte, "08b") for byte in data)
+        return tuple(tuple(map(int, bits[i * side:(i + 1) * side])) for i in range(side))
+    return tuple(tuple(data[i * side:(i + 1) * side]) for i in range(side))
+
 def save_history_to_file():
     """
-    Sauvegarde l'historique complet dans un fichier JSON.
-    Enregistre l'historique, la génération courante et l'état de la grille.
+    Sauvegarde l'historique dans un fichier JSON, grilles encodées par encode_state.
+    Enregistre l'historique, la génération courante, l'état de la grille et
+    la soupe d'origine (graine, densité, région, symétrie) pour rejouer la partie.
+    L'état actuel est toujours écrit ; les générations de l'historique le sont,
+    des plus récentes aux plus anciennes, dans la limite de HISTORY_FILE_CELLS.
     """
     try:
+        # Génération et grille lues dans le même instantané (cohérentes entre elles)
+        snapshot = core.snapshot
+        if snapshot is not None:
+            current_gen, grid = snapshot.generation, snapshot.grid
+        else:
+            current_gen, grid = core.gen_counter, core.T
+
+        # Générations sauvegardées : les plus récentes tenant dans la limite
+        # (copie des entrées : le calcul peut compléter l'historique en parallèle)
+        states = sorted(generation_history.items())
+        kept = max(0, HISTORY_FILE_CELLS // max(1, len(grid) ** 2) - 1)
+        states = states[len(states) - kept:] if kept else []
+
+        # Convertit les clés entières en chaînes pour la compatibilité JSON
+        # JSON ne supporte pas les clés entières directement
+        history_data = {str(gen): encode_state(state) for gen, state in states}
+
         # Ouvre le fichier en écriture (écrase le fichier existant)
         with open(HISTORY_FILE, "w") as f:
-            # Convertit les clés entières en chaînes pour la compatibilité JSON
-            # JSON ne supporte pas les clés entières directement
-            history_data = {
-                str(gen): state for gen, state in generation_history.items()
-            }
-
             # Sauvegarde l'historique, la génération courante et la grille
             # Crée un objet JSON avec trois champs principaux
             json.dump({
-                "history": history_data,  # Historique complet des générations
-                "current_gen": core.gen_counter,  # Numéro de la génération actuelle
-                "grid_state": core.T  # État actuel de la grille
+                "history": history_data,  # Générations récentes de l'historique
+                "current_gen": current_gen,  # Numéro de la génération actuelle
+                "grid_state": encode_state(grid),  # État actuel de la grille
+                "soup": core.soup._asdict() if core.soup is not None else None  # Tirage d'origine
             }, f)
     except Exception:
         # Ignore les erreurs d'écriture (permissions, espace disque, etc.)
@@ -173,11 +170,10 @@ def save_history_to_file():
 
 def load_history_from_file():
     """
-    Charge l'historique depuis un fichier JSON.
+    Charge l'historique depuis un fichier JSON (grilles encodées par
+    encode_state, ou listes de listes des anciens fichiers).
     Restaure l'historique, la génération courante et l'état de la grille.
     """
-    global generation_history
-
     # Vérifie que le fichier existe avant de tenter de le lire
     if os.path.exists(HISTORY_FILE):
         try:
@@ -191,9 +187,14 @@ def load_history_from_file():
 
                 # Reconvertit les clés de chaînes en entiers
                 # Les clés JSON sont toujours des chaînes, on doit les reconvertir
-                generation_history = {
-                    int(gen): state for gen, state in history_data.items()
-                }
+                # (dictionnaire partagé avec core.history : vidé puis rempli sur place).
+                # Chaque génération passe par la grille actuelle : l'historique
+                # retrouve le format du moteur, comme après record_history
+                generation_history.clear()
+                for gen, state in sorted((int(gen), state) for gen, state in history_data.items()):
+                    core.gen_counter = gen
+                    core.load_grid(decode_state(state))
+                    core.record_history()
 
                 # Restaure la génération courante (0 par défaut si absente)
                 core.gen_counter = data.get("current_gen", 0)
@@ -202,16 +203,17 @@ def load_history_from_file():
                 saved_grid = data.get("grid_state", None)
 
                 # Restaure la grille si possible (vérifie que les deux grilles existent)
-                if saved_grid and core.T:
-                    # Parcourt toutes les lignes de la grille sauvegardée
-                    for i in range(len(saved_grid)):
-                        # Parcourt toutes les colonnes de chaque ligne
-                        for j in range(len(saved_grid[i])):
-                            # Vérifie que la position existe dans la grille actuelle
-                            # Évite les erreurs si les dimensions ont changé
-                            if i < len(core.T) and j < len(core.T[i]):
-                                # Restaure l'état de la cellule
-                                core.T[i][j] = saved_grid[i][j]
+                if saved_grid and len(core.T) > 0:
+                    # Seule la partie commune est copiée si les dimensions ont changé
+                    core.load_grid(decode_state(saved_grid))
+
+                # Restaure la soupe d'origine (la région JSON est une liste)
+                soup = data.get("soup")
+                if soup:
+                    region = soup.get("region")
+                    core.soup = core.Soup(soup["seed"], soup["density"],
+                                          tuple(region) if region else None,
+                                          soup.get("symmetry", "C1"))
         except Exception:
             # Ignore les erreurs de lecture (fichier corrompu, format invalide, etc.)
             pass
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Configuration des tests : le dépôt est importable depuis le dossier tests, et
+la fixture simulation crée des simulations privées arrêtées en fin de test.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gamelife_core as core  # noqa: E402
+
+@pytest.fixture
+def simulation():
+    """
+    Fabrique de simulations privées, sans délai ni historique, arrêtées
+    (threads, processus, mémoire partagée) à la fin du test.
+
+    Returns:
+        function: simulation(size, engine="threads", topology="plane", rule=None)
+    """
+    created = []
+
+    def make(size, engine="threads", topology="plane", rule=None):
+        sim = core.Simulation()
+        sim.keep_history = False
+        sim.set_speed(0)
+        created.append(sim)
+        sim.start_workers(size, engine=engine, topology=topology, workers=2)
+        if rule is not None:
+            sim.set_rule(rule)
+        return sim
+
+    yield make
+    for sim in created:
+        sim.stop_workers()
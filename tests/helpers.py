@@ -0,0 +1,99 @@
+"""
+Outils des tests : implémentation de référence cellule par cellule (toutes
+les familles de règles et topologies) et avance synchrone d'une simulation.
+"""
+
+import time
+
+import gamelife_core as core
+import gamelife_engines as engines
+
+# Délai maximal d'une avance de quelques générations (secondes)
+TIMEOUT = 30
+
+def step_reference(grid, rule, topology="plane"):
+    """
+    Génération suivante d'une grille en listes, calculée cellule par cellule
+    (toutes les familles de règles : B/S, Generations, Larger than Life).
+
+    Args:
+        grid (list): Grille (size + 2) x (size + 2), bordure comprise
+        rule (gamelife_rules.Rule ou RangeRule): Règle compilée
+        topology (str): Condition aux bords (voir engines.TOPOLOGIES)
+
+    Returns:
+        list: Nouvelle grille (size + 2) x (size + 2), bordure remplie
+    """
+    size = len(grid) - 2
+    src = [row[:] for row in grid]
+    engines.wrap_list(src, topology)
+    radius = rule.radius
+    middle = getattr(rule, "middle", False)
+    nxt = core.make_grid(size)
+    for i in range(1, size + 1):
+        for j in range(1, size + 1):
+            # Voisines vivantes (état 1) ; hors de la grille, les cellules sont mortes
+            count = 0
+            for di in range(-radius, radius + 1):
+                for dj in range(-radius, radius + 1):
+                    if (di or dj or middle) and 0 <= i + di <= size + 1 and 0 <= j + dj <= size + 1:
+                        count += src[i + di][j + dj] == 1
+            state = src[i][j]
+            if state == 0:
+                nxt[i][j] = 1 if count in rule.births else 0
+            elif state == 1:
+                # Une cellule qui ne survit pas meurt, ou devient mourante (Generations)
+                nxt[i][j] = 1 if count in rule.survivals else (2 if rule.states > 2 else 0)
+            else:
+                nxt[i][j] = (state + 1) % rule.states
+    engines.wrap_list(nxt, topology)
+    return nxt
+
+def census_reference(old, new):
+    """
+    Bilan d'une génération : population, naissances et morts (état 1).
+
+    Args:
+        old (list): Grille précédente
+        new (list): Grille actuelle
+
+    Returns:
+        tuple: (population, naissances, morts)
+    """
+    size = len(new) - 2
+    births = deaths = population = 0
+    for i in range(1, size + 1):
+        for j in range(1, size + 1):
+            was, now = old[i][j] == 1, new[i][j] == 1
+            population += now
+            births += now and not was
+            deaths += was and not now
+    return population, births, deaths
+
+def interior(grid):
+    """
+    Cellules intérieures d'une grille en listes (bordure exclue).
+
+    Args:
+        grid (list): Grille (size + 2) x (size + 2)
+
+    Returns:
+        list: Lignes 1 à size, colonnes 1 à size
+    """
+    return [row[1:-1] for row in grid[1:-1]]
+
+def advance(sim, generations):
+    """
+    Calcule des générations d'une simulation et attend leur publication
+    (barrier_action arrête la simulation à stop_at).
+
+    Args:
+        sim (gamelife_core.Simulation): Simulation démarrée par start_workers
+        generations (int): Nombre de générations à calculer
+    """
+    sim.stop_at = sim.gen_counter + generations
+    sim.running.set()
+    deadline = time.monotonic() + TIMEOUT
+    while sim.running.is_set():
+        assert time.monotonic() < deadline, "la simulation n'a pas atteint stop_at"
+        time.sleep(0.001)
@@ -0,0 +1,68 @@
+"""
+Calibration des moteurs : rien n'est mesuré sans demande explicite, la mesure
+en arrière-plan laisse de côté le moteur multiprocessus, et les modèles ne
+sont écrits que dans le fichier demandé.
+"""
+
+import json
+
+import pytest
+
+import gamelife_core as core
+
+@pytest.fixture
+def measured(monkeypatch):
+    """
+    Calibration sans mesure réelle : modèles vides et moteurs mesurés notés.
+
+    Returns:
+        list: Noms des moteurs mesurés, dans l'ordre
+    """
+    names = []
+
+    def fake_calibrate_engine(name):
+        names.append(name)
+        return (1.0, 0.0, 0.0)
+
+    monkeypatch.setattr(core, "_costs", {})
+    monkeypatch.setattr(core, "calibrate_engine", fake_calibrate_engine)
+    return names
+
+def test_choose_engine_measures_nothing(measured, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sim = core.Simulation()
+    assert sim.choose_engine(200) in core.engine_candidates()
+    assert core.engine_costs() == {name: core.declared_cost(name) for name in core.engine_candidates()}
+    assert measured == []
+    assert list(tmp_path.iterdir()) == []
+
+def test_background_calibration_skips_processes(measured, tmp_path):
+    path = tmp_path / "calibration.json"
+    thread = core.calibrate(str(path), background=True)
+    if thread is not None:
+        thread.join()
+    expected = [name for name in core.engine_candidates() if name not in core.BACKGROUND_SKIP]
+    assert measured == expected
+    assert sorted(json.loads(path.read_text())["engines"]) == sorted(expected)
+
+def test_explicit_calibration_is_stored_and_reloaded(measured, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "saved" / "calibration.json"
+    path.parent.mkdir()
+    assert core.calibrate(str(path)) is None
+    assert measured == core.engine_candidates()
+    # Seul le fichier demandé est écrit (rien dans le répertoire courant)
+    assert [entry.name for entry in tmp_path.iterdir()] == ["saved"]
+
+    # Nouvelle session : modèles relus sans mesure
+    monkeypatch.setattr(core, "_costs", {})
+    core.load_calibration(str(path))
+    assert core.calibrate(str(path)) is None
+    assert measured == core.engine_candidates()
+    assert core.engine_costs() == {name: (1.0, 0.0, 0.0) for name in core.engine_candidates()}
+
+def test_calibration_without_file(measured, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    core.calibrate()
+    assert measured == core.engine_candidates()
+    assert list(tmp_path.iterdir()) == []
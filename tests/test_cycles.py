@@ -0,0 +1,76 @@
+"""
+Détection des cycles : période et génération de début d'oscillateurs et de
+vaisseaux connus, pour chaque moteur (hachage incrémental des unités modifiées).
+"""
+
+import pytest
+
+import gamelife_core as core
+import gamelife_engines as engines
+from helpers import advance
+
+SIZE = 8  # Côté du tore : le planeur y revient à sa place en 4 * SIZE générations
+
+BLINKER = [(4, 3), (4, 4), (4, 5)]
+GLIDER = [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]
+BLOCK = [(3, 3), (3, 4), (4, 3), (4, 4)]
+
+def load(sim, cells):
+    """
+    Charge des cellules vivantes dans une grille vide (génération 0).
+
+    Args:
+        sim (gamelife_core.Simulation): Simulation démarrée
+        cells (list): Coordonnées (ligne, colonne) des cellules vivantes
+    """
+    grid = core.make_grid(SIZE)
+    for i, j in cells:
+        grid[i][j] = 1
+    sim.load_grid(grid)
+
+def topologies(name):
+    """
+    Topologies gérées par un moteur.
+
+    Args:
+        name (str): Nom du moteur
+
+    Returns:
+        tuple: Conditions aux bords
+    """
+    engine_class = engines.ENGINES.get(name)
+    return engine_class.topologies if engine_class is not None else engines.TOPOLOGIES
+
+@pytest.mark.parametrize("pattern, generations, expected", [
+    (BLOCK, 3, (1, 0)),
+    (BLINKER, 4, (2, 0)),
+    (GLIDER, 4 * SIZE + 2, (4 * SIZE, 0)),
+])
+@pytest.mark.parametrize("engine", core.engine_candidates())
+def test_cycle_on_torus(simulation, engine, pattern, generations, expected):
+    if "torus" not in topologies(engine):
+        pytest.skip(f"{engine} ne gère pas le tore")
+    sim = simulation(SIZE, engine, "torus")
+    load(sim, pattern)
+    advance(sim, generations)
+    assert sim.cycle == expected
+
+@pytest.mark.parametrize("engine", core.engine_candidates())
+def test_cycle_found_at_first_repeat(simulation, engine):
+    sim = simulation(SIZE, engine)
+    load(sim, BLINKER)
+    advance(sim, 2)
+    # Génération 2 : le premier état répété est celui de la génération 0
+    assert sim.cycle == (2, 0)
+    advance(sim, 3)
+    assert sim.cycle == (2, 0)
+
+@pytest.mark.parametrize("engine", core.engine_candidates())
+def test_cycle_forgotten_on_load(simulation, engine):
+    sim = simulation(SIZE, engine)
+    load(sim, BLINKER)
+    advance(sim, 3)
+    load(sim, BLOCK)
+    assert sim.cycle is None
+    advance(sim, 2)
+    assert sim.cycle == (1, 3)
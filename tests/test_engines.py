@@ -0,0 +1,91 @@
+"""
+Moteurs de calcul comparés à la référence cellule par cellule : grille et
+bilan (population, naissances, morts) de chaque génération, pour plusieurs
+familles de règles et toutes les topologies gérées.
+"""
+
+import pytest
+
+import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_rules as rules
+from helpers import advance, census_reference, interior, step_reference
+
+SIZE = 24  # Côté des grilles comparées
+GENERATIONS = 8  # Générations comparées par combinaison
+
+# Moteurs comparés : candidats du choix automatique et univers infini
+ENGINES = core.engine_candidates() + [name for name, engine_class in sorted(engines.ENGINES.items())
+                                      if engine_class.unbounded]
+
+# Conway, HighLife, naissance sans voisin (B0), Generations et Larger than Life
+RULES = ["B3/S23", "B36/S23", "B036/S23", "B2/S/C3", "R2,C0,M1,S5..10,B6..8,NM"]
+
+def supported(engine, rule, topology):
+    """
+    Indique si un moteur applique une règle sur une topologie.
+
+    Args:
+        engine (str): Nom du moteur
+        rule (gamelife_rules.Rule): Règle compilée
+        topology (str): Condition aux bords
+
+    Returns:
+        bool: True si la combinaison est gérée
+    """
+    engine_class = engines.ENGINES.get(engine)
+    topologies = engine_class.topologies if engine_class is not None else engines.TOPOLOGIES
+    return topology in topologies and core.engine_supports(rule, engine, topology)
+
+@pytest.mark.parametrize("topology", engines.TOPOLOGIES)
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_matches_reference(simulation, engine, rule, topology):
+    compiled = rules.compile_rule(rule)
+    if not supported(engine, compiled, topology):
+        pytest.skip(f"{rule} non gérée par {engine} ({topology})")
+    sim = simulation(SIZE, engine, topology, compiled)
+
+    # Soupe sur toute la grille (bords compris) ; univers infini : soupe centrale,
+    # assez loin des bords pour que la grille bornée de référence ne la limite pas
+    region = None
+    engine_class = engines.ENGINES.get(engine)
+    if engine_class is not None and engine_class.unbounded:
+        margin = GENERATIONS + 2
+        region = (margin, margin, SIZE + 1 - margin, SIZE + 1 - margin)
+    sim.randomize_grid(sim.T, 0.4, seed=7, region=region)
+    grid = sim.grid_to_list(sim.T)
+
+    stats = []
+    sim.stats_listeners.append(stats.append)
+    for generation in range(1, GENERATIONS + 1):
+        advance(sim, 1)
+        expected = step_reference(grid, compiled, topology)
+        assert interior(sim.grid_to_list(sim.T)) == interior(expected)
+        assert stats[-1] == core.GenerationStats(generation, *census_reference(grid, expected))
+        grid = expected
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B036/S23"])
+@pytest.mark.parametrize("engine", ["numpy", "bitpacked"])
+def test_kernel_tally_matches_diff_census(engine, rule):
+    if not engines.NUMPY_AVAILABLE:
+        pytest.skip("NumPy indisponible")
+    kernel = engines.get_engine(engine)
+    kernel.set_rule(rules.compile_rule(rule))
+    src, dst = kernel.make_grid(SIZE), kernel.make_grid(SIZE)
+    state = core.make_grid(SIZE)
+    for i, row in enumerate(engines.random_soup(SIZE, SIZE, 0.4, seed=3).tolist()):
+        state[i + 1][1:-1] = row
+    kernel.load(src, state)
+    kernel.set_region((1, 1, SIZE + 1, SIZE + 1))
+
+    # Bilan compté par les bandes pendant le calcul...
+    kernel.set_tally(True)
+    kernel.step_rows(src, dst, 1, SIZE // 2 + 1)
+    kernel.step_rows(src, dst, SIZE // 2 + 1, SIZE + 1)
+    tallied = kernel.census(src, dst, None)
+
+    # ... et bilan compté sur les mots modifiés (diff)
+    kernel.set_tally(False)
+    assert tallied == kernel.census(src, dst, kernel.diff(src, dst))
+    assert tallied == census_reference(kernel.to_list(src), kernel.to_list(dst))[1:]
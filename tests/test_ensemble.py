@@ -0,0 +1,104 @@
+"""
+Lots de grilles : chaque grille du lot évolue comme la référence cellule par
+cellule, et la fin d'une grille (extinction, stabilisation) est repérée sur
+son état, règles B0 et Generations comprises.
+"""
+
+import pytest
+
+import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_ensemble as ensemble
+import gamelife_rules as rules
+from helpers import interior, step_reference
+
+pytestmark = pytest.mark.skipif(not engines.NUMPY_AVAILABLE, reason="NumPy indisponible")
+
+SIZE = 12  # Côté des grilles du lot
+GENERATIONS = 12  # Générations comparées
+SEEDS = range(6)  # Soupes du lot
+
+# Conway, HighLife, naissance sans voisin (B0) et Generations
+RULES = ["B3/S23", "B36/S23", "B036/S23", "B2/S/C3"]
+CLASSES = [ensemble.Ensemble, ensemble.BitPackedEnsemble]
+
+def bordered(cells):
+    """
+    Grille en listes avec bordure morte.
+
+    Args:
+        cells: Cellules n x n (tableau ou listes)
+
+    Returns:
+        list: Grille (n + 2) x (n + 2)
+    """
+    grid = core.make_grid(SIZE)
+    for i, row in enumerate(cells):
+        grid[i + 1][1:-1] = [int(value) for value in row]
+    return grid
+
+def make_batch(batch_class, rule):
+    """
+    Crée un lot, ou saute le test si la classe ne gère pas la règle.
+
+    Args:
+        batch_class (type): Ensemble ou BitPackedEnsemble
+        rule (str): Règle en notation B/S
+
+    Returns:
+        gamelife_ensemble.Ensemble: Lot vide
+    """
+    compiled = rules.compile_rule(rule)
+    if not batch_class.supports(compiled):
+        pytest.skip(f"{rule} non gérée par {batch_class.__name__}")
+    return batch_class(SIZE, compiled)
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("batch_class", CLASSES)
+def test_batch_matches_reference(batch_class, rule):
+    batch = make_batch(batch_class, rule)
+    ids = batch.add_soups(SEEDS, density=0.4)
+    expected = {int(ident): bordered(batch.grid(k)) for k, ident in enumerate(ids)}
+
+    for generation in range(1, GENERATIONS + 1):
+        expected = {ident: step_reference(grid, batch.rule) for ident, grid in expected.items()}
+        # Grilles terminées : état final ; les autres restent dans le lot
+        for outcome in batch.step(1):
+            assert outcome.generation == generation
+            assert bordered(outcome.cells) == expected.pop(outcome.ident)
+        for k, ident in enumerate(batch.ids):
+            assert interior(bordered(batch.grid(k))) == interior(expected[int(ident)])
+            assert batch.population[k] == sum(row.count(1) for row in expected[int(ident)])
+
+@pytest.mark.parametrize("batch_class", CLASSES)
+def test_b0_empty_grid_is_not_still(batch_class):
+    # B0 sans survie : pleine puis vide en alternance, la grille vide de la
+    # génération 1 n'est pas une nature morte
+    batch = make_batch(batch_class, "B0/S")
+    batch.add([[1] * SIZE] * SIZE)
+    outcome, = batch.run(generations=8)
+    assert (outcome.generation, outcome.period) == (2, 2)
+    assert outcome.population == SIZE * SIZE
+
+def test_generations_dying_cells_are_not_extinct():
+    # Cellule isolée : mourante (état 2) à la génération 1, vide à la génération 2
+    batch = make_batch(ensemble.Ensemble, "B2/S/C3")
+    grid = [[0] * SIZE for _ in range(SIZE)]
+    grid[5][5] = 1
+    batch.add(grid)
+    outcome, = batch.run(generations=8)
+    assert (outcome.generation, outcome.period) == (2, 1)
+    assert not outcome.cells.any()
+
+@pytest.mark.parametrize("batch_class", CLASSES)
+def test_still_life_and_oscillator_periods(batch_class):
+    batch = make_batch(batch_class, "B3/S23")
+    block, blinker = [[0] * SIZE for _ in range(SIZE)], [[0] * SIZE for _ in range(SIZE)]
+    for i, j in ((3, 3), (3, 4), (4, 3), (4, 4)):
+        block[i][j] = 1
+    for j in (4, 5, 6):
+        blinker[5][j] = 1
+    batch.add([block, blinker])
+    outcomes = {outcome.ident: outcome for outcome in batch.run(generations=8)}
+    assert (outcomes[0].generation, outcomes[0].period) == (1, 1)
+    assert (outcomes[1].generation, outcomes[1].period) == (2, 2)
@@ -0,0 +1,64 @@
+"""
+Moteur multiprocessus : processus démarrés par "spawn", calcul identique à la
+référence, arrêt borné même si un processus a disparu.
+"""
+
+import time
+
+import pytest
+
+import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_parallel as parallel
+import gamelife_rules as rules
+from helpers import interior, step_reference
+
+pytestmark = pytest.mark.skipif(not engines.NUMPY_AVAILABLE, reason="NumPy indisponible")
+
+SIZE = 16  # Côté des grilles
+
+def started_engine(rule=rules.CONWAY):
+    """
+    Moteur à deux processus, démarrés par une première génération d'une soupe.
+
+    Args:
+        rule (gamelife_rules.Rule): Règle compilée
+
+    Returns:
+        tuple: (moteur, état initial en listes, grille calculée)
+    """
+    engine = parallel.ProcessEngine(processes=2)
+    engine.set_rule(rule)
+    src, dst = engine.make_grid(SIZE), engine.make_grid(SIZE)
+    state = core.make_grid(SIZE)
+    for i, row in enumerate(engines.random_soup(SIZE, SIZE, 0.4, seed=5).tolist()):
+        state[i + 1][1:-1] = row
+    engine.load(src, state)
+    engine.step(src, dst)
+    return engine, state, dst
+
+def test_processes_are_spawned():
+    engine, state, dst = started_engine(rules.compile_rule("B36/S23"))
+    try:
+        assert all(process.is_alive() for process in engine._workers)
+        assert {type(process).__name__ for process in engine._workers} == {"SpawnProcess"}
+        expected = step_reference(state, engine.rule)
+        assert interior(engine.to_list(dst)) == interior(expected)
+    finally:
+        engine.close()
+    assert engine._workers == [] and engine._buffers == []
+
+def test_close_after_worker_died():
+    engine, _, _ = started_engine()
+    workers = list(engine._workers)
+    # Processus tué pendant son attente au début de la génération suivante
+    time.sleep(0.2)
+    workers[0].kill()
+    workers[0].join()
+
+    # La barrière ne peut plus servir : close termine directement les autres processus
+    start = time.monotonic()
+    engine.close()
+    assert time.monotonic() - start < 10
+    assert not any(process.is_alive() for process in workers)
+    assert engine._workers == [] and engine._buffers == []
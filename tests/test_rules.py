@@ -0,0 +1,81 @@
+"""
+Tables des règles : les moteurs vectorisés, qui lisent la forme réduite de la
+table (Rule.outcomes), calculent comme une lecture directe de la table sur le
+masque 3x3 de chaque cellule ; une table qui n'est pas totalistique extérieure
+est refusée au lieu d'être réduite à tort.
+"""
+
+import pytest
+
+import gamelife_core as core
+import gamelife_engines as engines
+import gamelife_rules as rules
+from helpers import interior
+
+SIZE = 20  # Côté des grilles comparées
+GENERATIONS = 6  # Générations comparées
+
+# Règles B/S nommées, plus naissance sans voisin (B0) et naissance partout
+RULES = [text for text in rules.RULES.values() if text.startswith("B") and "/C" not in text]
+RULES += ["B036/S23", "B012345678/S"]
+
+def step_table(grid, rule):
+    """
+    Génération suivante lue dans la table de la règle : masque de 9 bits
+    (bit 3 * colonne + ligne) du voisinage de chaque cellule, morte hors de la grille.
+
+    Args:
+        grid (list): Grille (size + 2) x (size + 2), bordure morte
+        rule (gamelife_rules.Rule): Règle compilée
+
+    Returns:
+        list: Nouvelle grille (size + 2) x (size + 2)
+    """
+    size = len(grid) - 2
+    nxt = core.make_grid(size)
+    for i in range(1, size + 1):
+        for j in range(1, size + 1):
+            mask = 0
+            for column in range(3):
+                for row in range(3):
+                    mask |= grid[i + row - 1][j + column - 1] << (3 * column + row)
+            nxt[i][j] = rule.table[mask]
+    return nxt
+
+@pytest.mark.parametrize("rule", RULES)
+def test_tables_are_outer_totalistic(rule):
+    compiled = rules.compile_rule(rule)
+    for mask in range(512):
+        alive = (mask >> rules.CENTER_BIT) & 1
+        neighbors = bin(mask).count("1") - alive
+        assert compiled.table[mask] == compiled.outcomes[alive * 9 + neighbors]
+
+@pytest.mark.skipif(not engines.NUMPY_AVAILABLE, reason="NumPy indisponible")
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("name", ["numpy", "bitpacked"])
+def test_vectorised_engine_matches_table(name, rule):
+    compiled = rules.compile_rule(rule)
+    engine = engines.get_engine(name)
+    engine.set_rule(compiled)
+    src, dst = engine.make_grid(SIZE), engine.make_grid(SIZE)
+    expected = core.make_grid(SIZE)
+    for i, row in enumerate(engines.random_soup(SIZE, SIZE, 0.4, seed=11).tolist()):
+        expected[i + 1][1:-1] = row
+    engine.load(src, expected)
+
+    for _ in range(GENERATIONS):
+        expected = step_table(expected, compiled)
+        engine.step(src, dst)
+        src, dst = dst, src
+        assert interior(engine.to_list(src)) == interior(expected)
+
+def test_non_totalistic_table_is_refused():
+    # Naissance seulement pour trois voisins alignés sur la colonne de gauche
+    rule = rules.compile_rule("B3/S23")
+    table = bytearray(rule.table)
+    table[0b000000111] = 0
+    rule.table = bytes(table)
+    with pytest.raises(ValueError):
+        engines.rule_terms(rule)
+    with pytest.raises(ValueError):
+        engines.NumpyEngine().set_rule(rule)
@@ -0,0 +1,31 @@
+"""
+Commande run (mode sans interface) : nombre exact de générations, durée
+mesurée à l'arrêt de la simulation, retour immédiat pour zéro génération.
+"""
+
+import pytest
+
+import gamelife
+import gamelife_core as core
+
+SIZE = 16  # Côté des grilles
+
+@pytest.mark.parametrize("engine", ["threads", "hashlife"])
+def test_run_zero_generations(engine):
+    stats = gamelife.run(SIZE, 0, engine=engine, seed=3, report=0)
+    assert stats["generations"] == 0
+    assert stats["seconds"] == 0.0
+    assert stats["population"] == stats["initial_population"]
+
+def test_run_counts_generations_and_time():
+    stats = gamelife.run(SIZE, 10, engine="threads", seed=3, report=0, cycles=False)
+    assert stats["generations"] == 10
+    # Durée datée par barrier_action : pas arrondie au pas d'une boucle d'attente
+    # (l'ancienne scrutation toutes les 50 ms donnait au moins 0.05 s)
+    assert 0 < stats["seconds"] < 0.05
+    assert core.halted.is_set()
+
+def test_run_stops_on_cycle():
+    stats = gamelife.run(SIZE, 1000, engine="threads", seed=3, report=0, stop_on_cycle=True)
+    assert stats["cycle_period"] is not None
+    assert stats["generations"] < 1000
@@ -0,0 +1,155 @@
+"""
+Recherche de soupes : apgcodes d'objets connus, séparation des cendres en
+objets, fusion des recensements et reprise d'une recherche sauvegardée.
+"""
+
+import pytest
+
+import gamelife_engines as engines
+import gamelife_rules as rules
+import gamelife_search as search
+
+pytestmark = pytest.mark.skipif(not engines.NUMPY_AVAILABLE, reason="NumPy indisponible")
+
+np = engines.np
+
+BLOCK = ["XX", "XX"]
+BLINKER = ["XXX"]
+EATER = ["XX..", "X.X.", "..X.", "..XX"]  # Aucune symétrie : 8 orientations distinctes
+PULSAR = [
+    "..XXX...XXX..",
+    ".............",
+    "X....X.X....X",
+    "X....X.X....X",
+    "X....X.X....X",
+    "..XXX...XXX..",
+    ".............",
+    "..XXX...XXX..",
+    "X....X.X....X",
+    "X....X.X....X",
+    "X....X.X....X",
+    ".............",
+    "..XXX...XXX..",
+]
+
+# Recherche courte comparée avec et sans interruption
+SEARCH = dict(soups=8, batch=4, workers=1, max_generations=1000, report=0)
+
+def cells(rows):
+    """
+    Cellules 0/1 d'un motif dessiné ("X" : vivante).
+
+    Args:
+        rows (list): Lignes du motif
+
+    Returns:
+        numpy.ndarray: Cellules uint8
+    """
+    return np.array([[char == "X" for char in row] for row in rows], dtype=np.uint8)
+
+def place(grid, rows, top, left):
+    """
+    Dessine un motif dans une grille.
+
+    Args:
+        grid (numpy.ndarray): Grille modifiée sur place
+        rows (list): Lignes du motif
+        top (int): Ligne du coin haut gauche
+        left (int): Colonne du coin haut gauche
+    """
+    pattern = cells(rows)
+    grid[top:top + pattern.shape[0], left:left + pattern.shape[1]] = pattern
+
+def orientations(pattern):
+    """
+    Les 8 orientations d'un motif (rotations et réflexions).
+
+    Args:
+        pattern (numpy.ndarray): Cellules du motif
+
+    Returns:
+        list: Cellules de chaque orientation
+    """
+    rotations = [np.rot90(pattern, k) for k in range(4)]
+    return rotations + [rotation.T for rotation in rotations]
+
+def test_wechsler():
+    assert search.wechsler(cells(BLOCK)) == "33"
+    assert search.wechsler(cells(["X..X"])) == "1w1"
+    # Bandes de 5 lignes séparées par "z"
+    assert search.wechsler(cells(["X"] * 6)) == "vz1"
+
+@pytest.mark.parametrize("phases, code", [
+    ([BLOCK], "xs4_33"),
+    ([BLINKER, ["X", "X", "X"]], "xp2_7"),
+    ([["XX.", "X.X", ".X."]], "xs5_253"),
+    ([[".X..", "X.X.", "X..X", ".XX."]], "xs7_2596"),
+])
+def test_canonical_known_objects(phases, code):
+    assert search.canonical([cells(phase) for phase in phases]) == code
+
+def test_canonical_ignores_orientation():
+    codes = {search.canonical([oriented]) for oriented in orientations(cells(EATER))}
+    assert codes == {"xs7_178c"}
+
+def test_separate():
+    grid = np.zeros((12, 12), dtype=np.uint8)
+    place(grid, BLOCK, 1, 1)
+    place(grid, BLINKER, 8, 5)
+    # Cellules reliées par un coin : un seul objet
+    place(grid, ["X.", ".X"], 1, 8)
+    objects = search.separate(grid)
+    assert sorted(int(mask.sum()) for mask in objects) == [2, 3, 4]
+    assert (np.logical_or.reduce(objects) == grid.astype(bool)).all()
+
+def test_ash_objects():
+    grid = np.zeros((30, 30), dtype=np.uint8)
+    place(grid, BLOCK, 8, 8)
+    place(grid, BLINKER, 20, 12)
+    # Bloc au contact de la bande de bordure : débris d'un objet échappé
+    place(grid, BLOCK, 1, 20)
+    codes = search.ash_objects(grid, 2, rules.CONWAY)
+    assert sorted(codes, key=str) == [None, "xp2_7", "xs4_33"]
+
+def test_ash_objects_joins_pieces():
+    # Les quatre quarts du pulsar n'évoluent pas seuls : un seul objet
+    grid = np.zeros((30, 30), dtype=np.uint8)
+    place(grid, PULSAR, 8, 8)
+    assert search.ash_objects(grid, 3, rules.CONWAY) == [
+        "xp3_co9nas0san9oczgoldlo0oldlogz1047210127401"]
+
+def test_merge_census():
+    total = search.new_census()
+    first = {"soups": 4, "objects": {"xs4_33": 3, "xp2_7": 1}, "samples": {"xs4_33": 2, "xp2_7": 3},
+             "escapes": 1, "pathological": [1]}
+    second = {"soups": 4, "objects": {"xs4_33": 2, "xs6_696": 1}, "samples": {"xs4_33": 0, "xs6_696": 5},
+              "escapes": 2, "pathological": [6]}
+    search.merge_census(total, first)
+    search.merge_census(total, second)
+    assert total == {"soups": 8, "objects": {"xs4_33": 5, "xp2_7": 1, "xs6_696": 1},
+                     "samples": {"xs4_33": 0, "xp2_7": 3, "xs6_696": 5},
+                     "escapes": 3, "pathological": [1, 6]}
+
+def test_resumed_search_matches_uninterrupted(tmp_path):
+    whole = search.search(**SEARCH)
+    assert whole["census"]["soups"] == SEARCH["soups"] and whole["census"]["objects"]
+
+    # Recherche interrompue après la première tâche : sauvegarde de cette seule tâche
+    path = str(tmp_path / "census.json")
+    first = search.search(**dict(SEARCH, soups=SEARCH["batch"]))
+    first["params"] = whole["params"]
+    search.save_checkpoint(path, first)
+
+    resumed = search.search(checkpoint=path, **SEARCH)
+    assert resumed["done"] == whole["done"]
+    for census in (whole["census"], resumed["census"]):
+        census["pathological"].sort()
+    assert resumed["census"] == whole["census"]
+    assert search.load_checkpoint(path, whole["params"]) == resumed
+
+def test_checkpoint_of_another_search(tmp_path):
+    path = str(tmp_path / "census.json")
+    progress = {"params": {"rule": "B3/S23"}, "done": [], "census": search.new_census(), "seconds": 0.0}
+    search.save_checkpoint(path, progress)
+    with pytest.raises(ValueError):
+        search.load_checkpoint(path, {"rule": "B36/S23"})
@@ -0,0 +1,157 @@
+"""
+Simulations indépendantes : deux simulations (ou générateurs iterate) qui
+tournent en même temps avec des règles différentes ne partagent ni règle ni
+caches de moteur, y compris HashLife ; saut de HashLife sur une grille bornée.
+"""
+
+import time
+
+import pytest
+
+import gamelife_core as core
+import gamelife_rules as rules
+from helpers import TIMEOUT, advance, interior, step_reference
+
+SIZE = 32  # Côté des grilles
+SOUP = (12, 12, 21, 21)  # Soupe centrale : les bords restent loin pendant les tests
+GENERATIONS = 8
+GLIDER = [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]  # Planeur allant vers le bas et la droite
+BLINKER = [(16, 15), (16, 16), (16, 17)]
+
+def initial_state(sim):
+    """
+    Tire la même soupe centrale dans une simulation.
+
+    Args:
+        sim (gamelife_core.Simulation): Simulation démarrée
+
+    Returns:
+        list: État initial en listes (bordure comprise)
+    """
+    sim.randomize_grid(sim.T, 0.5, seed=11, region=SOUP)
+    return sim.grid_to_list(sim.T)
+
+def reference(grid, rule, generations):
+    """
+    État de référence après plusieurs générations.
+
+    Args:
+        grid (list): État initial
+        rule (gamelife_rules.Rule): Règle compilée
+        generations (int): Nombre de générations
+
+    Returns:
+        list: État final
+    """
+    for _ in range(generations):
+        grid = step_reference(grid, rule)
+    return grid
+
+@pytest.mark.parametrize("engine", ["threads", "numpy", "bitpacked", "active", "hashlife"])
+def test_simulations_with_different_rules(simulation, engine):
+    conway, highlife = rules.CONWAY, rules.compile_rule("B36/S23")
+    first = simulation(SIZE, engine, rule=conway)
+    second = simulation(SIZE, engine, rule=highlife)
+    start = initial_state(first)
+    assert initial_state(second) == start
+
+    # Les deux simulations calculent en même temps
+    for sim in (first, second):
+        sim.stop_at = GENERATIONS
+        sim.running.set()
+    deadline = time.monotonic() + TIMEOUT
+    while first.running.is_set() or second.running.is_set():
+        assert time.monotonic() < deadline, "les simulations n'ont pas atteint stop_at"
+        time.sleep(0.001)
+
+    expected_conway = reference(start, conway, GENERATIONS)
+    expected_highlife = reference(start, highlife, GENERATIONS)
+    assert expected_conway != expected_highlife
+    assert interior(first.grid_to_list(first.T)) == interior(expected_conway)
+    assert interior(second.grid_to_list(second.T)) == interior(expected_highlife)
+    assert first.rule is conway and second.rule is highlife
+
+@pytest.mark.parametrize("engine", ["threads", "numpy", "hashlife"])
+def test_iterators_with_different_rules(simulation, engine):
+    start = initial_state(simulation(SIZE))
+    conway, highlife = rules.CONWAY, rules.compile_rule("B36/S23")
+    expected = {rule.name: start for rule in (conway, highlife)}
+
+    # Générateurs entrelacés : chacun garde sa règle et son moteur
+    pairs = zip(core.iterate(start, rule=conway, engine=engine, generations=GENERATIONS),
+                core.iterate(start, rule=highlife, engine=engine, generations=GENERATIONS))
+    for (gen, cells), (other_gen, other_cells) in pairs:
+        assert gen == other_gen
+        if gen:
+            for rule in (conway, highlife):
+                expected[rule.name] = step_reference(expected[rule.name], rule)
+        assert [list(row) for row in cells] == interior(expected[conway.name])
+        assert [list(row) for row in other_cells] == interior(expected[highlife.name])
+
+def load(sim, cells, offset=0):
+    """
+    Charge des cellules vivantes dans une grille vide (génération 0).
+
+    Args:
+        sim (gamelife_core.Simulation): Simulation démarrée
+        cells (list): Coordonnées (ligne, colonne) des cellules vivantes
+        offset (int): Décalage ajouté aux deux coordonnées
+
+    Returns:
+        list: État chargé en listes (bordure comprise)
+    """
+    grid = core.make_grid(SIZE)
+    for i, j in cells:
+        grid[i + offset][j + offset] = 1
+    sim.load_grid(grid)
+    return grid
+
+def test_hashlife_jump(simulation):
+    sim = simulation(SIZE, "hashlife")
+    sim.set_jump(3)
+    start = initial_state(sim)
+
+    # Soupe loin des bords : une seule étape de 2^3 générations
+    advance(sim, 8)
+    assert sim.gen_counter == 8
+    assert sim._engine.generations_per_step == 8
+    assert interior(sim.grid_to_list(sim.T)) == interior(reference(start, rules.CONWAY, 8))
+
+def test_hashlife_jump_keeps_bounded_grid(simulation):
+    sim = simulation(SIZE, "hashlife")
+    sim.set_jump(3)
+    # Planeur qui atteint le coin bas droit et s'y écrase contre la bordure morte
+    start = load(sim, GLIDER, SIZE - 12)
+
+    generations = 64
+    advance(sim, generations)
+    assert sim.gen_counter == generations
+    expected = reference(start, rules.CONWAY, generations)
+    assert any(map(any, interior(expected)))
+    assert interior(sim.grid_to_list(sim.T)) == interior(expected)
+
+def test_hashlife_jump_stops_at_generation(simulation):
+    sim = simulation(SIZE, "hashlife")
+    sim.set_jump(3)
+    start = initial_state(sim)
+    advance(sim, 5)
+    assert sim.gen_counter == 5
+    assert interior(sim.grid_to_list(sim.T)) == interior(reference(start, rules.CONWAY, 5))
+
+def test_hashlife_jump_suspends_cycle_detection(simulation):
+    sim = simulation(SIZE, "hashlife")
+    sim.set_jump(3)
+    load(sim, BLINKER)
+    # Une génération sur 8 : la période 2 ne peut pas être mesurée
+    advance(sim, 16)
+    assert sim.cycle is None
+
+    # Sans saut, la détection reprend à partir de l'état atteint
+    sim.set_jump(0)
+    advance(sim, 2)
+    assert sim.cycle == (2, 16)
+
+@pytest.mark.parametrize("jump", [-1, core.MAX_JUMP + 1])
+def test_set_jump_rejects_out_of_range(jump):
+    with pytest.raises(ValueError):
+        core.Simulation().set_jump(jump)
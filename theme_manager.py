@@ -10,6 +10,7 @@ import os
 CONFIG_FILE = "gamelife_config.json"
 CUSTOM_THEMES_FILE = "custom_themes.json"
 FAVORITE_COLORS_FILE = "favorite_colors.json"
+CALIBRATION_FILE = "gamelife_calibration.json"  # Modèles de coût des moteurs mesurés sur cette machine (voir core.calibrate)
 
 # Définition des thèmes par défaut
 DEFAULT_THEMES = {
@@ -63,6 +64,46 @@ DEFAULT_THEMES = {
 THEMES = DEFAULT_THEMES.copy()  # Collection de tous les thèmes (défaut + personnalisés)
 current_theme = THEMES["dark"]  # Thème actuellement actif
 current_theme_name = "dark"  # Nom du thème actuel
+rule_error = None  # Règle sauvegardée refusée par load_config (message affiché par l'interface)
+
+def state_colors(states, theme=None):
+    """
+    Palette des états d'une cellule (règles Generations à plusieurs états).
+    L'indice est l'état : 0 = morte, 1 = vivante, puis les états mourants,
+    dégradés de la couleur "dying" du thème (par défaut : à mi-chemin entre
+    vivante et morte) jusqu'à la couleur des cellules mortes.
+
+    Args:
+        states (int): Nombre d'états de la règle (2 pour Conway)
+        theme (dict, optional): Thème utilisé (par défaut : thème actif)
+
+    Returns:
+        list: Couleurs au format hex, une par état
+    """
+    theme = theme or current_theme
+    colors = [theme["dead"], theme["alive"]]
+    dying = theme.get("dying") or _mix_colors(theme["alive"], theme["dead"], 0.5)
+
+    # États 2 à states - 1 : du mourant vers la couleur des cellules mortes
+    for k in range(states - 2):
+        colors.append(_mix_colors(dying, theme["dead"], k / (states - 2)))
+    return colors
+
+def _mix_colors(first, second, ratio):
+    """
+    Mélange deux couleurs hex (#rrggbb).
+
+    Args:
+        first (str): Couleur obtenue pour ratio = 0
+        second (str): Couleur obtenue pour ratio = 1
+        ratio (float): Proportion de la seconde couleur
+
+    Returns:
+        str: Couleur mélangée au format hex
+    """
+    a = [int(first[k:k + 2], 16) for k in (1, 3, 5)]
+    b = [int(second[k:k + 2], 16) for k in (1, 3, 5)]
+    return "#" + "".join(f"{round(x + (y - x) * ratio):02x}" for x, y in zip(a, b))
 
 def load_favorite_colors():
     """
@@ -182,21 +223,27 @@ def delete_custom_theme(theme_name):
 def load_config():
     """
     Charge la configuration globale de l'application.
-    Restaure le thème, la vitesse du jeu et l'état de pause.
+    Restaure le thème, la vitesse du jeu, l'état de pause, la taille de la grille,
+    le moteur de calcul, la topologie, le saut du moteur hashlife et la règle.
+    En mode auto, la règle guide le choix du moteur (core.choose_engine) ; sinon
+    elle est vérifiée pour le moteur et la topologie restaurés. Une règle refusée
+    laisse la règle actuelle en place et son message dans rule_error.
     
     Returns:
         bool: True si le jeu était en cours, False sinon
     """
-    global current_theme, current_theme_name
+    global current_theme, current_theme_name, rule_error
 
     # Charge les thèmes personnalisés d'abord
     load_custom_themes()
 
     # Import local pour éviter les imports circulaires
     import gamelife_core as core
+    import gamelife_rules as rules
 
     # Par défaut, on considère que le jeu est en pause
     was_running = False
+    rule_error = None
 
     # Vérifie que le fichier de configuration existe
     if os.path.exists(CONFIG_FILE):
@@ -213,10 +260,38 @@ def load_config():
                 current_theme = THEMES.get(theme_name, THEMES["dark"])
 
                 # Restaure la vitesse du jeu sauvegardée
-                core._speed = cfg.get("speed", core._speed)
+                core.set_speed(cfg.get("speed", core._speed))
+                # Pause automatique quand un cycle est détecté
+                core.stop_on_cycle = cfg.get("stop_on_cycle", core.stop_on_cycle)
+
+                # Restaure la taille de la grille et le moteur de calcul
+                core.n = cfg.get("grid_size", core.n)
+                # "auto" : le moteur est choisi à chaque création de grille (core.choose_engine)
+                engine = cfg.get("engine", core.engine_name)
+                core.auto_engine = engine == core.AUTO
+                if not core.auto_engine:
+                    core.engine_name = engine
+                # Restaure la topologie (bordure morte, tore, Klein, plan projectif)
+                core.topology_name = cfg.get("topology", core.topology_name)
+                # Saut du moteur hashlife (ignoré s'il est hors limites)
+                try:
+                    core.set_jump(cfg.get("jump", core.jump))
+                except ValueError:
+                    pass
 
                 # Récupère l'état du jeu (en cours ou en pause)
                 was_running = cfg.get("was_running", False)
+
+                # Restaure la règle d'évolution (notation B/S), une fois le moteur
+                # et la topologie connus ; en mode auto, le moteur sera choisi pour elle
+                try:
+                    rule = rules.compile_rule(cfg.get("rule", core.rule.name))
+                    if core.auto_engine:
+                        core.rule = rule
+                    else:
+                        core.set_rule(rule)
+                except ValueError as error:
+                    rule_error = str(error)
         except Exception:
             # Ignore les erreurs de lecture et utilise les valeurs par défaut
             pass
@@ -227,7 +302,9 @@ def load_config():
 def save_config():
     """
     Sauvegarde la configuration actuelle.
-    Enregistre le thème actif, la vitesse du jeu et l'état de pause.
+    Enregistre le thème actif, la vitesse du jeu, l'état de pause, la taille de
+    la grille, le moteur de calcul, la topologie, le saut du moteur hashlife, la
+    règle et la pause sur cycle.
     """
     # Import local pour éviter les imports circulaires
     import gamelife_core as core
@@ -236,7 +313,13 @@ def save_config():
     cfg = {
         "theme": current_theme_name,  # Nom du thème actuel
         "speed": core._speed,  # Vitesse actuelle du jeu
-        "was_running": core.running.is_set()  # État du jeu (True = en cours, False = en pause)
+        "was_running": core.running.is_set(),  # État du jeu (True = en cours, False = en pause)
+        "grid_size": core.n,  # Taille de la grille (n x n cellules)
+        "engine": core.AUTO if core.auto_engine else core.engine_name,  # Moteur de calcul (ou choix automatique)
+        "topology": core.topology_name,  # Condition aux bords de la grille
+        "jump": core.jump,  # Saut du moteur hashlife (au plus 2^k générations par étape)
+        "rule": core.rule.name,  # Règle d'évolution (notation B/S)
+        "stop_on_cycle": core.stop_on_cycle  # Pause automatique sur un cycle détecté
     }
 
     try: